@@ -1,25 +1,24 @@
-from fastapi import FastAPI
+import os
+import json
+
+from fastapi import FastAPI, Header
+from fastapi.responses import Response, StreamingResponse
 from mangum import Mangum
 from dotenv import load_dotenv
 
-from sklearn.preprocessing import MinMaxScaler
-
 from schemas.fetch_data import FetchDataRequest
-from schemas.train import TrainModelRequest
+from schemas.train import TrainModelRequest, BatchTrainModelRequest, UpdateModelRequest, TuneModelRequest, BacktestModelRequest
+from schemas.predict import PredictRequest, StreamPredictRequest, BatchPredictRequest
 
-from services.predict.predict_service import PredictService
-from services.predict.prepare_data_service import PredictPrepareDataService
-from services.yfinance_service import YFinanceService
-from services.preprocess_data_service import PreprocessDataService
+# Heavy services (torch, pandas, yfinance, boto3) are imported inside the routes that use
+# them, so cold starts only pay for the dependencies of the endpoint being called.
+from services.jobs.job_manager import get_job_manager, QueueFullError
+from services.jobs.train_worker import run_train_job, run_batch_train_job, run_update_job, run_tune_job, run_backtest_job
 
-from services.train.prepare_data_service import TrainPrepareDataService
-from services.train.train_service import TrainService
-from services.train.evaluate_service import TrainEvaluateService
+from services.cache.model_cache import model_cache
+from services.cache.lstm_state_store import lstm_state_store
 
-from services.s3.upload_service import S3UploadService
-from services.s3.download_service import S3DownloadService
-
-from error_handlers import http_exception_handler, validation_exception_handler, generic_exception_handler, value_error_handler, file_not_found_error_handler
+from error_handlers import http_exception_handler, validation_exception_handler, generic_exception_handler, value_error_handler, file_not_found_error_handler, queue_full_error_handler
 from fastapi.exceptions import RequestValidationError
 from fastapi import HTTPException
 
@@ -33,104 +32,354 @@ app.add_exception_handler(HTTPException, http_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(ValueError, value_error_handler)
 app.add_exception_handler(FileNotFoundError, file_not_found_error_handler)
+app.add_exception_handler(QueueFullError, queue_full_error_handler)
 app.add_exception_handler(Exception, generic_exception_handler)
 
+def load_model(model_id: str):
+    from services.s3.download_service import S3DownloadService
+
+    compiled = os.getenv('PREDICT_BACKEND', 'torchscript') == 'torchscript'
+
+    return model_cache.get_or_load(
+        (model_id, compiled),
+        lambda: S3DownloadService(id=model_id, compiled=compiled).execute()
+    )
+
 @app.get("/up")
 def up():
     return {
         "status": "ok"
     }
 
-@app.post("/models/train")
+@app.post("/models/train", status_code=202)
 def train_model(request: TrainModelRequest):
-    yfinance_data = YFinanceService(
-        ticker=request.ticker,
-        start_date=request.start_date,
-        end_date=request.end_date
-    ).execute()
+    from services.train.validate_request_service import TrainValidateRequestService
 
-    preprocessed_data = PreprocessDataService(data=yfinance_data).execute()
+    # Fail fast on invalid requests before taking a slot in the job queue
+    TrainValidateRequestService(request=request).execute()
 
-    X_train, y_train, X_test, y_test, scaler = TrainPrepareDataService(
-        data=preprocessed_data,
-        train_size=request.train_size,
-        sequence_length=request.sequence_length,
-        scaler=MinMaxScaler,
-        target_column=request.target_column
-    ).execute()
+    job = get_job_manager().submit(run_train_job, request.model_dump(), kind="train")
 
-    model = TrainService(
-        X_train=X_train,
-        y_train=y_train,
-        X_test=X_test,
-        y_test=y_test,
-        epochs=request.epochs,
-        patience=request.patience
-    ).execute()
+    return {
+        "message": "Treinamento enfileirado com sucesso",
+        "result": {
+            "job_id": job["id"],
+            "state": job["state"],
+            "status_path": f"/jobs/{job['id']}"
+        }
+    }
 
-    train_metrics, test_metrics = TrainEvaluateService(
-        model=model,
-        X_train=X_train,
-        y_train=y_train,
-        X_test=X_test,
-        y_test=y_test
-    ).execute()
+@app.post("/models/train/batch", status_code=202)
+def train_models_batch(request: BatchTrainModelRequest):
+    if not request.requests:
+        raise ValueError("At least one training request must be provided.")
 
-    metadata = {
-        "request": request.model_dump(),
-        "train_metrics": train_metrics,
-        "test_metrics": test_metrics,
-        "scaler": "MinMaxScaler"
+    job = get_job_manager().submit(run_batch_train_job, request.model_dump(), kind="train_batch")
+
+    return {
+        "message": "Treinamento em lote enfileirado com sucesso",
+        "result": {
+            "job_id": job["id"],
+            "state": job["state"],
+            "models": len(request.requests),
+            "status_path": f"/jobs/{job['id']}"
+        }
     }
 
-    id, model_s3_path, scaler_s3_path, metadata_s3_path = S3UploadService(
-        model=model,
-        scaler=scaler,
-        metadata=metadata
-    ).execute()
+@app.post("/models/tune", status_code=202)
+def tune_model(request: TuneModelRequest):
+    job = get_job_manager().submit(run_tune_job, request.model_dump(), kind="tune")
 
     return {
-        "message": "Modelo treinado com sucesso",
+        "message": "Busca de hiperparâmetros enfileirada com sucesso",
         "result": {
-            "id": id,
-            "metrics": {
-                "train": train_metrics,
-                "test": test_metrics
-            },
-            "paths": {
-                "model_s3_path": model_s3_path,
-                "scaler_s3_path": scaler_s3_path,
-                "metadata_s3_path": metadata_s3_path
-            }
+            "job_id": job["id"],
+            "state": job["state"],
+            "trials": request.trials,
+            "status_path": f"/jobs/{job['id']}"
         }
     }
 
+@app.post("/models/{model_id}/update", status_code=202)
+def update_model(model_id: str, request: UpdateModelRequest = None):
+    from services.s3.metadata_service import S3MetadataService
+
+    request = request or UpdateModelRequest()
+
+    if request.learning_rate is not None and request.learning_rate <= 0:
+        raise ValueError("Learning rate must be greater than 0.")
+
+    # Fail fast on unknown models before taking a slot in the job queue
+    S3MetadataService(id=model_id).execute()
+    payload = {"model_id": model_id, "request": request.model_dump(exclude_none=True)}
+
+    job = get_job_manager().submit(run_update_job, payload, kind="update")
+
+    return {
+        "message": "Atualização do modelo enfileirada com sucesso",
+        "result": {
+            "job_id": job["id"],
+            "state": job["state"],
+            "parent_id": model_id,
+            "status_path": f"/jobs/{job['id']}"
+        }
+    }
+
+@app.post("/models/{model_id}/backtest", status_code=202)
+def backtest_model(model_id: str, request: BacktestModelRequest = None):
+    from services.s3.metadata_service import S3MetadataService
+
+    request = request or BacktestModelRequest()
+
+    # Fail fast on unknown models before taking a slot in the job queue
+    S3MetadataService(id=model_id).execute()
+    payload = {"model_id": model_id, "request": request.model_dump()}
+
+    job = get_job_manager().submit(run_backtest_job, payload, kind="backtest")
+
+    return {
+        "message": "Backtest do modelo enfileirado com sucesso",
+        "result": {
+            "job_id": job["id"],
+            "state": job["state"],
+            "model_id": model_id,
+            "folds": request.folds,
+            "status_path": f"/jobs/{job['id']}"
+        }
+    }
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    return get_job_manager().get(job_id)
+
 @app.post("/models/{model_id}/predict")
-def predict(model_id: str):
-    model, scaler, metadata = S3DownloadService(id=model_id).execute()
+def predict(model_id: str, response: Response, request: PredictRequest = None):
+    from services.cache.prediction_cache import get_prediction_cache
+
+    request = request or PredictRequest()
+    cache = get_prediction_cache()
+
+    if cache is None:
+        return run_prediction(prepare_prediction(model_id, request)[1], request)
+
+    # Keyed by the last input window, so the model only runs again once the bars change
+    result, status = cache.get_or_compute(
+        model_id,
+        request.model_dump(),
+        lambda: prepare_prediction(model_id, request),
+        lambda inputs: run_prediction(inputs, request)
+    )
+    response.headers["X-Prediction-Cache"] = status
+
+    return result
+
+def prepare_prediction(model_id: str, request: PredictRequest):
+    from services.cache.prediction_cache import PredictionCache
+    from services.predict.forecast_service import HISTORY
+    from services.predict.prepare_data_service import PredictPrepareDataService
 
-    X_predict = PredictPrepareDataService(
+    model, scaler, metadata = load_model(model_id)
+
+    # Multi-step forecasts also need the bars preceding each window
+    X_predict, as_of = PredictPrepareDataService(
         metadata=metadata,
-        scaler=scaler
+        scaler=scaler,
+        windows=request.windows,
+        as_of=request.as_of,
+        history=0 if is_single_step(request) else HISTORY
     ).execute()
 
-    prediction = PredictService(model=model, X_predict=X_predict).execute()
+    # The last bar of an open session keeps its date while its values change
+    version = PredictionCache.inputs_version(as_of[-1], X_predict[-1])
+
+    return version, (model, scaler, metadata, X_predict, as_of)
+
+def run_prediction(inputs: tuple, request: PredictRequest):
+    from services.predict.predict_service import PredictService
+
+    model, scaler, metadata, X_predict, as_of = inputs
+
+    if is_single_step(request):
+        prediction = PredictService(model=model, X_predict=X_predict).execute()
+
+        return {
+            "prediction": prediction,
+            "as_of": as_of
+        }
+
+    from services.predict.forecast_service import ForecastService
+
+    prediction, method = ForecastService(
+        model=model,
+        X_predict=X_predict,
+        scaler=scaler,
+        horizon=request.horizon,
+        method=request.method,
+        outputs=metadata.get("model", {}).get("hparams", {}).get("output_size", 1)
+    ).execute()
 
     return {
         "prediction": prediction,
+        "as_of": as_of,
+        "horizon": request.horizon,
+        "method": method
     }
 
+def is_single_step(request: PredictRequest):
+    return request.horizon == 1 and request.method is None
+
+@app.post("/models/{model_id}/stream")
+def predict_stream(model_id: str, request: StreamPredictRequest = None):
+    from services.predict.stateful_predict_service import StatefulPredictService
+
+    request = request or StreamPredictRequest()
+    model, scaler, metadata = load_model(model_id)
+
+    return StatefulPredictService(
+        model_id=model_id,
+        model=model,
+        scaler=scaler,
+        metadata=metadata,
+        reset=request.reset,
+        verify=request.verify
+    ).execute()
+
+@app.delete("/models/{model_id}/stream")
+def reset_stream(model_id: str):
+    return {
+        "message": "Estado reiniciado com sucesso",
+        "reset": lstm_state_store.reset(model_id)
+    }
+
+@app.post("/models/predict/batch")
+def predict_batch(request: BatchPredictRequest):
+    from services.predict.batch_predict_service import BatchPredictService
+
+    return BatchPredictService(
+        model_ids=request.model_ids,
+        loader=load_model
+    ).execute()
+
+@app.get("/models")
+def list_models(ticker: str = None, target_column: str = None, sequence_length: int = None, created_after: str = None, created_before: str = None,
+                sort_by: str = "created_at", order: str = "desc", limit: int = 100):
+    from services.s3.registry_query_service import S3RegistryQueryService
+
+    if order not in ("asc", "desc"):
+        raise ValueError("Order must be 'asc' or 'desc'.")
+
+    return S3RegistryQueryService(
+        ticker=ticker,
+        target_column=target_column,
+        sequence_length=sequence_length,
+        created_after=created_after,
+        created_before=created_before,
+        sort_by=sort_by,
+        descending=order == "desc",
+        limit=limit
+    ).execute()
+
+@app.get("/models/latest")
+def latest_model(ticker: str, target_column: str = None, sequence_length: int = None, by: str = "created_at"):
+    from services.s3.registry_query_service import S3RegistryQueryService
+
+    # Newest model by default; by=test_rmse picks the one with the lowest test error
+    models = S3RegistryQueryService(
+        ticker=ticker,
+        target_column=target_column,
+        sequence_length=sequence_length,
+        sort_by=by,
+        descending=by == "created_at",
+        limit=1
+    ).execute()["models"]
+
+    if not models:
+        raise FileNotFoundError("Model Not Found")
+
+    return models[0]
+
+@app.get("/models/cache/stats")
+def model_cache_stats():
+    return model_cache.stats()
+
+@app.get("/models/predict/cache/stats")
+def prediction_cache_stats():
+    from services.cache.prediction_cache import get_prediction_cache
+
+    cache = get_prediction_cache()
+
+    return cache.stats() if cache is not None else {"backend": None}
+
+@app.get("/models/stream/stats")
+def stream_stats():
+    return lstm_state_store.stats()
+
 @app.post("/models/fetch-data")
-def fetch_stock_data(request: FetchDataRequest):
+def fetch_stock_data(request: FetchDataRequest, accept: str = Header(default="application/json")):
+    from services.serialize_data_service import SerializeDataService
+
+    media_type = SerializeDataService.negotiate(accept)
+
+    if request.tickers:
+        return fetch_many_stock_data(request, media_type)
+
+    if not request.ticker:
+        raise ValueError("Ticker must be provided.")
+
+    from services.yfinance_service import YFinanceService
+
     data = YFinanceService(
         ticker=request.ticker,
         start_date=request.start_date,
         end_date=request.end_date,
         days=request.days
     ).execute()
-  
-    return {
-        "ticker": request.ticker,
-        "data": data.to_dict(orient="records")
-    }
 
+    return serialize_stock_data(data, media_type, {"ticker": request.ticker})
+
+def fetch_many_stock_data(request: FetchDataRequest, media_type: str):
+    from services.batch_fetch_data_service import BatchFetchDataService
+    from services.serialize_data_service import JSON
+
+    if request.layout == "per_ticker" and media_type != JSON:
+        raise ValueError("The per_ticker layout is only available as application/json.")
+
+    data, errors = BatchFetchDataService(
+        tickers=request.tickers,
+        start_date=request.start_date,
+        end_date=request.end_date,
+        days=request.days,
+        layout=request.layout
+    ).execute()
+
+    if request.layout == "per_ticker":
+        return {
+            "tickers": list(data),
+            "data": {ticker: frame.to_dict(orient="records") for ticker, frame in data.items()},
+            "errors": errors
+        }
+
+    return serialize_stock_data(data, media_type, {
+        "tickers": [ticker for ticker in dict.fromkeys(request.tickers) if ticker not in errors],
+        "errors": errors
+    })
+
+def serialize_stock_data(data, media_type: str, metadata: dict):
+    from services.serialize_data_service import SerializeDataService, JSON, NDJSON
+
+    content = SerializeDataService(
+        data=data,
+        media_type=media_type,
+        metadata=metadata
+    ).execute()
+
+    if media_type == JSON:
+        return content
+
+    # NDJSON lines are plain rows, so per-ticker failures also travel in a header
+    headers = {"X-Ticker-Errors": json.dumps(metadata["errors"])} if "errors" in metadata else None
+
+    if media_type == NDJSON:
+        return StreamingResponse(content, media_type=media_type, headers=headers)
+
+    return Response(content=content, media_type=media_type, headers=headers)
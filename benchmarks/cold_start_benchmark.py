@@ -0,0 +1,103 @@
+"""
+Cold-start benchmark for the API handler.
+
+Every endpoint is measured in a fresh interpreter, as in a new Lambda execution
+environment: the time to import `app` plus the modules the route imports on its first
+call, and which heavy dependencies ended up loaded. The modules of each route are read
+from the lazy imports in app.py, in the route itself and in the helpers it calls, so
+the list follows the handler as it changes. The predict path must never import
+PyTorch Lightning; the script fails if it does.
+
+Usage:
+    python -m benchmarks.cold_start_benchmark
+"""
+import ast
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+HEAVY_MODULES = ["torch", "pytorch_lightning", "lightning", "sklearn", "pandas", "yfinance", "boto3"]
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+
+# Modules imported at runtime by the lazily imported ones, with the default configuration
+INDIRECT_IMPORTS = {
+    "services.yfinance_service": ["services.providers.yfinance_provider"],
+    "services.train.validate_request_service": ["services.providers.yfinance_provider"],
+    "services.batch_fetch_data_service": ["services.providers.yfinance_provider"],
+}
+
+
+def lazy_imports(function, functions, seen):
+    modules = []
+
+    for node in ast.walk(function):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+            modules.extend(INDIRECT_IMPORTS.get(node.module, []))
+        elif isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.Name) and node.id in functions and node.id not in seen:
+            # Helpers passed as callbacks (e.g. the model loader) run on the first call too
+            seen.add(node.id)
+            modules.extend(lazy_imports(functions[node.id], functions, seen))
+
+    return modules
+
+
+def endpoints():
+    tree = ast.parse(APP_PATH.read_text())
+    functions = {node.name: node for node in tree.body if isinstance(node, ast.FunctionDef)}
+    routes = {}
+
+    for function in functions.values():
+        for decorator in function.decorator_list:
+            if isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Attribute) \
+                    and isinstance(decorator.func.value, ast.Name) and decorator.func.value.id == "app":
+                endpoint = f"{decorator.func.attr.upper()} {decorator.args[0].value}"
+                routes[endpoint] = list(dict.fromkeys(lazy_imports(function, functions, {function.name})))
+
+    return routes
+
+
+SCRIPT = """
+import importlib, json, sys, time
+start = time.perf_counter()
+import app
+app_seconds = time.perf_counter() - start
+for name in {modules!r}:
+    importlib.import_module(name)
+total_seconds = time.perf_counter() - start
+print(json.dumps({{
+    "app": app_seconds,
+    "total": total_seconds,
+    "loaded": [name for name in {heavy!r} if name in sys.modules]
+}}))
+"""
+
+
+def measure(modules):
+    script = SCRIPT.format(modules=modules, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    print(f"{'endpoint':<38} {'import app':>11} {'first call':>11}  heavy modules")
+
+    for endpoint, modules in endpoints().items():
+        # First run warms the OS page cache, the second one is reported
+        measure(modules)
+        result = measure(modules)
+
+        if "predict" in endpoint:
+            assert "pytorch_lightning" not in result["loaded"] and "lightning" not in result["loaded"], \
+                f"{endpoint} imports PyTorch Lightning"
+
+        print(f"{endpoint:<38} {result['app'] * 1000:>9.0f}ms {result['total'] * 1000:>9.0f}ms  {', '.join(result['loaded']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
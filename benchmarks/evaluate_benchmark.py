@@ -0,0 +1,102 @@
+"""
+Peak memory and time of model evaluation: one full-dataset forward versus chunks.
+
+Each mode runs in a fresh interpreter on the same synthetic dataset, and the growth
+of the peak resident memory during evaluation is reported. Before timing, the chunked
+metrics of TrainEvaluateService are checked against scikit-learn on the full arrays,
+for single- and multi-output targets; the script fails if they differ.
+
+Usage:
+    python -m benchmarks.evaluate_benchmark
+"""
+import json
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+import torch
+from sklearn.metrics import mean_absolute_error, root_mean_squared_error, r2_score, mean_absolute_percentage_error
+
+from models.lstm_network import LSTMNetwork
+from services.train.evaluate_service import TrainEvaluateService
+
+WINDOWS = 50_000
+SEQUENCE_LENGTH = 60
+FEATURES = 5
+
+
+def build(windows, outputs=1):
+    torch.manual_seed(0)
+    model = LSTMNetwork(input_size=FEATURES, hidden_size=64, output_size=outputs).eval()
+    X = torch.rand(windows, SEQUENCE_LENGTH, FEATURES)
+    y = 100 + 10 * torch.rand(windows, outputs).squeeze(-1)
+
+    return model, X, y
+
+
+def full_batch_metrics(model, X, y):
+    # Previous implementation: a single forward over every window, then scikit-learn
+    with torch.no_grad():
+        y_pred = model(X.detach().clone()).numpy()
+
+    return {
+        "mae": mean_absolute_error(y, y_pred),
+        "mape": mean_absolute_percentage_error(y, y_pred),
+        "rmse": root_mean_squared_error(y, y_pred),
+        "r2": r2_score(y, y_pred)
+    }
+
+
+def chunked_metrics(model, X, y, batch_size=1024):
+    return TrainEvaluateService(model, X, y, X[:1], y[:1], batch_size=batch_size).execute()[0]
+
+
+def check_parity():
+    for outputs in [1, 3]:
+        model, X, y = build(5_000, outputs)
+        expected = full_batch_metrics(model, X, y)
+
+        for batch_size in [1, 333, 1024, 10_000]:
+            actual = chunked_metrics(model, X, y, batch_size)
+            for name, value in expected.items():
+                assert np.isclose(actual[name], value, rtol=1e-4, atol=1e-6), \
+                    f"{name} differs for outputs={outputs}, batch_size={batch_size}: {actual[name]} != {value}"
+
+
+def run(mode):
+    model, X, y = build(WINDOWS)
+    with torch.inference_mode():
+        model(X[:8])
+
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    metrics = full_batch_metrics(model, X, y) if mode == "full" else chunked_metrics(model, X, y)
+    seconds = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(json.dumps({"seconds": seconds, "peak_growth_mb": (peak - baseline) / 1024, "mae": float(metrics["mae"])}))
+
+
+def main():
+    check_parity()
+
+    print(f"{WINDOWS} windows x {SEQUENCE_LENGTH} steps")
+    print(f"{'mode':<8} {'time':>8} {'peak memory growth':>20}")
+
+    for mode in ["full", "chunked"]:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.evaluate_benchmark", mode],
+            capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+
+        print(f"{mode:<8} {result['seconds']:>7.2f}s {result['peak_growth_mb']:>18.0f}MB")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run(sys.argv[1])
+    else:
+        main()
@@ -0,0 +1,101 @@
+"""
+Latency benchmark for multi-step forecasts: recursive rollout versus direct head.
+
+The recursive rollout of ForecastService is checked against a naive reference that
+rebuilds a DataFrame and re-runs the scaler at every step (the script fails if they
+diverge), then the naive rollout, the in-place recursive rollout and a direct
+multi-output head are timed for several horizons and batch sizes.
+
+Usage:
+    python -m benchmarks.forecast_benchmark
+"""
+import time
+
+import numpy as np
+import pandas as pd
+import torch
+from sklearn.preprocessing import MinMaxScaler
+
+from models.lstm_network import LSTMNetwork
+from services.predict.forecast_service import ForecastService, HISTORY, PRICE_COLUMNS
+
+SEQUENCE_LENGTH = 60
+FEATURES = ["Open", "High", "Low", "Close", "Volume"]
+HORIZONS = [5, 30]
+BATCH_SIZES = [1, 64]
+REPEATS = 5
+
+
+def build_data(rows=1000):
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, rows))
+
+    return pd.DataFrame({
+        "Open": close + rng.normal(0, 0.5, rows),
+        "High": close + 1,
+        "Low": close - 1,
+        "Close": close,
+        "Volume": rng.integers(100_000, 1_000_000, rows).astype(float)
+    })
+
+
+def naive_rollout(model, scaler, raw_window, horizon):
+    # Reference: grow a DataFrame of raw rows and re-run the scaler on every step. The
+    # model predicts two bars past its window, so each step runs on all rows but the last
+    frame = raw_window.copy()
+    forecast = []
+
+    with torch.inference_mode():
+        for step in range(HISTORY + horizon):
+            window = scaler.transform(frame.iloc[:-1].tail(SEQUENCE_LENGTH))
+            value = model(torch.tensor(window[None], dtype=torch.float32)).reshape(-1)[0].item()
+            if step >= HISTORY:
+                forecast.append(value)
+
+            row = frame.iloc[[-1]].copy()
+            row[[column for column in PRICE_COLUMNS if column in row]] = value
+            frame = pd.concat([frame, row], ignore_index=True)
+
+    return forecast
+
+
+def latency(fn):
+    fn()
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+
+    return (time.perf_counter() - start) / REPEATS
+
+
+def main():
+    torch.manual_seed(0)
+    data = build_data()
+    scaler = MinMaxScaler().fit(data[FEATURES])
+
+    recursive_model = LSTMNetwork(input_size=len(FEATURES), hidden_size=64, output_size=1).eval()
+    raw_windows = [data.iloc[start:start + HISTORY + SEQUENCE_LENGTH] for start in range(0, 64 * 10, 10)]
+    windows = np.stack([scaler.transform(window) for window in raw_windows]).astype(np.float32)
+
+    for horizon in HORIZONS:
+        expected = naive_rollout(recursive_model, scaler, raw_windows[0], horizon)
+        forecast, _ = ForecastService(recursive_model, windows[:1], scaler, horizon=horizon, method="recursive").execute()
+        assert np.allclose(forecast[0], expected, rtol=1e-4, atol=1e-4), f"recursive rollout diverges at horizon {horizon}"
+
+    print(f"{'horizon':>7} {'batch':>5} {'naive':>10} {'recursive':>10} {'direct':>10}")
+
+    for horizon in HORIZONS:
+        direct_model = LSTMNetwork(input_size=len(FEATURES), hidden_size=64, output_size=horizon).eval()
+
+        for batch in BATCH_SIZES:
+            X = windows[:batch]
+
+            naive = latency(lambda: [naive_rollout(recursive_model, scaler, window, horizon) for window in raw_windows[:batch]])
+            recursive = latency(lambda: ForecastService(recursive_model, X, scaler, horizon=horizon, method="recursive").execute())
+            direct = latency(lambda: ForecastService(direct_model, X, scaler, horizon=horizon, outputs=horizon).execute())
+
+            print(f"{horizon:>7} {batch:>5} {naive * 1000:>8.1f}ms {recursive * 1000:>8.1f}ms {direct * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Parity check and latency benchmark for the eager and TorchScript predict backends.
+
+The eager LightningLSTM and its TorchScript export (as produced by TrainExportService
+and saved/loaded the same way as in S3) must produce the same predictions; the script
+fails if they diverge, then reports the mean latency of each backend per batch size.
+
+Usage:
+    python -m benchmarks.inference_backend_benchmark
+"""
+import io
+import time
+
+import torch
+
+from models.lightning_lstm_model import LightningLSTM
+from services.train.export_service import TrainExportService
+
+SEQUENCE_LENGTH = 60
+FEATURES = 5
+BATCH_SIZES = [1, 8, 64]
+REPEATS = 200
+
+
+def latency(model, x):
+    with torch.inference_mode():
+        for _ in range(10):
+            model(x)
+
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            model(x)
+
+    return (time.perf_counter() - start) / REPEATS
+
+
+def main():
+    torch.manual_seed(0)
+    eager = LightningLSTM(input_size=FEATURES, hidden_size=64, output_size=1).eval()
+
+    buffer = io.BytesIO()
+    torch.jit.save(TrainExportService(model=eager).execute(), buffer)
+    buffer.seek(0)
+    compiled = torch.jit.load(buffer, map_location=torch.device('cpu'))
+
+    print(f"{'batch':>6} {'eager (ms)':>11} {'torchscript (ms)':>17} {'max abs diff':>13}")
+
+    for batch_size in BATCH_SIZES:
+        x = torch.randn(batch_size, SEQUENCE_LENGTH, FEATURES)
+
+        with torch.inference_mode():
+            difference = (eager(x) - compiled(x)).abs().max().item()
+
+        assert difference < 1e-5, f"TorchScript output diverges from eager model by {difference}"
+
+        print(f"{batch_size:>6} {latency(eager, x) * 1000:>11.3f} {latency(compiled, x) * 1000:>17.3f} {difference:>13.2e}")
+
+
+if __name__ == "__main__":
+    main()
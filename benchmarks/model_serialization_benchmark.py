@@ -0,0 +1,86 @@
+"""
+Benchmark for model artifact loading: pickled `model.pth` versus safetensors weights.
+
+Each loader runs in a fresh subprocess so peak RSS is measured in isolation. The
+reported RSS is the increase over the process baseline after importing torch and
+Lightning, which both formats pay equally.
+
+Usage:
+    python -m benchmarks.model_serialization_benchmark
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import torch
+from safetensors.torch import save_file
+
+from models.lightning_lstm_model import LightningLSTM
+
+HIDDEN_SIZES = [64, 256, 1024]
+REPEATS = 20
+
+LOADER = """
+import json, resource, sys, time
+import torch
+from safetensors.torch import load_file
+from models.lightning_lstm_model import LightningLSTM
+
+fmt, path, hparams, repeats = sys.argv[1], sys.argv[2], json.loads(sys.argv[3]), int(sys.argv[4])
+baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+start = time.perf_counter()
+for _ in range(repeats):
+    if fmt == "pth":
+        with open(path, "rb") as f:
+            model = torch.load(f, map_location=torch.device("cpu"), weights_only=False)
+    else:
+        with torch.device("meta"):
+            model = LightningLSTM(**hparams)
+        model.load_state_dict(load_file(path), assign=True)
+elapsed = (time.perf_counter() - start) / repeats
+
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"seconds": elapsed, "rss_kb": peak - baseline}))
+"""
+
+
+def measure(fmt, path, hparams):
+    output = subprocess.run(
+        [sys.executable, "-c", LOADER, fmt, path, json.dumps(hparams), str(REPEATS)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.getcwd()}
+    ).stdout
+
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    print(f"{'hidden':>7} {'size (MB)':>10} {'pth load (ms)':>14} {'st load (ms)':>13} {'pth RSS (MB)':>13} {'st RSS (MB)':>12}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for hidden_size in HIDDEN_SIZES:
+            model = LightningLSTM(input_size=5, hidden_size=hidden_size, output_size=1)
+            hparams = dict(model.hparams)
+
+            pth_path = os.path.join(directory, f"model_{hidden_size}.pth")
+            st_path = os.path.join(directory, f"model_{hidden_size}.safetensors")
+            torch.save(model, pth_path)
+            save_file({key: value.contiguous() for key, value in model.state_dict().items()}, st_path)
+
+            pth = measure("pth", pth_path, hparams)
+            st = measure("safetensors", st_path, hparams)
+
+            print(
+                f"{hidden_size:>7} {os.path.getsize(st_path) / 2**20:>10.2f} "
+                f"{pth['seconds'] * 1000:>14.2f} {st['seconds'] * 1000:>13.2f} "
+                f"{pth['rss_kb'] / 1024:>13.1f} {st['rss_kb'] / 1024:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Micro-benchmark for building prediction windows in PredictPrepareDataService.
+
+Compares the previous list of per-window NumPy slices converted with `torch.tensor(list)`
+against the strided float32 view materialized once by PredictService, for an increasing
+number of windows, and checks that both produce identical inputs and predictions. The
+strided path also formats the timestamp of every window, which the previous one did not.
+
+Usage:
+    python -m benchmarks.predict_windows_benchmark
+"""
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+import torch
+from sklearn.preprocessing import MinMaxScaler
+
+from models.lstm_network import LSTMNetwork
+from services.preprocess_data_service import PreprocessDataService
+from services.predict.prepare_data_service import PredictPrepareDataService
+from services.predict.predict_service import PredictService
+
+SEQUENCE_LENGTH = 60
+WINDOWS = [1, 30, 250, 1000]
+COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+REPEATS = 20
+
+# The legacy path is the slow conversion torch warns about
+warnings.filterwarnings("ignore", message="Creating a tensor from a list of numpy.ndarrays")
+
+
+def make_frame(rows):
+    rng = np.random.default_rng(42)
+    frame = pd.DataFrame(100 + rng.random((rows, len(COLUMNS))), columns=COLUMNS)
+    frame.insert(0, "Date", pd.date_range("2000-01-03", periods=rows, freq="B", tz="America/New_York"))
+    return frame
+
+
+def legacy_inputs(data, scaler, windows):
+    # Previous implementation: scale, one slice per window in a Python list, torch.tensor(list)
+    data = PreprocessDataService(data=data.copy()).execute()
+    data = data.sort_values('Date').reset_index(drop=True).drop('Date', axis=1).tail(SEQUENCE_LENGTH + windows - 1)
+    data = scaler.transform(data)
+
+    sequences = []
+    for i in range(len(data) - SEQUENCE_LENGTH + 1):
+        sequences.append(data[i:i + SEQUENCE_LENGTH])
+
+    return torch.tensor(sequences, dtype=torch.float32)
+
+
+def strided_inputs(data, scaler, windows):
+    metadata = {"request": {"sequence_length": SEQUENCE_LENGTH, "ticker": "BENCH"}}
+    X, _ = PredictPrepareDataService(metadata=metadata, scaler=scaler, data=data.copy(), windows=windows).execute()
+
+    return torch.from_numpy(np.ascontiguousarray(X, dtype=np.float32))
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        result = fn(*args)
+    return result, (time.perf_counter() - start) / REPEATS
+
+
+def main():
+    data = make_frame(SEQUENCE_LENGTH + max(WINDOWS) + 100)
+    scaler = MinMaxScaler().fit(data[COLUMNS])
+
+    torch.manual_seed(0)
+    model = LSTMNetwork(input_size=len(COLUMNS), hidden_size=64, output_size=1).eval()
+
+    print(f"sequence_length={SEQUENCE_LENGTH}")
+    print(f"{'windows':>8} {'legacy (ms)':>12} {'strided (ms)':>13} {'speedup':>8}")
+
+    for windows in WINDOWS:
+        X_old, legacy_time = timed(legacy_inputs, data, scaler, windows)
+        X_new, strided_time = timed(strided_inputs, data, scaler, windows)
+
+        assert torch.equal(X_old, X_new), f"inputs differ for windows={windows}"
+        with torch.inference_mode():
+            expected = model(X_old).tolist()
+        actual = PredictService(model=model, X_predict=X_new.numpy()).execute()
+        assert np.allclose(actual, expected, rtol=1e-6), f"predictions differ for windows={windows}"
+
+        print(f"{windows:>8} {legacy_time * 1000:>12.2f} {strided_time * 1000:>13.2f} {legacy_time / strided_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Peak memory and time of training data preparation: pandas/float64 versus one float32 block.
+
+The previous path (in-place dropna and column selection, DataFrame sort, target column,
+scikit-learn MinMaxScaler on DataFrame slices, then float32 tensors) is compared with
+PreprocessDataService and TrainPrepareDataService using MinMaxScaler32. Each mode runs in
+a fresh interpreter on the same large synthetic frame, and the growth of the peak
+resident memory during preparation is reported. Before timing, both paths are checked to
+produce the same tensors within float32 rounding; the script fails if they differ.
+
+Usage:
+    python -m benchmarks.preprocess_benchmark
+"""
+import json
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import torch
+from sklearn.preprocessing import MinMaxScaler
+
+from models.min_max_scaler import MinMaxScaler32
+from services.preprocess_data_service import PreprocessDataService
+from services.sliding_window_service import SlidingWindowService
+from services.train.prepare_data_service import TrainPrepareDataService
+
+ROWS = 2_000_000
+SEQUENCE_LENGTH = 5
+COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def make_frame(rows):
+    # Shaped like a provider response: unsorted, a few nulls and columns the model never uses
+    rng = np.random.default_rng(42)
+    frame = pd.DataFrame(100 + rng.random((rows, len(COLUMNS))), columns=COLUMNS)
+    frame["Volume"] *= 1e6
+    frame.insert(0, "Date", pd.date_range("1900-01-01", periods=rows, freq="h", tz="UTC"))
+    frame["Dividends"] = 0.0
+    frame["Stock Splits"] = 0.0
+    frame.loc[rng.choice(rows, 100, replace=False), "Close"] = np.nan
+    return frame.sample(frac=1, random_state=0)
+
+
+def legacy_prepare(data):
+    # Previous implementation, kept verbatim in behavior
+    data.dropna(inplace=True)
+    data = data[["Date", *COLUMNS]]
+    data = data.sort_values('Date').reset_index(drop=True)
+    data = data.drop('Date', axis=1)
+    data['target'] = data['Close'].shift(-1)
+    data = data.dropna(subset=['target'])
+
+    split = int(len(data) * 0.8)
+    train_data, test_data = data[:split], data[split:]
+    scaler = MinMaxScaler()
+    feature_cols = train_data.columns.drop('target')
+    train_data[feature_cols] = scaler.fit_transform(train_data[feature_cols])
+    test_data[feature_cols] = scaler.transform(test_data[feature_cols])
+
+    tensors = []
+    for part in (train_data, test_data):
+        features = part.drop('target', axis=1).to_numpy()
+        windows = SlidingWindowService(data=features, sequence_length=SEQUENCE_LENGTH).execute()
+        X = windows[:len(part) - SEQUENCE_LENGTH]
+        y = part['target'].to_numpy()[SEQUENCE_LENGTH:]
+        tensors += [torch.from_numpy(np.ascontiguousarray(X, dtype=np.float32)), torch.from_numpy(np.ascontiguousarray(y, dtype=np.float32))]
+
+    return (*tensors, scaler)
+
+
+def float32_prepare(data):
+    data = PreprocessDataService(data=data).execute()
+    return TrainPrepareDataService(data=data, train_size=0.8, sequence_length=SEQUENCE_LENGTH, scaler=MinMaxScaler32).execute()
+
+
+def check_parity():
+    frame = make_frame(50_000)
+    expected = legacy_prepare(frame.copy())
+    actual = float32_prepare(frame.copy())
+
+    for name, a, b in zip(["X_train", "y_train", "X_test", "y_test"], expected[:4], actual[:4]):
+        assert a.shape == b.shape, f"{name} shape differs: {a.shape} != {b.shape}"
+        assert torch.allclose(a, b, rtol=1e-6, atol=1e-6), f"{name} differs by {float((a - b).abs().max())}"
+
+
+def run(mode):
+    data = make_frame(ROWS)
+    prepare = legacy_prepare if mode == "legacy" else float32_prepare
+
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    dataset = prepare(data)
+    seconds = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    output_mb = sum(tensor.numel() * tensor.element_size() for tensor in dataset[:4]) / 2**20
+    print(json.dumps({"seconds": seconds, "peak_growth_mb": (peak - baseline) / 1024, "output_mb": output_mb}))
+
+
+def main():
+    check_parity()
+
+    print(f"{ROWS} rows, sequence_length={SEQUENCE_LENGTH}")
+    print(f"{'mode':<8} {'time':>8} {'peak memory growth':>20} {'output tensors':>16}")
+
+    for mode in ["legacy", "float32"]:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.preprocess_benchmark", mode],
+            capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+
+        print(f"{mode:<8} {result['seconds']:>7.2f}s {result['peak_growth_mb']:>18.0f}MB {result['output_mb']:>14.0f}MB")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run(sys.argv[1])
+    else:
+        main()
@@ -0,0 +1,99 @@
+"""
+Payload size and serialization time of the /models/fetch-data response formats.
+
+A synthetic multi-decade daily history is serialized as JSON records (the default,
+encoded the way FastAPI does it), columnar JSON, Arrow IPC stream and NDJSON. Every
+format is decoded back and compared against the source frame; the script fails if any
+of them loses data.
+
+Usage:
+    python -m benchmarks.serialization_benchmark
+"""
+import io
+import json
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from fastapi.encoders import jsonable_encoder
+
+from services.serialize_data_service import SerializeDataService, JSON, COLUMNAR_JSON, ARROW, NDJSON
+
+ROWS = [2_500, 25_000, 100_000]
+REPEATS = 3
+
+
+def build_frame(rows):
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, rows))
+
+    return pd.DataFrame({
+        "Date": pd.date_range("1990-01-01", periods=rows, freq="h", tz="America/New_York"),
+        "Open": close + rng.normal(0, 0.5, rows),
+        "High": close + 1,
+        "Low": close - 1,
+        "Close": close,
+        "Volume": rng.integers(100_000, 1_000_000, rows)
+    })
+
+
+def serialize(data, media_type):
+    content = SerializeDataService(data=data, media_type=media_type, metadata={"ticker": "AAA"}).execute()
+
+    if media_type == JSON:
+        # Same path FastAPI takes for a plain dict response
+        return json.dumps(jsonable_encoder(content)).encode()
+
+    if media_type == NDJSON:
+        return "".join(content).encode()
+
+    return content
+
+
+def decode(payload, media_type):
+    if media_type == JSON:
+        data = pd.DataFrame(json.loads(payload)["data"])
+        return data.assign(Date=pd.to_datetime(data["Date"], utc=True))
+
+    if media_type == COLUMNAR_JSON:
+        data = pd.DataFrame(json.loads(payload)["data"])
+    elif media_type == NDJSON:
+        data = pd.read_json(io.BytesIO(payload), lines=True, convert_dates=False)
+    else:
+        return pa.ipc.open_stream(payload).read_all().to_pandas().assign(
+            Date=lambda frame: frame["Date"].dt.tz_convert("UTC")
+        )
+
+    return data.assign(Date=pd.to_datetime(data["Date"], unit="ms", utc=True))
+
+
+def check(data, decoded, media_type):
+    expected = data.assign(Date=data["Date"].dt.tz_convert("UTC"))
+
+    assert list(decoded.columns) == list(expected.columns), f"{media_type} changed the columns"
+    assert (decoded["Date"].values == expected["Date"].values).all(), f"{media_type} changed the timestamps"
+    for column in ["Open", "High", "Low", "Close", "Volume"]:
+        assert np.allclose(decoded[column], expected[column], rtol=1e-12, atol=1e-12), f"{media_type} changed {column}"
+
+
+def main():
+    print(f"{'rows':>8} {'format':<38} {'size':>10} {'time':>10}")
+
+    for rows in ROWS:
+        data = build_frame(rows)
+
+        for media_type in [JSON, COLUMNAR_JSON, ARROW, NDJSON]:
+            timings = []
+            for _ in range(REPEATS):
+                start = time.perf_counter()
+                payload = serialize(data, media_type)
+                timings.append(time.perf_counter() - start)
+
+            check(data, decode(payload, media_type), media_type)
+
+            print(f"{rows:>8} {media_type:<38} {len(payload) / 1024:>8.0f}KB {min(timings) * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
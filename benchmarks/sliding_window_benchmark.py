@@ -0,0 +1,69 @@
+"""
+Micro-benchmark for sliding-window construction in TrainPrepareDataService.
+
+Compares the previous row-by-row DataFrame loop against SlidingWindowService on
+roughly 20 years of synthetic daily bars and checks that both produce identical tensors.
+
+Usage:
+    python -m benchmarks.sliding_window_benchmark
+"""
+import time
+
+import numpy as np
+import pandas as pd
+import torch
+
+from services.sliding_window_service import SlidingWindowService
+
+ROWS = 252 * 20
+SEQUENCE_LENGTHS = [10, 30, 60, 120]
+
+
+def legacy_sequences(data, sequence_length):
+    X = []
+    y = []
+
+    for i in range(len(data) - sequence_length):
+        X.append(data.iloc[i:i+sequence_length].drop('target', axis=1).values)
+        y.append(data.iloc[i+sequence_length]['target'])
+
+    return np.array(X), np.array(y)
+
+
+def strided_sequences(data, sequence_length):
+    features = data.drop('target', axis=1).to_numpy()
+    windows = SlidingWindowService(data=features, sequence_length=sequence_length).execute()
+
+    return windows[:len(data) - sequence_length], data['target'].to_numpy()[sequence_length:]
+
+
+def make_frame(rows):
+    rng = np.random.default_rng(42)
+    frame = pd.DataFrame(rng.random((rows, 5)), columns=["Open", "High", "Low", "Close", "Volume"])
+    frame['target'] = frame['Close'].shift(-1)
+    return frame.dropna(subset=['target'])
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    data = make_frame(ROWS)
+    print(f"rows={len(data)}")
+    print(f"{'seq_len':>8} {'legacy (s)':>12} {'strided (s)':>12} {'speedup':>10}")
+
+    for sequence_length in SEQUENCE_LENGTHS:
+        (X_old, y_old), legacy_time = timed(legacy_sequences, data, sequence_length)
+        (X_new, y_new), strided_time = timed(strided_sequences, data, sequence_length)
+
+        assert torch.equal(torch.tensor(X_old, dtype=torch.float32), torch.tensor(X_new, dtype=torch.float32))
+        assert torch.equal(torch.tensor(y_old, dtype=torch.float32), torch.tensor(y_new, dtype=torch.float32))
+
+        print(f"{sequence_length:>8} {legacy_time:>12.4f} {strided_time:>12.6f} {legacy_time / strided_time:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Latency benchmark for stateful inference: one LSTM step versus a full window.
+
+For several sequence lengths the state is warmed up over a window, advanced bar by
+bar, and compared against the full recomputation over the same bars (the script fails
+if they diverge). It then reports the cost of absorbing one new bar with the stored
+state versus recomputing the whole window, as the stateless predict path does.
+
+Usage:
+    python -m benchmarks.stateful_benchmark
+"""
+import time
+
+import torch
+
+from models.lstm_network import LSTMNetwork
+
+FEATURES = 5
+SEQUENCE_LENGTHS = [30, 60, 120, 250]
+STEPS = 20
+REPEATS = 200
+
+
+def latency(fn):
+    for _ in range(10):
+        fn()
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+
+    return (time.perf_counter() - start) / REPEATS
+
+
+def main():
+    torch.manual_seed(0)
+    network = LSTMNetwork(input_size=FEATURES, hidden_size=64, output_size=1).eval()
+
+    print(f"{'seq_len':>7} {'full window':>12} {'one step':>10} {'speedup':>8}")
+
+    with torch.inference_mode():
+        for sequence_length in SEQUENCE_LENGTHS:
+            bars = torch.rand(1, sequence_length + STEPS, FEATURES)
+
+            _, state = network.lstm(bars[:, :sequence_length])
+            for step in range(STEPS):
+                _, state = network.lstm(bars[:, sequence_length + step:sequence_length + step + 1], state)
+
+            stateful = network.fc(state[0][-1]).squeeze(-1)
+            recomputed = network(bars)
+            assert torch.allclose(stateful, recomputed, atol=1e-5), f"stateful inference diverges at seq_len {sequence_length}"
+
+            window = bars[:, -sequence_length:]
+            bar = bars[:, -1:]
+
+            full = latency(lambda: network(window))
+            step = latency(lambda: network.fc(network.lstm(bar, state)[1][0][-1]))
+
+            print(f"{sequence_length:>7} {full * 1e6:>10.0f}us {step * 1e6:>8.0f}us {full / step:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
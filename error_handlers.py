@@ -1,7 +1,9 @@
 from fastapi import Request, HTTPException
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
-from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY, HTTP_404_NOT_FOUND, HTTP_500_INTERNAL_SERVER_ERROR, HTTP_400_BAD_REQUEST
+from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY, HTTP_404_NOT_FOUND, HTTP_500_INTERNAL_SERVER_ERROR, HTTP_400_BAD_REQUEST, HTTP_429_TOO_MANY_REQUESTS
+
+from services.jobs.job_manager import QueueFullError
 
 
 def http_exception_handler(request: Request, exc: HTTPException):
@@ -33,3 +35,9 @@ def file_not_found_error_handler(request: Request, exc: FileNotFoundError):
         status_code=HTTP_404_NOT_FOUND,
         content={"detail": "File not found", "error": str(exc)},
     )
+
+def queue_full_error_handler(request: Request, exc: QueueFullError):
+    return JSONResponse(
+        status_code=HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": "Too many requests", "error": str(exc)},
+    )
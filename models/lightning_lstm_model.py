@@ -20,9 +20,11 @@ class LightningLSTM(L.LightningModule):
         input_size (int): The number of input features (default: 1).
         hidden_size (int): The number of features in the hidden state (default: 64).
         output_size (int): The size of the output (default: 1).
+        num_layers (int): The number of stacked LSTM layers (default: 2).
+        learning_rate (float): The Adam learning rate (default: 0.001).
     """
 
-    def __init__(self, input_size: int = 1, hidden_size: int = 64, output_size: int = 1):
+    def __init__(self, input_size: int = 1, hidden_size: int = 64, output_size: int = 1, num_layers: int = 2, learning_rate: float = 0.001):
         """
         Initialize the LSTM model.
 
@@ -30,10 +32,13 @@ class LightningLSTM(L.LightningModule):
             input_size (int): Number of input features.
             hidden_size (int): Number of features in the hidden state.
             output_size (int): Size of the output.
+            num_layers (int): Number of stacked LSTM layers.
+            learning_rate (float): Learning rate of the Adam optimizer.
         """
         super().__init__()
         self.save_hyperparameters()
-        self.lstm = nn.LSTM(input_size=input_size, hidden_size=hidden_size, batch_first=True, num_layers=2, dropout=0.2)
+        # Dropout only applies between stacked layers
+        self.lstm = nn.LSTM(input_size=input_size, hidden_size=hidden_size, batch_first=True, num_layers=num_layers, dropout=0.2 if num_layers > 1 else 0.0)
         self.fc = nn.Linear(hidden_size, output_size)
         self.criterion = nn.MSELoss()
 
@@ -48,7 +53,7 @@ class LightningLSTM(L.LightningModule):
         return out.squeeze(-1)
 
     def configure_optimizers(self):
-        return Adam(self.parameters(), lr=0.001)
+        return Adam(self.parameters(), lr=self.hparams.learning_rate)
 
     def training_step(self, batch, batch_idx):
         x, y = batch
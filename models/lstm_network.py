@@ -0,0 +1,50 @@
+import torch.nn as nn
+from torch import Tensor
+
+NETWORK_HPARAMS = ("input_size", "hidden_size", "output_size", "num_layers")
+
+
+class LSTMNetwork(nn.Module):
+    """
+    Plain PyTorch LSTM network used for inference and graph export.
+
+    It mirrors the layers of LightningLSTM (same attribute names, hence the same
+    state_dict keys) without the training logic, so trained weights can be loaded
+    into it directly. The forward pass expects an already batched 3D input and does
+    no rank checks, which keeps it scriptable and cheap to call.
+
+    Attributes:
+        lstm (nn.LSTM): The LSTM layers for sequence processing.
+        fc (nn.Linear): The fully connected output layer.
+
+    Args:
+        input_size (int): The number of input features (default: 1).
+        hidden_size (int): The number of features in the hidden state (default: 64).
+        output_size (int): The size of the output (default: 1).
+        num_layers (int): The number of stacked LSTM layers (default: 2).
+    """
+
+    def __init__(self, input_size: int = 1, hidden_size: int = 64, output_size: int = 1, num_layers: int = 2):
+        """
+        Initialize the LSTM network.
+
+        Args:
+            input_size (int): Number of input features.
+            hidden_size (int): Number of features in the hidden state.
+            output_size (int): Size of the output.
+            num_layers (int): Number of stacked LSTM layers.
+        """
+        super().__init__()
+        self.lstm = nn.LSTM(input_size=input_size, hidden_size=hidden_size, batch_first=True, num_layers=num_layers, dropout=0.2 if num_layers > 1 else 0.0)
+        self.fc = nn.Linear(hidden_size, output_size)
+
+    @staticmethod
+    def from_hparams(hparams: dict):
+        # Training-only hyperparameters (e.g. learning_rate) do not affect the network
+        return LSTMNetwork(**{key: value for key, value in hparams.items() if key in NETWORK_HPARAMS})
+
+    def forward(self, x: Tensor) -> Tensor:
+        # x: (batch, seq_len, input_size)
+        lstm_out, (hidden, cell) = self.lstm(x)
+        out = self.fc(hidden[-1])  # hidden[-1]: (batch, hidden_size)
+        return out.squeeze(-1)
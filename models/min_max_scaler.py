@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+
+
+class MinMaxScaler32:
+    """
+    A min-max scaler producing float32 data, stored as plain vectors instead of a pickle.
+
+    It follows scikit-learn's MinMaxScaler for the (0, 1) range: the statistics and the
+    scale/offset vectors are kept in float64, constant features get a scale of 1, and
+    `transform` computes `X * scale_ + min_` and rounds the result once to float32, so a
+    narrow price range is not flattened by float32 rounding of the raw values. It can also
+    be fitted from per-feature ranges computed elsewhere (`fit_range`), so callers that
+    stream columns never build a float64 copy of the whole data. `to_dict` and
+    `from_dict` turn the fitted scaler into JSON-compatible lists for the model metadata.
+
+    Attributes:
+        min_ (np.ndarray): Per-feature offset applied after scaling.
+        scale_ (np.ndarray): Per-feature scale factor.
+        data_min_ (np.ndarray): Per-feature minimum seen during fitting.
+        data_max_ (np.ndarray): Per-feature maximum seen during fitting.
+        feature_names_in_ (np.ndarray): Names of the features seen during fitting, if any.
+        n_features_in_ (int): Number of features seen during fitting.
+
+    Raises:
+        ValueError: If the scaler is used before fitting or with different features.
+    """
+
+    def __init__(self):
+        """
+        Initialize the MinMaxScaler32.
+        """
+        self.min_ = None
+        self.scale_ = None
+        self.data_min_ = None
+        self.data_max_ = None
+        self.feature_names_in_ = None
+        self.n_features_in_ = None
+
+    def fit(self, X):
+        values = self.__values(X)
+        return self.fit_range(np.nanmin(values, axis=0), np.nanmax(values, axis=0), self.__names(X))
+
+    def fit_range(self, data_min, data_max, feature_names: list = None):
+        data_min = np.asarray(data_min, dtype=np.float64)
+        data_max = np.asarray(data_max, dtype=np.float64)
+        data_range = data_max - data_min
+
+        self.scale_ = 1.0 / np.where(data_range == 0, 1.0, data_range)
+        self.min_ = -data_min * self.scale_
+        self.data_min_ = data_min
+        self.data_max_ = data_max
+        self.feature_names_in_ = np.asarray(feature_names, dtype=object) if feature_names is not None else None
+        self.n_features_in_ = len(data_min)
+
+        return self
+
+    def transform(self, X):
+        self.__validate(X)
+
+        # Scaled in float64 like scikit-learn, then rounded once to float32
+        scaled = self.__values(X) * self.scale_
+        scaled += self.min_
+
+        return scaled.astype(np.float32)
+
+    def fit_transform(self, X):
+        return self.fit(X).transform(X)
+
+    def inverse_transform(self, X):
+        return (np.asarray(X, dtype=np.float64) - self.min_) / self.scale_
+
+    def to_dict(self):
+        if self.scale_ is None:
+            raise ValueError("Scaler must be fitted before it is serialized.")
+
+        return {
+            "type": "MinMaxScaler",
+            "dtype": "float32",
+            "feature_names": list(self.feature_names_in_) if self.feature_names_in_ is not None else None,
+            "data_min": self.data_min_.tolist(),
+            "data_max": self.data_max_.tolist()
+        }
+
+    @staticmethod
+    def from_dict(values: dict):
+        return MinMaxScaler32().fit_range(values["data_min"], values["data_max"], values.get("feature_names"))
+
+    def __names(self, X):
+        return [str(column) for column in X.columns] if isinstance(X, pd.DataFrame) else None
+
+    def __values(self, X):
+        if isinstance(X, pd.DataFrame):
+            return X.to_numpy(dtype=np.float64)
+
+        return np.asarray(X)
+
+    def __validate(self, X):
+        if self.scale_ is None:
+            raise ValueError("Scaler must be fitted before transforming data.")
+
+        names = self.__names(X)
+        if names is not None and self.feature_names_in_ is not None and names != list(self.feature_names_in_):
+            raise ValueError("Feature names must match the ones seen during fitting.")
+
+        if np.shape(X)[-1] != self.n_features_in_:
+            raise ValueError(f"Expected {self.n_features_in_} features, got {np.shape(X)[-1]}.")
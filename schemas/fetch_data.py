@@ -1,7 +1,9 @@
 from pydantic import BaseModel
 
 class FetchDataRequest(BaseModel):
-    ticker: str
+    ticker: str = None
+    tickers: list[str] = None
     start_date: str = None
     end_date: str = None
     days: int = None
+    layout: str = "long"
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, ConfigDict
+
+class PredictRequest(BaseModel):
+    horizon: int = 1
+    method: str = None
+    windows: int = 1
+    as_of: str = None
+
+class StreamPredictRequest(BaseModel):
+    reset: bool = False
+    verify: bool = False
+
+class BatchPredictRequest(BaseModel):
+    model_config = ConfigDict(protected_namespaces=())
+
+    model_ids: list[str]
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 class TrainModelRequest(BaseModel):
@@ -9,3 +11,51 @@ class TrainModelRequest(BaseModel):
     target_column: str
     epochs: int
     patience: int
+    horizon: int = 1
+    batch_size: int = 32
+    auto_batch_size: bool = False
+    learning_rate: float = 0.001
+    hidden_size: int = 64
+    num_layers: int = 2
+    num_threads: Optional[int] = None
+    precision: str = "32"
+
+class BatchTrainModelRequest(BaseModel):
+    requests: list[TrainModelRequest]
+
+class UpdateModelRequest(BaseModel):
+    end_date: str = None
+    train_size: float = 0.8
+    epochs: int = 5
+    patience: int = 2
+    learning_rate: float = None
+
+class TuneModelRequest(BaseModel):
+    ticker: str
+    start_date: str
+    end_date: str
+    train_size: float = 0.8
+    validation_size: float = 0.2
+    target_column: str = "Close"
+    horizon: int = 1
+    sequence_length: list[int] = [10, 20, 40, 60]
+    hidden_size: list[int] = [32, 64, 128]
+    num_layers: list[int] = [1, 2]
+    learning_rate: list[float] = [0.0005, 0.001, 0.005]
+    patience: list[int] = [2, 5]
+    trials: int = 9
+    min_epochs: int = 2
+    max_epochs: int = 18
+    reduction_factor: int = 3
+    batch_size: int = 32
+    seed: Optional[int] = None
+
+class BacktestModelRequest(BaseModel):
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    folds: int = 50
+    test_size: int = 21
+    window: str = "expanding"
+    train_window: Optional[int] = None
+    epochs: Optional[int] = None
+    patience: Optional[int] = None
@@ -0,0 +1,108 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from services.yfinance_service import YFinanceService
+from services.preprocess_data_service import PreprocessDataService
+
+LAYOUTS = ["long", "per_ticker"]
+
+
+class BatchFetchDataService:
+    """
+    A service class for fetching historical stock data for many tickers at once.
+
+    Tickers are downloaded concurrently through YFinanceService with a bounded thread pool
+    (sharing the configured provider and its on-disk cache) and each one is cleaned with
+    PreprocessDataService. The result is either a single long-format frame with a `Ticker`
+    column or one frame per ticker. Failures are reported per ticker instead of failing
+    the whole batch.
+
+    Attributes:
+        tickers (list): The stock ticker symbols.
+        start_date (str): The start date for data retrieval (optional).
+        end_date (str): The end date for data retrieval (optional).
+        days (int): Number of days of historical data to retrieve (optional).
+        layout (str): `long` for a single frame or `per_ticker` for a frame per ticker.
+        max_workers (int): Maximum number of concurrent downloads.
+
+    Raises:
+        ValueError: If no tickers or an unknown layout are provided.
+    """
+
+    def __init__(self, tickers: list, start_date: str = None, end_date: str = None, days: int = None, layout: str = "long", max_workers: int = None):
+        """
+        Initialize the BatchFetchDataService.
+
+        Args:
+            tickers (list): The stock ticker symbols.
+            start_date (str, optional): Start date in 'YYYY-MM-DD' format.
+            end_date (str, optional): End date in 'YYYY-MM-DD' format.
+            days (int, optional): Number of days of historical data to retrieve.
+            layout (str): `long` (default) or `per_ticker`.
+            max_workers (int, optional): Maximum number of concurrent downloads
+                (default: FETCH_MAX_WORKERS or 8).
+        """
+        self.tickers = list(dict.fromkeys(tickers or []))
+        self.start_date = start_date
+        self.end_date = end_date
+        self.days = days
+        self.layout = layout
+        self.max_workers = max_workers or int(os.getenv('FETCH_MAX_WORKERS', 8))
+
+    def execute(self):
+        self.__validate()
+
+        frames, errors = self.__fetch()
+
+        if self.layout == "per_ticker":
+            return frames, errors
+
+        return self.__concat(frames), errors
+
+    def __validate(self):
+        if not self.tickers:
+            raise ValueError("At least one ticker must be provided.")
+
+        if self.layout not in LAYOUTS:
+            raise ValueError(f"Layout must be one of: {', '.join(LAYOUTS)}.")
+
+    def __fetch(self):
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(self.tickers)))) as executor:
+            results = list(executor.map(self.__safe_fetch, self.tickers))
+
+        frames, errors = {}, {}
+        for ticker, (data, error) in zip(self.tickers, results):
+            if error is not None:
+                errors[ticker] = str(error)
+            else:
+                frames[ticker] = data
+
+        return frames, errors
+
+    def __safe_fetch(self, ticker):
+        try:
+            data = YFinanceService(
+                ticker=ticker,
+                start_date=self.start_date,
+                end_date=self.end_date,
+                days=self.days
+            ).execute()
+
+            return PreprocessDataService(data).execute().reset_index(drop=True), None
+        except Exception as exc:
+            return None, exc
+
+    def __concat(self, frames):
+        if not frames:
+            return pd.DataFrame(columns=["Ticker", "Date", "Open", "High", "Low", "Close", "Volume"])
+
+        data = pd.concat(
+            [data.assign(Ticker=ticker) for ticker, data in frames.items()],
+            ignore_index=True
+        )
+        # A categorical keeps the repeated ticker symbol small in memory and in Arrow
+        data["Ticker"] = pd.Categorical(data["Ticker"], categories=list(frames))
+
+        return data[["Ticker", *next(iter(frames.values())).columns]]
@@ -0,0 +1,151 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+import torch
+
+from models.min_max_scaler import MinMaxScaler32
+
+# Bump when the preparation changes, so entries built by older code are never reused
+FORMAT_VERSION = 2
+ARRAYS = ["X_train", "y_train", "X_test", "y_test"]
+
+
+class DatasetCache:
+    """
+    Content-addressed on-disk cache of prepared training datasets.
+
+    An entry holds the X_train, y_train, X_test and y_test tensors as `.npy` files plus
+    the fitted scaler as `scaler.json` (its `to_dict()`, so nothing is unpickled on a
+    hit), in a directory named after a SHA-256 of the preprocessed data slice and the
+    preparation parameters, so any change in the bars or in the preparation gives a new key. Entries are written to a temporary directory and renamed into place, which
+    makes them visible atomically to every process sharing the directory. Hits are loaded
+    as copy-on-write memory maps, so only the pages actually read are paged in. Once the
+    cache exceeds `max_size_mb`, the least recently used entries are removed.
+
+    Attributes:
+        directory (str): Directory where the entries are stored (empty disables the cache).
+        max_size_mb (float): Maximum total size of the entries in megabytes.
+    """
+
+    def __init__(self, directory: str, max_size_mb: float = 1024):
+        """
+        Initialize the DatasetCache.
+
+        Args:
+            directory (str): Directory where the entries are stored (empty disables the cache).
+            max_size_mb (float): Maximum total size of the entries in megabytes (default: 1024).
+        """
+        if max_size_mb <= 0:
+            raise ValueError("Dataset cache size must be greater than 0.")
+
+        self.directory = directory
+        self.max_size_mb = max_size_mb
+        self.__lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return bool(self.directory)
+
+    def get_or_prepare(self, data: pd.DataFrame, params: dict, prepare):
+        if not self.enabled:
+            return prepare()
+
+        key = self.key(data, params)
+        dataset = self.get(key)
+        if dataset is None:
+            dataset = prepare()
+            self.put(key, dataset)
+
+        return dataset
+
+    def key(self, data: pd.DataFrame, params: dict):
+        digest = hashlib.sha256()
+        digest.update(json.dumps({"version": FORMAT_VERSION, "columns": list(data.columns), **params}, sort_keys=True, default=str).encode())
+        digest.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def get(self, key: str):
+        path = os.path.join(self.directory, key)
+
+        try:
+            arrays = [np.load(os.path.join(path, f"{name}.npy"), mmap_mode='c') for name in ARRAYS]
+            with open(os.path.join(path, "scaler.json")) as f:
+                scaler = MinMaxScaler32.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+
+        # Keep the modification time as the last use, for the LRU eviction
+        os.utime(path)
+
+        return (*[torch.from_numpy(array) for array in arrays], scaler)
+
+    def put(self, key: str, dataset: tuple):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, key)
+        staging = tempfile.mkdtemp(dir=self.directory, prefix=".tmp-")
+
+        try:
+            for name, tensor in zip(ARRAYS, dataset[:4]):
+                np.save(os.path.join(staging, f"{name}.npy"), tensor.numpy())
+            with open(os.path.join(staging, "scaler.json"), "w") as f:
+                json.dump(dataset[4].to_dict(), f)
+
+            os.rename(staging, path)
+        except OSError:
+            # Another process stored the same entry first; both are identical
+            shutil.rmtree(staging, ignore_errors=True)
+            if not os.path.isdir(path):
+                raise
+
+        self.__evict()
+
+    def stats(self):
+        entries = self.__entries()
+
+        return {
+            "directory": self.directory,
+            "entries": len(entries),
+            "size_mb": sum(size for _, size, _ in entries) / 2**20,
+            "max_size_mb": self.max_size_mb
+        }
+
+    def __entries(self):
+        if not os.path.isdir(self.directory):
+            return []
+
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.startswith(".") or not os.path.isdir(path):
+                continue
+
+            try:
+                size = sum(entry.stat().st_size for entry in os.scandir(path))
+                entries.append((path, size, os.stat(path).st_mtime))
+            except FileNotFoundError:
+                continue
+
+        return entries
+
+    def __evict(self):
+        with self.__lock:
+            entries = sorted(self.__entries(), key=lambda entry: entry[2])
+            total = sum(size for _, size, _ in entries)
+
+            # Readers keep their memory maps valid: unlinked files stay mapped until closed
+            while entries and total > self.max_size_mb * 2**20:
+                path, size, _ = entries.pop(0)
+                shutil.rmtree(path, ignore_errors=True)
+                total -= size
+
+
+dataset_cache = DatasetCache(
+    directory=os.getenv('DATASET_CACHE_DIR', '/tmp/datasets'),
+    max_size_mb=float(os.getenv('DATASET_CACHE_SIZE_MB', '1024'))
+)
@@ -0,0 +1,89 @@
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+class LSTMStateStore:
+    """
+    In-process LRU store for the recurrent state of stateful predictions.
+
+    Each entry is keyed by (model_id, ticker) and holds the final `(hidden, cell)` state
+    of the LSTM after the last observed bar, together with the bookkeeping needed to
+    advance it (last bar date, steps since warm-up). Callers hold the per-key lock while
+    reading and advancing an entry, so concurrent requests for the same feed never
+    advance the same state twice.
+
+    Attributes:
+        max_size (int): Maximum number of states kept in memory.
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        Initialize the LSTMStateStore.
+
+        Args:
+            max_size (int): Maximum number of states kept in memory (default: 256).
+        """
+        if max_size <= 0:
+            raise ValueError("State store size must be greater than 0.")
+
+        self.max_size = max_size
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__key_locks = {}
+
+    @contextmanager
+    def lock(self, key):
+        # Key locks are refcounted and dropped once no request holds or waits on them,
+        # so feeds that are never seen again do not leave a lock behind
+        with self.__lock:
+            entry = self.__key_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self.__lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self.__key_locks[key]
+
+    def get(self, key):
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                self.__entries.move_to_end(key)
+
+            return entry
+
+    def put(self, key, entry: dict):
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def reset(self, model_id: str = None):
+        with self.__lock:
+            keys = [key for key in self.__entries if model_id is None or key[0] == model_id]
+            for key in keys:
+                del self.__entries[key]
+
+            return len(keys)
+
+    def stats(self):
+        with self.__lock:
+            return {
+                "size": len(self.__entries),
+                "max_size": self.max_size,
+                "keys": [
+                    {"model_id": key[0], "ticker": key[1], "as_of": entry["as_of"].isoformat(), "steps": entry["steps"]}
+                    for key, entry in self.__entries.items()
+                ]
+            }
+
+
+lstm_state_store = LSTMStateStore(max_size=int(os.getenv('LSTM_STATE_STORE_SIZE', '256')))
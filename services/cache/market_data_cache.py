@@ -0,0 +1,162 @@
+import fcntl
+import json
+import os
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+import pandas as pd
+
+
+class MarketDataCache:
+    """
+    Persistent per-ticker market data cache stored as Parquet files.
+
+    Each ticker keeps one Parquet file with its daily bars plus a small JSON sidecar
+    recording the date range already downloaded. Queries inside that range are served
+    from disk; queries extending past it only download the missing head or tail, which
+    is merged into the stored file. Today's bar may still change, so it only counts as
+    covered for `refresh_interval` seconds after it was downloaded. Reads take a shared lock and writes an exclusive lock on a
+    per-ticker lock file, so concurrent workers never observe a partially written file.
+
+    Attributes:
+        directory (str): Directory where the cache files are stored.
+        provider: Market data provider used to download missing bars.
+        refresh_interval (float): Seconds during which today's downloaded bar is reused.
+    """
+
+    def __init__(self, directory: str, provider, refresh_interval: float = 60):
+        """
+        Initialize the MarketDataCache.
+
+        Args:
+            directory (str): Directory where the cache files are stored.
+            provider: Market data provider used to download missing bars.
+            refresh_interval (float): Seconds during which today's downloaded bar is reused (default: 60).
+        """
+        self.directory = directory
+        self.provider = provider
+        self.refresh_interval = refresh_interval
+        os.makedirs(directory, exist_ok=True)
+
+    def history(self, ticker: str, start: str = None, end: str = None, period: str = None):
+        if period:
+            return self.__latest(ticker, int(period.rstrip('d')))
+
+        return self.__range(ticker, pd.Timestamp(start).date(), pd.Timestamp(end).date())
+
+    def __latest(self, ticker, days):
+        # Like yfinance periods, the days are calendar days up to and including today
+        today = date.today()
+
+        return self.__range(ticker, today - timedelta(days=days), today + timedelta(days=1))
+
+    def __range(self, ticker, start, end):
+        with self.__lock(ticker, fcntl.LOCK_SH):
+            data, coverage = self.__read(ticker)
+
+        if coverage is not None and coverage[0] <= start and end <= self.__covered_until(coverage):
+            return self.__slice(data, start, end)
+
+        with self.__lock(ticker, fcntl.LOCK_EX):
+            # Re-read under the exclusive lock: another worker may have refreshed it already
+            data, coverage = self.__read(ticker)
+            data, coverage, changed = self.__refresh(ticker, data, coverage, start, end)
+
+            if changed:
+                self.__write(ticker, data, coverage)
+
+        return self.__slice(data, start, end)
+
+    def __covered_until(self, coverage):
+        # Bars after the covered end do not exist yet while today's bar is still fresh
+        _, coverage_end, refreshed_at = coverage
+        if coverage_end >= date.today() and time.time() - refreshed_at < self.refresh_interval:
+            return date.max
+
+        return coverage_end
+
+    def __refresh(self, ticker, data, coverage, start, end):
+        today = date.today()
+        covered_until = min(end, today)
+        # Only a download reaching today's bar restarts its refresh interval
+        refreshed_at = time.time() if end > today else 0.0
+
+        if coverage is None:
+            return self.__download(ticker, start, end), (start, covered_until, refreshed_at), True
+
+        parts = [data]
+        coverage_start, coverage_end, coverage_refreshed_at = coverage
+
+        if start < coverage_start:
+            parts.append(self.__download(ticker, start, coverage_start))
+            coverage_start = start
+
+        if end > self.__covered_until(coverage):
+            parts.append(self.__download(ticker, coverage_end, end))
+            coverage_end = max(coverage_end, covered_until)
+            coverage_refreshed_at = max(coverage_refreshed_at, refreshed_at)
+
+        if len(parts) == 1:
+            return data, coverage, False
+
+        return self.__merge(parts), (coverage_start, coverage_end, coverage_refreshed_at), True
+
+    def __download(self, ticker, start, end):
+        return self.provider.history(ticker, start=start.isoformat(), end=end.isoformat())
+
+    def __merge(self, parts):
+        parts = [part for part in parts if part is not None and not part.empty]
+        if not parts:
+            return pd.DataFrame()
+
+        data = pd.concat(parts)
+        data = data[~data.index.duplicated(keep='last')]
+        return data.sort_index()
+
+    def __slice(self, data, start, end):
+        if data.empty:
+            return data.copy()
+
+        dates = data.index.tz_localize(None) if data.index.tz is not None else data.index
+        mask = (dates >= pd.Timestamp(start)) & (dates < pd.Timestamp(end))
+        return data[mask].copy()
+
+    def __paths(self, ticker):
+        base = os.path.join(self.directory, ticker.upper())
+        return f"{base}.parquet", f"{base}.json", f"{base}.lock"
+
+    def __read(self, ticker):
+        data_path, coverage_path, _ = self.__paths(ticker)
+
+        if not os.path.exists(coverage_path) or not os.path.exists(data_path):
+            return None, None
+
+        with open(coverage_path) as f:
+            coverage = json.load(f)
+
+        data = pd.read_parquet(data_path)
+        # Sidecars written before the refresh interval existed lack `refreshed_at`
+        return data, (date.fromisoformat(coverage['start']), date.fromisoformat(coverage['end']), coverage.get('refreshed_at', 0.0))
+
+    def __write(self, ticker, data, coverage):
+        data_path, coverage_path, _ = self.__paths(ticker)
+
+        # Write to temporary files and rename, so a crash never leaves a truncated cache
+        data.to_parquet(f"{data_path}.tmp")
+        with open(f"{coverage_path}.tmp", "w") as f:
+            json.dump({"start": coverage[0].isoformat(), "end": coverage[1].isoformat(), "refreshed_at": coverage[2]}, f)
+
+        os.replace(f"{data_path}.tmp", data_path)
+        os.replace(f"{coverage_path}.tmp", coverage_path)
+
+    @contextmanager
+    def __lock(self, ticker, mode):
+        _, _, lock_path = self.__paths(ticker)
+
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, mode)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
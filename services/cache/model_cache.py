@@ -0,0 +1,141 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+class ModelCache:
+    """
+    In-process LRU cache for loaded models.
+
+    Keeps (model, scaler, metadata) triples keyed by model ID so repeated predictions
+    against the same model skip the S3 download and deserialization. Entries are
+    evicted by least recent use once the cache is full and, optionally, after a TTL.
+
+    Attributes:
+        max_size (int): Maximum number of models kept in memory.
+        ttl (float): Seconds an entry stays valid (None disables expiration).
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that required loading the model.
+        evictions (int): Number of entries removed by size or TTL.
+    """
+
+    def __init__(self, max_size: int = 8, ttl: float = None):
+        """
+        Initialize the ModelCache.
+
+        Args:
+            max_size (int): Maximum number of models kept in memory (default: 8).
+            ttl (float, optional): Seconds an entry stays valid (default: None, no expiration).
+        """
+        if max_size <= 0:
+            raise ValueError("Cache size must be greater than 0.")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__loading = {}
+
+    def get_or_load(self, key, loader):
+        entry = self.__get(key)
+        if entry is not None:
+            return entry
+
+        with self.__key_lock(key):
+            # Another thread may have finished loading while we waited for the lock
+            entry = self.__get(key, count=False)
+            if entry is not None:
+                return entry
+
+            model, scaler, metadata = loader()
+            model.eval()
+            self.__put(key, (model, scaler, metadata))
+
+            return model, scaler, metadata
+
+    def invalidate(self, key=None):
+        with self.__lock:
+            if key is None:
+                self.__entries.clear()
+            else:
+                self.__entries.pop(key, None)
+
+    def stats(self):
+        with self.__lock:
+            return {
+                "size": len(self.__entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "keys": [str(key) for key in self.__entries]
+            }
+
+    def __get(self, key, count=True):
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is not None and self.__is_expired(entry):
+                del self.__entries[key]
+                self.evictions += 1
+                entry = None
+
+            if entry is None:
+                if count:
+                    self.misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            if count:
+                self.hits += 1
+
+            return entry[1]
+
+    def __put(self, key, value):
+        with self.__lock:
+            self.__entries[key] = (time.monotonic(), value)
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def __is_expired(self, entry):
+        if self.ttl is None:
+            return False
+
+        return time.monotonic() - entry[0] > self.ttl
+
+    @contextmanager
+    def __key_lock(self, key):
+        # Per-key locks are reference counted and dropped once no request holds or waits
+        # for them, so unknown model IDs never accumulate
+        with self.__lock:
+            entry = self.__loading.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self.__lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self.__loading[key]
+
+
+def _env_ttl():
+    ttl = os.getenv('MODEL_CACHE_TTL')
+    return float(ttl) if ttl else None
+
+
+model_cache = ModelCache(
+    max_size=int(os.getenv('MODEL_CACHE_SIZE', '8')),
+    ttl=_env_ttl()
+)
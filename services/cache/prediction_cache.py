@@ -0,0 +1,270 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+_prediction_cache = None
+_configured = False
+_lock = threading.Lock()
+
+
+class MemoryPredictionBackend:
+    """
+    In-process LRU storage with per-entry expiration for the prediction cache.
+
+    Attributes:
+        max_size (int): Maximum number of entries kept in memory.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Initialize the MemoryPredictionBackend.
+
+        Args:
+            max_size (int): Maximum number of entries kept in memory (default: 1024).
+        """
+        if max_size <= 0:
+            raise ValueError("Prediction cache size must be greater than 0.")
+
+        self.max_size = max_size
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key: str):
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+
+            if entry[0] <= time.monotonic():
+                del self.__entries[key]
+                return None
+
+            self.__entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value, ttl: float):
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + ttl, value)
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def size(self):
+        with self.__lock:
+            return len(self.__entries)
+
+
+class RedisPredictionBackend:
+    """
+    Shared storage for the prediction cache in Redis, so every API process reuses the
+    predictions of the others. Values are stored as JSON with a Redis-side expiration.
+
+    The `redis` package is only imported when this backend is configured. Any client
+    with the `get` and `set(..., px=...)` methods of redis-py can be given instead, e.g.
+    a local stand-in.
+
+    Attributes:
+        client: Redis client used to read and write the entries.
+    """
+
+    def __init__(self, url: str = None, client=None):
+        """
+        Initialize the RedisPredictionBackend.
+
+        Args:
+            url (str, optional): Redis URL, e.g. `redis://localhost:6379/0` (used when no client is given).
+            client (optional): Redis client (default: one built from `url`).
+        """
+        if client is None:
+            if not url:
+                raise ValueError("Redis URL must be provided for the redis prediction cache.")
+
+            import redis
+
+            client = redis.Redis.from_url(url)
+
+        self.client = client
+
+    def get(self, key: str):
+        value = self.client.get(key)
+        return json.loads(value) if value is not None else None
+
+    def set(self, key: str, value, ttl: float):
+        self.client.set(key, json.dumps(value), px=max(1, int(ttl * 1000)))
+
+    def size(self):
+        return None
+
+
+class PredictionCache:
+    """
+    Memoization of prediction results keyed by model, request and last input window.
+
+    Results are stored under the model ID, a digest of the prediction parameters and the
+    version of the inputs returned by `prepare`, built with `inputs_version` from the
+    timestamp of the last bar and a digest of the last window's values. The bar of an
+    open session keeps its timestamp while its prices change, so the values are part of
+    the key and a result is only reused for the exact same inputs. A second, short-lived
+    entry remembers the last version seen for each model and request; while it is valid,
+    repeated calls are answered without fetching market data at all. It expires at the
+    next multiple of `refresh_interval` seconds, aligned with the market data refresh,
+    after which the data is fetched again and the model only runs if the inputs changed.
+    Concurrent identical requests are serialized on a per-key lock and re-check the cache
+    once they get it, so a burst of them triggers a single computation in each process.
+
+    Attributes:
+        backend: Storage for the entries (MemoryPredictionBackend or RedisPredictionBackend).
+        refresh_interval (float): Seconds between market data refreshes.
+        result_ttl (float): Seconds a result stays stored for its inputs.
+        hits (int): Calls answered without fetching market data.
+        refreshes (int): Calls that fetched market data but found the same inputs.
+        misses (int): Calls that ran the model.
+    """
+
+    def __init__(self, backend, refresh_interval: float = 60, result_ttl: float = 86400):
+        """
+        Initialize the PredictionCache.
+
+        Args:
+            backend: Storage for the entries.
+            refresh_interval (float): Seconds between market data refreshes (default: 60).
+            result_ttl (float): Seconds a result stays stored for its inputs (default: 86400).
+        """
+        if refresh_interval <= 0 or result_ttl <= 0:
+            raise ValueError("Prediction cache TTLs must be greater than 0.")
+
+        self.backend = backend
+        self.refresh_interval = refresh_interval
+        self.result_ttl = result_ttl
+        self.hits = 0
+        self.refreshes = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+        self.__key_locks = {}
+
+    def get_or_compute(self, model_id: str, params: dict, prepare, compute):
+        key = self.__key(model_id, params)
+
+        result = self.__latest(key)
+        if result is not None:
+            return result, self.__count("hits", "hit")
+
+        with self.__key_lock(key):
+            # Another request may have stored the result while this one waited
+            result = self.__latest(key)
+            if result is not None:
+                return result, self.__count("hits", "hit")
+
+            version, inputs = prepare()
+            result = self.backend.get(f"{key}:{version}")
+            status = "refresh"
+
+            if result is None:
+                result = compute(inputs)
+                self.backend.set(f"{key}:{version}", result, self.result_ttl)
+                status = "miss"
+
+            self.backend.set(f"{key}:latest", version, self.__refresh_ttl())
+
+            return result, self.__count("refreshes" if status == "refresh" else "misses", status)
+
+    @staticmethod
+    def inputs_version(bar, window):
+        digest = hashlib.sha256(window.tobytes()).hexdigest()[:16]
+        return f"{bar}:{digest}"
+
+    def stats(self):
+        with self.__lock:
+            return {
+                "backend": type(self.backend).__name__,
+                "size": self.backend.size(),
+                "refresh_interval": self.refresh_interval,
+                "result_ttl": self.result_ttl,
+                "hits": self.hits,
+                "refreshes": self.refreshes,
+                "misses": self.misses
+            }
+
+    def __key(self, model_id, params):
+        digest = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()[:16]
+        return f"prediction:{model_id}:{digest}"
+
+    def __latest(self, key):
+        version = self.backend.get(f"{key}:latest")
+        if version is None:
+            return None
+
+        return self.backend.get(f"{key}:{version}")
+
+    def __refresh_ttl(self):
+        # Every entry expires at the same interval boundary, when new bars may be available
+        return max(1.0, self.refresh_interval - time.time() % self.refresh_interval)
+
+    def __count(self, counter, status):
+        with self.__lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+        return status
+
+    @contextmanager
+    def __key_lock(self, key):
+        # Per-key locks are reference counted and dropped once no request holds or waits for them
+        with self.__lock:
+            entry = self.__key_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self.__lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self.__key_locks[key]
+
+
+def get_prediction_cache():
+    """
+    Return the process-wide prediction cache configured from environment variables,
+    or None when it is disabled.
+
+    Environment variables:
+        - PREDICTION_CACHE_BACKEND: `memory` (default), `redis` or `none`
+        - PREDICTION_CACHE_REDIS_URL: Redis URL for the `redis` backend
+        - PREDICTION_CACHE_SIZE: maximum entries of the `memory` backend (default: 1024)
+        - PREDICTION_CACHE_REFRESH_SECONDS: market data refresh interval (default: 60)
+        - PREDICTION_CACHE_RESULT_TTL: seconds a result is kept for its inputs (default: 86400)
+    """
+    global _prediction_cache, _configured
+
+    with _lock:
+        if not _configured:
+            _prediction_cache = _build_prediction_cache()
+            _configured = True
+
+        return _prediction_cache
+
+
+def _build_prediction_cache():
+    name = os.getenv('PREDICTION_CACHE_BACKEND', 'memory')
+
+    if name == 'none':
+        return None
+
+    if name == 'memory':
+        backend = MemoryPredictionBackend(max_size=int(os.getenv('PREDICTION_CACHE_SIZE', '1024')))
+    elif name == 'redis':
+        backend = RedisPredictionBackend(url=os.getenv('PREDICTION_CACHE_REDIS_URL'))
+    else:
+        raise ValueError(f"Unknown prediction cache backend: {name}")
+
+    return PredictionCache(
+        backend=backend,
+        refresh_interval=float(os.getenv('PREDICTION_CACHE_REFRESH_SECONDS', '60')),
+        result_ttl=float(os.getenv('PREDICTION_CACHE_RESULT_TTL', '86400'))
+    )
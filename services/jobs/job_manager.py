@@ -0,0 +1,205 @@
+import multiprocessing
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+
+from services.jobs.train_worker import init_worker
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+class JobManager:
+    """
+    Manager for background jobs executed in a bounded process pool.
+
+    Jobs are submitted to a ProcessPoolExecutor so long trainings neither block API
+    workers nor hold the GIL of the API process. Each job gets a shared progress
+    mapping that the worker updates while running. Submissions are rejected once the
+    number of running plus queued jobs reaches the configured capacity. When a worker
+    dies abruptly (e.g. killed for memory), the pool is broken and its jobs fail; the
+    next submission replaces it with a new pool instead of failing as well.
+
+    Attributes:
+        max_workers (int): Maximum number of jobs running at the same time.
+        max_queue (int): Maximum number of jobs waiting for a free worker.
+        history_size (int): Number of finished jobs kept for status queries.
+    """
+
+    def __init__(self, max_workers: int = 1, max_queue: int = 4, history_size: int = 100):
+        """
+        Initialize the JobManager.
+
+        Args:
+            max_workers (int): Maximum number of jobs running at the same time (default: 1).
+            max_queue (int): Maximum number of jobs waiting for a free worker (default: 4).
+            history_size (int): Number of finished jobs kept for status queries (default: 100).
+        """
+        if max_workers <= 0:
+            raise ValueError("Number of workers must be greater than 0.")
+
+        if max_queue < 0:
+            raise ValueError("Queue size must not be negative.")
+
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.history_size = history_size
+        self.__jobs = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__executor = None
+        self.__manager = None
+
+    def submit(self, fn, payload: dict, kind: str = "train"):
+        with self.__lock:
+            active = sum(1 for job in self.__jobs.values() if not job["future"].done())
+            if active >= self.max_workers + self.max_queue:
+                raise QueueFullError(f"Job queue is full ({active} active jobs). Try again later.")
+
+            self.__start()
+
+            job_id = str(uuid.uuid4())
+            progress = self.__manager.dict({"state": "queued"})
+            job = {
+                "id": job_id,
+                "kind": kind,
+                "created_at": self.__now(),
+                "finished_at": None,
+                "progress": progress,
+                "future": self.__submit(fn, payload, progress)
+            }
+            self.__jobs[job_id] = job
+            self.__trim_history()
+
+        job["future"].add_done_callback(lambda _: self.__finish(job))
+
+        return self.get(job_id)
+
+    def get(self, job_id: str):
+        with self.__lock:
+            job = self.__jobs.get(job_id)
+
+        if job is None:
+            raise FileNotFoundError(f"Job {job_id} Not Found")
+
+        return self.__snapshot(job)
+
+    def stats(self):
+        with self.__lock:
+            futures = [job["future"] for job in self.__jobs.values()]
+
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "active": sum(1 for future in futures if not future.done())
+        }
+
+    def shutdown(self):
+        with self.__lock:
+            if self.__executor is not None:
+                self.__executor.shutdown(wait=False, cancel_futures=True)
+                self.__manager.shutdown()
+                self.__executor = None
+                self.__manager = None
+
+    def __start(self):
+        if self.__executor is not None:
+            return
+
+        # Spawn instead of fork: forking a process that already initialized torch threads can deadlock
+        context = multiprocessing.get_context("spawn")
+        num_threads = max(1, (os.cpu_count() or 1) // self.max_workers)
+
+        # The manager outlives a broken pool, so progress of earlier jobs stays readable
+        if self.__manager is None:
+            self.__manager = context.Manager()
+
+        self.__executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=context,
+            initializer=init_worker,
+            initargs=(num_threads,)
+        )
+
+    def __submit(self, fn, payload, progress):
+        try:
+            return self.__executor.submit(fn, payload, progress)
+        except BrokenProcessPool:
+            self.__restart()
+            return self.__executor.submit(fn, payload, progress)
+
+    def __restart(self):
+        # The broken pool already failed its queued and running jobs; anything it left
+        # pending is cancelled so no job stays queued forever
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+        self.__executor = None
+
+        for job in self.__jobs.values():
+            job["future"].cancel()
+
+        self.__start()
+
+    def __finish(self, job):
+        job["finished_at"] = self.__now()
+
+    def __snapshot(self, job):
+        future = job["future"]
+
+        try:
+            progress = dict(job["progress"])
+        except Exception:
+            # The manager is gone (e.g. during shutdown); report what the future knows
+            progress = {}
+
+        snapshot = {
+            "id": job["id"],
+            "kind": job["kind"],
+            "state": progress.pop("state", "queued"),
+            "created_at": job["created_at"],
+            "finished_at": job["finished_at"],
+            "progress": progress,
+            "result": None,
+            "error": None
+        }
+
+        if future.done():
+            if future.cancelled():
+                snapshot["state"] = "cancelled"
+            elif future.exception() is not None:
+                snapshot["state"] = "failed"
+                snapshot["error"] = str(future.exception())
+            else:
+                snapshot["state"] = "succeeded"
+                snapshot["result"] = future.result()
+
+        return snapshot
+
+    def __trim_history(self):
+        finished = [job_id for job_id, job in self.__jobs.items() if job["future"].done()]
+
+        for job_id in finished[:max(0, len(finished) - self.history_size)]:
+            del self.__jobs[job_id]
+
+    def __now(self):
+        return datetime.now(timezone.utc).isoformat()
+
+
+_job_manager = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager():
+    global _job_manager
+
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager(
+                max_workers=int(os.getenv('TRAIN_MAX_WORKERS', '1')),
+                max_queue=int(os.getenv('TRAIN_MAX_QUEUE', '4'))
+            )
+
+        return _job_manager
@@ -0,0 +1,187 @@
+# Heavy dependencies are imported inside the functions: the API process imports this module
+# only to reference the job functions, and only the worker processes actually run them.
+
+
+# CPU cores assigned to the jobs of this worker process, set when the job pool starts it
+_job_cpus = None
+
+
+def init_worker(num_threads: int):
+    """Limit torch intra-op threads so concurrent trainings do not oversubscribe the CPU."""
+    import torch
+
+    global _job_cpus
+    _job_cpus = num_threads
+    torch.set_num_threads(num_threads)
+
+
+def job_cpu_count():
+    """Return the CPU cores of the current job, shared with the other jobs of the pool, for sizing nested pools."""
+    import os
+
+    return _job_cpus or os.cpu_count() or 1
+
+
+def run_train_job(request: dict, progress):
+    """Run the training pipeline for a queued job inside a worker process."""
+    from schemas.train import TrainModelRequest
+    from services.train.callbacks import ProgressCallback
+    from services.train.pipeline_service import TrainPipelineService
+
+    progress["state"] = "running"
+
+    return TrainPipelineService(
+        request=TrainModelRequest(**request),
+        callbacks=[ProgressCallback(progress)]
+    ).execute()
+
+
+def run_batch_train_job(payload: dict, progress):
+    """Train every request of a batch job, fanning the trainings out to a nested process pool."""
+    from schemas.train import TrainModelRequest
+    from services.train.batch_pipeline_service import BatchTrainPipelineService
+
+    progress["state"] = "running"
+
+    return BatchTrainPipelineService(
+        requests=[TrainModelRequest(**request) for request in payload["requests"]],
+        progress=progress
+    ).execute()
+
+
+def run_update_job(payload: dict, progress):
+    """Fine-tune an existing model on its new data inside a worker process."""
+    from schemas.train import UpdateModelRequest
+    from services.train.callbacks import ProgressCallback
+    from services.train.update_pipeline_service import TrainUpdatePipelineService
+
+    progress["state"] = "running"
+
+    return TrainUpdatePipelineService(
+        model_id=payload["model_id"],
+        request=UpdateModelRequest(**payload["request"]),
+        callbacks=[ProgressCallback(progress)]
+    ).execute()
+
+
+def run_prepared_train(request: dict, dataset: tuple):
+    """Train, evaluate, export and upload one model from a dataset prepared by the parent process."""
+    import time
+
+    from schemas.train import TrainModelRequest
+    from services.train.pipeline_service import TrainPipelineService
+
+    start = time.perf_counter()
+    result = TrainPipelineService(request=TrainModelRequest(**request), dataset=dataset).execute()
+
+    return {**result, "seconds": time.perf_counter() - start}
+
+
+# Fit and validation splits of a hyperparameter search keyed by sequence length, set once per worker
+_tune_datasets = {}
+
+
+def init_tune_worker(num_threads: int, datasets: dict):
+    """Limit torch threads and keep the search datasets in the worker for all of its trials."""
+    init_worker(num_threads)
+    _tune_datasets.update(datasets)
+
+
+def run_tune_trial(params: dict, state: dict, epochs: int):
+    """Train a tuning trial for a number of epochs, resuming from its previous weights if any, and score it on the validation split."""
+    import time
+
+    from models.lightning_lstm_model import LightningLSTM
+    from services.train.train_service import TrainService
+    from services.train.evaluate_service import TrainEvaluateService
+
+    start = time.perf_counter()
+    X_train, y_train, X_val, y_val = _tune_datasets[params["sequence_length"]]
+
+    model = None
+    if state is not None:
+        model = LightningLSTM(
+            input_size=X_train.shape[2],
+            hidden_size=params["hidden_size"],
+            output_size=y_train.shape[1] if y_train.dim() > 1 else 1,
+            num_layers=params["num_layers"],
+            learning_rate=params["learning_rate"]
+        )
+        model.load_state_dict(state)
+
+    train_service = TrainService(
+        X_train=X_train,
+        y_train=y_train,
+        X_test=X_val,
+        y_test=y_val,
+        epochs=epochs,
+        patience=params["patience"],
+        model=model,
+        batch_size=params["batch_size"],
+        learning_rate=params["learning_rate"],
+        hidden_size=params["hidden_size"],
+        num_layers=params["num_layers"]
+    )
+    model = train_service.execute()
+
+    _, val_metrics = TrainEvaluateService(model=model, X_train=X_train, y_train=y_train, X_test=X_val, y_test=y_val).execute()
+
+    return {
+        "state": model.state_dict(),
+        "epochs": len(train_service.training["epochs"]),
+        "val_metrics": val_metrics,
+        "seconds": time.perf_counter() - start
+    }
+
+
+def run_tune_job(request: dict, progress):
+    """Run a hyperparameter search for a queued job, fanning the trials out to a nested process pool."""
+    from schemas.train import TuneModelRequest
+    from services.train.tune_pipeline_service import TrainTunePipelineService
+
+    progress["state"] = "running"
+
+    return TrainTunePipelineService(request=TuneModelRequest(**request), progress=progress).execute()
+
+
+# Preprocessed bars of a backtest, set once per worker and shared by all of its folds
+_backtest_data = {}
+
+
+def init_backtest_worker(num_threads: int, data):
+    """Limit torch threads and keep the backtest bars in the worker for all of its folds."""
+    init_worker(num_threads)
+    _backtest_data["data"] = data
+
+
+def run_backtest_fold(request: dict, fold: dict):
+    """Train and evaluate one walk-forward fold on the bars given to the worker."""
+    import time
+
+    from schemas.train import TrainModelRequest
+    from services.train.backtest_fold_service import TrainBacktestFoldService
+
+    start = time.perf_counter()
+    result = TrainBacktestFoldService(
+        data=_backtest_data["data"],
+        request=TrainModelRequest(**request),
+        train_start=fold["train_start"],
+        test_start=fold["test_start"],
+        test_end=fold["test_end"]
+    ).execute()
+
+    return {**result, "seconds": time.perf_counter() - start}
+
+
+def run_backtest_job(payload: dict, progress):
+    """Run a walk-forward backtest of a model for a queued job, fanning the folds out to a nested process pool."""
+    from schemas.train import BacktestModelRequest
+    from services.train.backtest_pipeline_service import TrainBacktestPipelineService
+
+    progress["state"] = "running"
+
+    return TrainBacktestPipelineService(
+        model_id=payload["model_id"],
+        request=BacktestModelRequest(**payload["request"]),
+        progress=progress
+    ).execute()
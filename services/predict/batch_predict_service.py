@@ -0,0 +1,143 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from services.yfinance_service import YFinanceService, calendar_days
+from services.predict.prepare_data_service import PredictPrepareDataService
+from services.predict.predict_service import PredictService
+from services.predict.stacked_predict_service import StackedPredictService
+
+
+class BatchPredictService:
+    """
+    Service class for making predictions with many models in a single call.
+
+    Models are loaded concurrently, market data is fetched once per ticker and shared
+    between every model trained on that ticker, and models with identical architecture
+    and input shape are evaluated together in one stacked forward pass. Failures are
+    reported per model instead of failing the whole batch.
+
+    Attributes:
+        model_ids (list): Unique identifiers of the models to run.
+        loader: Callable returning (model, scaler, metadata) for a model ID.
+        max_workers (int): Maximum number of concurrent downloads.
+    """
+
+    def __init__(self, model_ids: list, loader, max_workers: int = 8):
+        """
+        Initialize the BatchPredictService.
+
+        Args:
+            model_ids (list): Unique identifiers of the models to run.
+            loader: Callable returning (model, scaler, metadata) for a model ID.
+            max_workers (int): Maximum number of concurrent downloads (default: 8).
+        """
+        self.model_ids = list(dict.fromkeys(model_ids))
+        self.loader = loader
+        self.max_workers = max_workers
+        self.errors = {}
+
+    def execute(self):
+        self.__validate()
+
+        loaded = self.__load_models()
+        market_data = self.__fetch_market_data(loaded)
+        inputs, as_of = self.__prepare_inputs(loaded, market_data)
+        results = self.__predict(loaded, inputs, as_of)
+
+        return {
+            "results": {model_id: results[model_id] for model_id in self.model_ids if model_id in results},
+            "errors": {model_id: self.errors[model_id] for model_id in self.model_ids if model_id in self.errors}
+        }
+
+    def __validate(self):
+        if not self.model_ids:
+            raise ValueError("At least one model ID must be provided.")
+
+    def __map(self, fn, items):
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(items)))) as executor:
+            return list(executor.map(self.__safe(fn), items))
+
+    def __safe(self, fn):
+        def wrapper(item):
+            try:
+                return fn(item), None
+            except Exception as exc:
+                return None, exc
+
+        return wrapper
+
+    def __load_models(self):
+        loaded = {}
+
+        for model_id, (value, error) in zip(self.model_ids, self.__map(self.loader, self.model_ids)):
+            if error is not None:
+                self.errors[model_id] = str(error)
+            else:
+                loaded[model_id] = value
+
+        return loaded
+
+    def __fetch_market_data(self, loaded):
+        rows_by_ticker = defaultdict(int)
+        for model, scaler, metadata in loaded.values():
+            request = metadata['request']
+            rows_by_ticker[request['ticker']] = max(rows_by_ticker[request['ticker']], request['sequence_length'])
+
+        tickers = list(rows_by_ticker)
+        fetched = self.__map(lambda ticker: YFinanceService(ticker=ticker, days=calendar_days(rows_by_ticker[ticker])).execute(), tickers)
+
+        return dict(zip(tickers, fetched))
+
+    def __prepare_inputs(self, loaded, market_data):
+        inputs, as_of = {}, {}
+
+        for model_id, (model, scaler, metadata) in loaded.items():
+            data, error = market_data[metadata['request']['ticker']]
+
+            try:
+                if error is not None:
+                    raise error
+
+                inputs[model_id], as_of[model_id] = PredictPrepareDataService(
+                    metadata=metadata,
+                    scaler=scaler,
+                    data=data.copy()
+                ).execute()
+            except Exception as exc:
+                self.errors[model_id] = str(exc)
+
+        return inputs, as_of
+
+    def __predict(self, loaded, inputs, as_of):
+        groups = defaultdict(list)
+        for model_id, X_predict in inputs.items():
+            model = loaded[model_id][0]
+            signature = StackedPredictService.signature(model)
+            key = (signature, np.shape(X_predict)) if signature is not None else model_id
+            groups[key].append(model_id)
+
+        results = {}
+        for model_ids in groups.values():
+            try:
+                predictions = self.__predict_group(loaded, inputs, model_ids)
+            except Exception as exc:
+                for model_id in model_ids:
+                    self.errors[model_id] = str(exc)
+                continue
+
+            for model_id, prediction in zip(model_ids, predictions):
+                results[model_id] = {"prediction": prediction, "as_of": as_of[model_id]}
+
+        return results
+
+    def __predict_group(self, loaded, inputs, model_ids):
+        if len(model_ids) == 1:
+            model_id = model_ids[0]
+            return [PredictService(model=loaded[model_id][0], X_predict=inputs[model_id]).execute()]
+
+        return StackedPredictService(
+            models=[loaded[model_id][0] for model_id in model_ids],
+            X_predict=[inputs[model_id] for model_id in model_ids]
+        ).execute()
@@ -0,0 +1,124 @@
+import numpy as np
+import torch
+
+METHODS = ["recursive", "direct"]
+MAX_HORIZON = 365
+
+# Columns filled with the predicted price during a recursive rollout; the rest carry their last value
+PRICE_COLUMNS = ["Open", "High", "Low", "Close"]
+DEFAULT_FEATURES = ["Open", "High", "Low", "Close", "Volume"]
+
+# Models are trained to predict the target two bars after the last bar of their window
+# (the row after the next one), so a window ending at bar t forecasts bar t + LEAD
+LEAD = 2
+# Bars before the model's sequence that each input window must carry for the rollout
+HISTORY = LEAD - 1
+
+
+class ForecastService:
+    """
+    Service class for multi-step forecasts with a trained model.
+
+    Two methods are supported. The direct method reads the horizon straight from a model
+    trained with a multi-output head (`output_size > 1`). The recursive method feeds each
+    prediction back as an input row. Since a window ending at bar t predicts bar t + LEAD,
+    the bar right after the window is first predicted from the window ending one bar
+    earlier, which is why every input window carries HISTORY extra leading bars; each later
+    step then predicts the bar LEAD rows past its window, as in training, and the first
+    forecast value is the same bar the direct head and single-step predictions refer to.
+    The rows live in one preallocated tensor of shape
+    (batch, sequence_length + HISTORY + horizon, features), each step runs the model on a
+    view shifted by one row, and the predicted price is scaled in place with the scaler's
+    `scale_` and `min_` vectors, so no DataFrame is rebuilt and the scaler is never called
+    inside the loop. Price columns of a new row receive the predicted value and the
+    remaining columns (e.g. volume) repeat their last observed value.
+
+    Attributes:
+        model: The trained model used for making predictions.
+        X_predict: Scaled input windows of shape (windows, HISTORY + sequence_length, features).
+        scaler: Fitted MinMaxScaler-like scaler exposing `scale_` and `min_`.
+        horizon (int): Number of future steps to predict.
+        method (str): `recursive`, `direct` or None to pick the best one for the model.
+        outputs (int): Number of values the model predicts per window.
+
+    Raises:
+        ValueError: If the horizon or method are invalid for the model.
+    """
+
+    def __init__(self, model, X_predict, scaler, horizon: int = 1, method: str = None, outputs: int = 1):
+        """
+        Initialize the ForecastService.
+
+        Args:
+            model: The trained model used for making predictions.
+            X_predict: Scaled input windows of shape (windows, HISTORY + sequence_length, features).
+            scaler: Fitted MinMaxScaler-like scaler exposing `scale_` and `min_`.
+            horizon (int): Number of future steps to predict (default: 1).
+            method (str, optional): `recursive` or `direct` (default: direct when the model
+                head covers the horizon, recursive otherwise).
+            outputs (int): Number of values the model predicts per window (default: 1).
+        """
+        self.model = model
+        self.X_predict = X_predict
+        self.scaler = scaler
+        self.horizon = horizon
+        self.outputs = outputs
+        self.method = method or ("direct" if outputs >= horizon else "recursive")
+
+    def execute(self):
+        self.__validate()
+
+        with torch.inference_mode():
+            x = torch.from_numpy(np.ascontiguousarray(self.X_predict, dtype=np.float32))
+
+            if self.method == "direct":
+                forecast = self.model(x[:, HISTORY:]).reshape(len(x), -1)[:, :self.horizon]
+            else:
+                forecast = self.__rollout(x)
+
+        return forecast.tolist(), self.method
+
+    def __validate(self):
+        if not (0 < self.horizon <= MAX_HORIZON):
+            raise ValueError(f"Horizon must be between 1 and {MAX_HORIZON}.")
+
+        if self.method not in METHODS:
+            raise ValueError(f"Method must be one of: {', '.join(METHODS)}.")
+
+        if self.method == "direct" and self.horizon > self.outputs:
+            raise ValueError(f"Model was trained with a direct horizon of {self.outputs}; use the recursive method.")
+
+    def __rollout(self, x):
+        batch, length, features = x.shape
+        sequence_length = length - HISTORY
+        scale, offset, columns = self.__price_scaling(x)
+
+        buffer = x.new_empty(batch, length + self.horizon, features)
+        buffer[:, :length] = x
+        forecast = x.new_empty(batch, self.horizon)
+
+        # Step j predicts the row LEAD bars after its window; the first HISTORY steps only
+        # fill the rows between the last observed bar and the first forecast bar
+        for step in range(HISTORY + self.horizon):
+            value = self.model(buffer[:, step:step + sequence_length]).reshape(batch, -1)[:, 0]
+            row = step + sequence_length - 1 + LEAD
+
+            if step >= HISTORY:
+                forecast[:, step - HISTORY] = value
+
+            if row < buffer.shape[1]:
+                buffer[:, row] = buffer[:, row - 1]
+                buffer[:, row, columns] = value[:, None] * scale + offset
+
+        return forecast
+
+    def __price_scaling(self, x):
+        # Scalers fitted without names (or without the attribute at all) use the default order
+        names = getattr(self.scaler, 'feature_names_in_', None)
+        names = list(names) if names is not None else DEFAULT_FEATURES
+        columns = torch.tensor([index for index, name in enumerate(names) if name in PRICE_COLUMNS])
+
+        scale = torch.as_tensor(np.asarray(self.scaler.scale_), dtype=x.dtype, device=x.device)[columns]
+        offset = torch.as_tensor(np.asarray(self.scaler.min_), dtype=x.dtype, device=x.device)[columns]
+
+        return scale, offset, columns.to(x.device)
@@ -1,3 +1,4 @@
+import numpy as np
 import torch
 
 
@@ -25,5 +26,9 @@ class PredictService:
         self.X_predict = X_predict
 
     def execute(self):
-        predicted_value = self.model(torch.tensor(self.X_predict, dtype=torch.float32))
-        return predicted_value.detach().numpy().tolist()
\ No newline at end of file
+        with torch.inference_mode():
+            # Strided windows are materialized once, straight into contiguous float32
+            x = torch.from_numpy(np.ascontiguousarray(self.X_predict, dtype=np.float32))
+            predicted_value = self.model(x)
+
+        return predicted_value.numpy().tolist()
\ No newline at end of file
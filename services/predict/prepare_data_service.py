@@ -1,71 +1,124 @@
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
 from services.preprocess_data_service import PreprocessDataService
-from services.yfinance_service import YFinanceService
+from services.sliding_window_service import SlidingWindowService
+from services.yfinance_service import YFinanceService, calendar_days
+
+MAX_WINDOWS = 1000
 
 class PredictPrepareDataService:
     """
     Service class for preparing data for model prediction.
 
     This class handles the preparation of new data for making predictions using a trained model,
-    including data fetching, preprocessing, and sequence creation.
+    including data fetching, preprocessing, and sequence creation. Only the
+    `sequence_length + history + windows - 1` rows needed for the requested windows are
+    fetched (ending at `as_of` when given, at the latest bar otherwise), the block is
+    scaled once and the windows are returned as a strided float32 view over it, together
+    with the date of the last bar of each window. Each window can start `history` bars
+    before the model's sequence, for consumers that also need the preceding bars.
 
     Attributes:
         metadata (dict): Model metadata containing configuration information.
         scaler: Fitted scaler for feature normalization.
         sequence_length (int): Length of sequences for LSTM input.
         ticker (str): Stock ticker symbol.
+        data (pd.DataFrame): Pre-fetched market data, if any.
+        windows (int): Number of latest windows to build.
+        as_of (str): Date of the last bar of the latest window, if not the latest bar.
+        history (int): Extra bars before the model's sequence in each window.
 
     Raises:
         ValueError: If the input data is insufficient for sequence creation.
     """
 
-    def __init__(self, metadata: dict, scaler: None):
+    def __init__(self, metadata: dict, scaler: None, data: pd.DataFrame = None, windows: int = 1, as_of: str = None, history: int = 0):
         """
         Initialize the PredictPrepareDataService.
 
         Args:
             metadata (dict): Model metadata containing configuration information.
             scaler: Fitted scaler for feature normalization.
+            data (pd.DataFrame, optional): Pre-fetched market data for the model's ticker.
+                When given, no data is downloaded and only the latest windows are used.
+            windows (int): Number of latest windows to build (default: 1).
+            as_of (str, optional): Date in 'YYYY-MM-DD' format; the latest window ends at the
+                last bar on or before it (default: the latest bar).
+            history (int): Extra bars before the model's sequence in each window (default: 0).
         """
         self.metadata = metadata
         self.scaler = scaler
         self.sequence_length = metadata['request']['sequence_length']
         self.ticker = metadata['request']['ticker']
+        self.prefetched = data is not None
+        self.data = data
+        self.windows = windows
+        self.as_of = as_of
+        self.history = history
+        self.window_length = self.sequence_length + history
+        self.rows = self.window_length + windows - 1
 
     def execute(self):
-        self.data = self.__get_yfinance_data()
+        self.__validate_windows()
+
+        if not self.prefetched:
+            self.data = self.__get_yfinance_data()
         self.data = self.__preprocess_data()
 
+        self.__sort_and_trim()
         self.__validate_data()
-    
-        self.__sort_and_remove_date()
-        self.data = self.__scale_data()
 
-        return self.__create_sequences()
+        dates = self.data['Date']
+        features = self.__scale_data(self.data.drop('Date', axis=1))
+
+        X = SlidingWindowService(data=features, sequence_length=self.window_length).execute()
+        as_of = [date.isoformat() for date in dates.iloc[self.window_length - 1:].dt.to_pydatetime()]
+
+        return X, as_of
+
+    def __validate_windows(self):
+        if not (0 < self.windows <= MAX_WINDOWS):
+            raise ValueError(f"Windows must be between 1 and {MAX_WINDOWS}.")
 
     def __get_yfinance_data(self):
-       return YFinanceService(ticker=self.ticker, days=self.sequence_length).execute()
-    
+        # Days are calendar days, so the range is widened to hold the requested rows
+        if self.as_of is None:
+            return YFinanceService(ticker=self.ticker, days=calendar_days(self.rows)).execute()
+
+        as_of = pd.to_datetime(self.as_of)
+        start = as_of - timedelta(days=calendar_days(self.rows))
+
+        return YFinanceService(
+            ticker=self.ticker,
+            start_date=start.strftime('%Y-%m-%d'),
+            end_date=(as_of + timedelta(days=1)).strftime('%Y-%m-%d')
+        ).execute()
+
     def __preprocess_data(self):
         return PreprocessDataService(data=self.data).execute()
 
+    def __sort_and_trim(self):
+        self.data = self.data.sort_values('Date').reset_index(drop=True)
+
+        if self.as_of is not None:
+            dates = self.data['Date'].dt.tz_localize(None) if self.data['Date'].dt.tz is not None else self.data['Date']
+            self.data = self.data[dates < pd.to_datetime(self.as_of) + timedelta(days=1)]
+
+        self.data = self.data.tail(self.rows)
+
     def __validate_data(self):
         if len(self.data) < self.sequence_length:
             raise ValueError("DataFrame must have at least the same sequence length.")
 
-    def __sort_and_remove_date(self):
-        self.data = self.data.sort_values('Date').reset_index(drop=True)
-        self.data = self.data.drop('Date', axis=1)
-
-    def __scale_data(self):
-        if self.scaler is None:
-            self.data
-
-        return self.scaler.transform(self.data)
-    
-    def __create_sequences(self):
-        sequences = []
-        for i in range(len(self.data) - self.sequence_length + 1):
-            sequence = self.data[i:i + self.sequence_length]
-            sequences.append(sequence)
-        
-        return sequences
+        if len(self.data) < self.rows:
+            raise ValueError(f"Not enough data for {self.windows} windows.")
+
+    def __scale_data(self, features):
+        # One transform over the whole block; the windows are views over its rows
+        if self.scaler is not None:
+            features = self.scaler.transform(features)
+
+        return np.asarray(features, dtype=np.float32)
@@ -0,0 +1,101 @@
+import numpy as np
+import torch
+
+
+class StackedPredictService:
+    """
+    Service class for running several LSTM models with identical architecture in one pass.
+
+    The weights of every model are stacked along a leading "model" dimension and the
+    LSTM recurrence is evaluated with batched matrix products, so G models cost one
+    forward pass instead of G separate ones. Models must share the same state_dict
+    layout (input size, hidden size, number of layers and output size) and inputs must
+    share the same shape.
+
+    Attributes:
+        models (list): Models exposing `lstm.*` and `fc.*` parameters in their state_dict.
+        X_predict (list): One input array of shape (windows, sequence_length, features) per model.
+
+    Raises:
+        ValueError: If the models or inputs cannot be stacked.
+    """
+
+    def __init__(self, models: list, X_predict: list):
+        """
+        Initialize the StackedPredictService.
+
+        Args:
+            models (list): Models exposing `lstm.*` and `fc.*` parameters in their state_dict.
+            X_predict (list): One input array of shape (windows, sequence_length, features) per model.
+        """
+        self.models = models
+        self.X_predict = X_predict
+
+    def execute(self):
+        self.__validate()
+
+        states = [model.state_dict() for model in self.models]
+        num_layers = self.__num_layers(states[0])
+
+        with torch.inference_mode():
+            x = torch.from_numpy(np.stack([np.asarray(X, dtype=np.float32) for X in self.X_predict]))
+
+            for layer in range(num_layers):
+                x = self.__run_layer(x, states, layer)
+
+            hidden = x[:, :, -1]
+            weight = torch.stack([state['fc.weight'] for state in states])
+            bias = torch.stack([state['fc.bias'] for state in states])
+            out = torch.baddbmm(bias.unsqueeze(1), hidden, weight.transpose(1, 2))
+
+        return [prediction.squeeze(-1).tolist() for prediction in out]
+
+    @staticmethod
+    def signature(model):
+        state = model.state_dict()
+
+        if any(key.endswith('_reverse') or 'weight_hr' in key for key in state):
+            return None
+
+        return tuple((key, tuple(value.shape)) for key, value in state.items())
+
+    def __validate(self):
+        if not self.models or len(self.models) != len(self.X_predict):
+            raise ValueError("Each model must have exactly one input.")
+
+        signatures = {self.signature(model) for model in self.models}
+        if len(signatures) != 1 or None in signatures:
+            raise ValueError("Models must share the same architecture to be stacked.")
+
+        shapes = {np.shape(X) for X in self.X_predict}
+        if len(shapes) != 1:
+            raise ValueError("Inputs must share the same shape to be stacked.")
+
+    def __num_layers(self, state):
+        return sum(1 for key in state if key.startswith('lstm.weight_ih_l'))
+
+    def __run_layer(self, x, states, layer):
+        # x: (models, batch, seq_len, input_size)
+        w_ih = torch.stack([state[f'lstm.weight_ih_l{layer}'] for state in states]).transpose(1, 2)
+        w_hh = torch.stack([state[f'lstm.weight_hh_l{layer}'] for state in states]).transpose(1, 2)
+        bias = torch.stack([state[f'lstm.bias_ih_l{layer}'] + state[f'lstm.bias_hh_l{layer}'] for state in states])
+
+        models, batch, seq_len, input_size = x.shape
+        hidden_size = w_hh.shape[1]
+
+        # Input projections do not depend on the recurrence, so compute them for all steps at once
+        projected = torch.baddbmm(bias.unsqueeze(1), x.reshape(models, batch * seq_len, input_size), w_ih)
+        projected = projected.view(models, batch, seq_len, 4 * hidden_size)
+
+        h = x.new_zeros(models, batch, hidden_size)
+        c = x.new_zeros(models, batch, hidden_size)
+        outputs = x.new_empty(models, batch, seq_len, hidden_size)
+
+        for t in range(seq_len):
+            gates = torch.baddbmm(projected[:, :, t], h, w_hh)
+            i, f, g, o = gates.chunk(4, dim=-1)
+            c = torch.sigmoid(f) * c + torch.sigmoid(i) * torch.tanh(g)
+            h = torch.sigmoid(o) * torch.tanh(c)
+            outputs[:, :, t] = h
+
+        return outputs
@@ -0,0 +1,183 @@
+import os
+
+import numpy as np
+import torch
+
+from models.lstm_network import LSTMNetwork
+from services.cache.lstm_state_store import lstm_state_store
+from services.preprocess_data_service import PreprocessDataService
+from services.yfinance_service import YFinanceService, calendar_days
+
+
+class StatefulPredictService:
+    """
+    Service class for stateful predictions on a live feed of bars.
+
+    The final LSTM `(hidden, cell)` state is kept per (model_id, ticker). The first call
+    warms it up by running the latest `sequence_length` bars from a zero state; later
+    calls only advance it by the bars published since the previous call, so a new bar
+    costs one LSTM step instead of a full window. Once `max_steps` bars have been
+    absorbed (or when the feed has a gap, the model changed or a reset is requested) the
+    state is warmed up again from the latest window, which bounds how far the prediction
+    drifts from the windowed one the model was trained on. With `verify`, the prediction
+    is checked against a full recomputation over the same bars.
+
+    Attributes:
+        model_id (str): The unique identifier of the model.
+        model: The trained model (eager or TorchScript) exposing `lstm.*` and `fc.*` weights.
+        scaler: Fitted scaler for feature normalization.
+        metadata (dict): Model metadata containing configuration information.
+        reset (bool): Whether to discard the stored state and warm up again.
+        verify (bool): Whether to compare the result with a full recomputation.
+        max_steps (int): Number of steps absorbed before the state is warmed up again.
+    """
+
+    def __init__(self, model_id: str, model, scaler, metadata: dict, reset: bool = False, verify: bool = False, max_steps: int = None, store=None):
+        """
+        Initialize the StatefulPredictService.
+
+        Args:
+            model_id (str): The unique identifier of the model.
+            model: The trained model (eager or TorchScript) exposing `lstm.*` and `fc.*` weights.
+            scaler: Fitted scaler for feature normalization.
+            metadata (dict): Model metadata containing configuration information.
+            reset (bool): Whether to discard the stored state and warm up again (default: False).
+            verify (bool): Whether to compare the result with a full recomputation (default: False).
+            max_steps (int, optional): Number of steps absorbed before the state is warmed up
+                again (default: STATEFUL_MAX_STEPS or the model's sequence length).
+            store (optional): State store (default: the process-wide LSTM state store).
+        """
+        self.model_id = model_id
+        self.model = model
+        self.scaler = scaler
+        self.metadata = metadata
+        self.reset = reset
+        self.verify = verify
+        self.sequence_length = metadata['request']['sequence_length']
+        self.ticker = metadata['request']['ticker']
+        self.max_steps = max_steps or int(os.getenv('STATEFUL_MAX_STEPS') or 0) or self.sequence_length
+        self.store = store or lstm_state_store
+
+    def execute(self):
+        key = (self.model_id, self.ticker)
+
+        with self.store.lock(key):
+            bars = self.__get_bars()
+            entry = None if self.reset else self.store.get(key)
+
+            new_bars = self.__new_bars(entry, bars)
+            warmed_up = new_bars is None
+            if warmed_up:
+                entry = self.__warm_up(bars)
+            elif len(new_bars):
+                entry = self.__advance(entry, new_bars)
+
+            self.store.put(key, entry)
+
+            result = {
+                "prediction": entry["prediction"],
+                "as_of": entry["as_of"].isoformat(),
+                "steps_since_warm_up": entry["steps"],
+                "warmed_up": warmed_up,
+                "bars_processed": self.sequence_length if warmed_up else len(new_bars)
+            }
+
+            if self.verify:
+                result["verification"] = self.__verify(entry, bars)
+
+            return result
+
+    def __get_bars(self):
+        rows = self.sequence_length + self.max_steps
+        data = YFinanceService(ticker=self.ticker, days=calendar_days(rows)).execute()
+        data = PreprocessDataService(data=data).execute()
+        data = data.sort_values('Date').tail(rows).reset_index(drop=True)
+
+        if len(data) < self.sequence_length:
+            raise ValueError("DataFrame must have at least the same sequence length.")
+
+        return data
+
+    def __new_bars(self, entry, bars):
+        # None means the stored state cannot be advanced and a warm-up is needed
+        if entry is None or entry["model"] is not self.model:
+            return None
+
+        dates = bars['Date']
+        if not (dates == entry["as_of"]).any():
+            return None
+
+        new_bars = bars[dates > entry["as_of"]]
+        if entry["steps"] + len(new_bars) > self.max_steps:
+            return None
+
+        return new_bars
+
+    def __warm_up(self, bars):
+        window = bars.tail(self.sequence_length)
+        network = self.__network()
+
+        with torch.inference_mode():
+            _, state = network.lstm(self.__tensor(window))
+
+        return self.__entry(network, state, start=window['Date'].iloc[0], as_of=window['Date'].iloc[-1], steps=0)
+
+    def __advance(self, entry, new_bars):
+        network = entry["network"]
+
+        with torch.inference_mode():
+            _, state = network.lstm(self.__tensor(new_bars), entry["state"])
+
+        return self.__entry(network, state, start=entry["start"], as_of=new_bars['Date'].iloc[-1], steps=entry["steps"] + len(new_bars))
+
+    def __entry(self, network, state, start, as_of, steps):
+        with torch.inference_mode():
+            prediction = network.fc(state[0][-1]).squeeze(-1)
+
+        return {
+            "model": self.model,
+            "network": network,
+            "state": state,
+            "start": start,
+            "as_of": as_of,
+            "steps": steps,
+            "prediction": prediction.tolist()
+        }
+
+    def __verify(self, entry, bars):
+        dates = bars['Date']
+        span = bars[(dates >= entry["start"]) & (dates <= entry["as_of"])]
+        window = span.tail(self.sequence_length)
+
+        with torch.inference_mode():
+            recomputed = entry["network"](self.__tensor(span)).reshape(-1)
+            windowed = entry["network"](self.__tensor(window)).reshape(-1)
+
+        prediction = torch.tensor(entry["prediction"], dtype=recomputed.dtype).reshape(-1)
+        error = float((prediction - recomputed).abs().max())
+
+        return {
+            "recomputed_bars": len(span),
+            "max_abs_error": error,
+            "matches": bool(error <= 1e-4 * max(1.0, float(recomputed.abs().max()))),
+            "window_prediction": windowed.tolist(),
+            "drift_from_window": float((prediction - windowed).abs().max())
+        }
+
+    def __tensor(self, bars):
+        features = self.scaler.transform(bars.drop('Date', axis=1))
+        return torch.from_numpy(np.ascontiguousarray(features, dtype=np.float32)).unsqueeze(0)
+
+    def __network(self):
+        # The recurrent state is only reachable through the eager modules, so TorchScript
+        # graphs and Lightning modules are copied into a plain LSTMNetwork
+        state = self.model.state_dict()
+        network = LSTMNetwork(
+            input_size=state['lstm.weight_ih_l0'].shape[1],
+            hidden_size=state['lstm.weight_hh_l0'].shape[1],
+            output_size=state['fc.weight'].shape[0],
+            num_layers=sum(1 for key in state if key.startswith('lstm.weight_ih_l'))
+        )
+        network.load_state_dict(state)
+
+        return network.eval()
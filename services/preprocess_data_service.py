@@ -25,8 +25,8 @@ class PreprocessDataService:
 
     def execute(self):
         self.__validate_data()
-        self.__remove_nulls()
         self.__select_columns()
+        self.__remove_nulls()
 
         return self.data
 
@@ -35,7 +35,9 @@ class PreprocessDataService:
             raise ValueError("DataFrame must not be empty.")
 
     def __remove_nulls(self):
-        self.data.dropna(inplace=True)
+        # Only the selected columns are checked, and the caller's frame is left untouched
+        if self.data.isna().to_numpy().any():
+            self.data = self.data.dropna()
 
         self.__validate_data()
 
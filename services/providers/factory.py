@@ -0,0 +1,52 @@
+import os
+import threading
+
+from services.cache.market_data_cache import MarketDataCache
+
+_provider = None
+_lock = threading.Lock()
+
+
+def get_market_data_provider():
+    """
+    Return the process-wide market data provider configured from environment variables.
+
+    Environment variables:
+        - MARKET_DATA_PROVIDER: `yfinance` (default) or `fixture`
+        - MARKET_DATA_FIXTURES_DIR: directory with `<TICKER>.csv` files for the fixture provider
+        - MARKET_DATA_CACHE_DIR: on-disk cache directory (default: /tmp/market_data, empty disables it)
+        - MARKET_DATA_REFRESH_SECONDS: seconds during which the cached bar of today is reused (default: 60)
+    """
+    global _provider
+
+    with _lock:
+        if _provider is None:
+            _provider = _build_provider()
+
+        return _provider
+
+
+def _build_provider():
+    name = os.getenv('MARKET_DATA_PROVIDER', 'yfinance')
+
+    # Providers are imported on demand so the fixture backend never loads yfinance
+    if name == 'fixture':
+        from services.providers.fixture_provider import FixtureProvider
+
+        provider = FixtureProvider(directory=os.getenv('MARKET_DATA_FIXTURES_DIR', 'fixtures'))
+    elif name == 'yfinance':
+        from services.providers.yfinance_provider import YFinanceProvider
+
+        provider = YFinanceProvider()
+    else:
+        raise ValueError(f"Unknown market data provider: {name}")
+
+    cache_dir = os.getenv('MARKET_DATA_CACHE_DIR', '/tmp/market_data')
+    if not cache_dir:
+        return provider
+
+    return MarketDataCache(
+        directory=cache_dir,
+        provider=provider,
+        refresh_interval=float(os.getenv('MARKET_DATA_REFRESH_SECONDS') or 60)
+    )
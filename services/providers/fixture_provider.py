@@ -0,0 +1,57 @@
+import os
+from datetime import date, timedelta
+
+import pandas as pd
+
+
+class FixtureProvider:
+    """
+    Market data provider that reads bars from local CSV fixtures.
+
+    Each ticker is read from `<directory>/<TICKER>.csv`, which must contain a `Date`
+    column. As with yfinance, a `period` of `Nd` selects the bars of the last N calendar
+    days. It allows running the pipeline without network access.
+
+    Attributes:
+        directory (str): Directory containing the fixture files.
+
+    Raises:
+        FileNotFoundError: If there is no fixture for the requested ticker.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initialize the FixtureProvider.
+
+        Args:
+            directory (str): Directory containing the fixture files.
+        """
+        self.directory = directory
+
+    def history(self, ticker: str, start: str = None, end: str = None, period: str = None):
+        data = self.__read(ticker)
+
+        dates = data.index.tz_localize(None) if data.index.tz is not None else data.index
+
+        if period:
+            # Like yfinance periods, the days are calendar days up to and including today
+            today = pd.Timestamp(date.today())
+            start = today - timedelta(days=int(period.rstrip('d')))
+            end = today + timedelta(days=1)
+
+        mask = (dates >= pd.to_datetime(start)) & (dates < pd.to_datetime(end))
+        return data[mask]
+
+    def __read(self, ticker):
+        path = os.path.join(self.directory, f"{ticker}.csv")
+
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Fixture for {ticker} Not Found")
+
+        data = pd.read_csv(path)
+        data['Date'] = pd.to_datetime(data['Date'])
+        if data['Date'].dt.tz is None:
+            # Match yfinance, which returns bars localized to the exchange timezone
+            data['Date'] = data['Date'].dt.tz_localize('America/New_York')
+
+        return data.set_index('Date').sort_index()
@@ -0,0 +1,18 @@
+import yfinance as yf
+
+
+class YFinanceProvider:
+    """
+    Market data provider backed by the Yahoo Finance API.
+
+    Providers expose a single `history` method returning a DataFrame indexed by date,
+    so YFinanceService and the market data cache can switch backends transparently.
+    """
+
+    def history(self, ticker: str, start: str = None, end: str = None, period: str = None):
+        yf_ticker = yf.Ticker(ticker)
+
+        if period:
+            return yf_ticker.history(period=period)
+
+        return yf_ticker.history(start=start, end=end)
@@ -0,0 +1,43 @@
+import json
+import uuid
+
+from services.s3.base_service import S3BaseService
+
+
+class S3BacktestUploadService(S3BaseService):
+    """
+    Service class storing a backtest report next to the model it evaluates in AWS S3.
+
+    Reports are written as `models/{model_id}/backtests/{id}.json`, outside the model
+    artifacts, so a model can collect any number of backtests without being re-uploaded.
+
+    Attributes:
+        model_id (str): The unique identifier of the backtested model.
+        report (dict): The backtest report.
+    """
+
+    def __init__(self, model_id: str, report: dict):
+        """
+        Initialize the S3BacktestUploadService.
+
+        Args:
+            model_id (str): The unique identifier of the backtested model.
+            report (dict): The backtest report.
+        """
+        super().__init__()
+        self.model_id = model_id
+        self.report = report
+
+    def execute(self):
+        id = str(uuid.uuid4())
+        self.report["id"] = id
+
+        s3_key = f"models/{self.model_id}/backtests/{id}.json"
+        self.s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key=s3_key,
+            Body=json.dumps(self.report).encode(),
+            ContentType="application/json"
+        )
+
+        return id, f"s3://{self.bucket_name}/{s3_key}"
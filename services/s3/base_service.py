@@ -1,11 +1,50 @@
 import boto3
 import os
+import threading
+
+from botocore.config import Config
+
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """
+    Return the process-wide S3 client, creating it on first use.
+
+    boto3 clients are thread-safe, so a single client (and its connection pool) is
+    shared by every service instead of opening new connections on each request.
+
+    Environment variables:
+        - S3_MAX_POOL_CONNECTIONS: size of the HTTP connection pool (default: 32)
+        - S3_ENDPOINT_URL: custom endpoint, e.g. a local S3 stand-in (optional)
+    """
+    global _s3_client
+
+    with _s3_client_lock:
+        if _s3_client is None:
+            _s3_client = boto3.client(
+                's3',
+                aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+                aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+                aws_session_token=os.getenv('AWS_SESSION_TOKEN'),
+                region_name='us-east-1',
+                endpoint_url=os.getenv('S3_ENDPOINT_URL') or None,
+                config=Config(
+                    max_pool_connections=int(os.getenv('S3_MAX_POOL_CONNECTIONS', '32')),
+                    retries={'max_attempts': 5, 'mode': 'adaptive'},
+                    tcp_keepalive=True
+                )
+            )
+
+        return _s3_client
+
 
 class S3BaseService:
     """
     Base service class for AWS S3 operations.
 
-    This class provides basic S3 client setup using AWS credentials from environment variables.
+    This class provides the shared S3 client configured from environment variables.
     It serves as a base class for more specific S3 operations like upload and download.
 
     Attributes:
@@ -17,18 +56,12 @@ class S3BaseService:
         """
         Initialize the S3BaseService.
 
-        Sets up the S3 client using AWS credentials from environment variables.
+        Uses the process-wide S3 client built from AWS credentials in environment variables.
         Environment variables required:
             - AWS_ACCESS_KEY_ID
             - AWS_SECRET_ACCESS_KEY
             - AWS_SESSION_TOKEN
             - S3_BUCKET_NAME
         """
-        self.s3_client = boto3.client(
-            's3',
-            aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-            aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-            aws_session_token=os.getenv('AWS_SESSION_TOKEN'),
-            region_name='us-east-1'
-        )
+        self.s3_client = get_s3_client()
         self.bucket_name = os.getenv('S3_BUCKET_NAME')
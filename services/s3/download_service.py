@@ -1,9 +1,17 @@
 import torch
 import io
+import os
 import pickle
 import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
+from safetensors.torch import load, load_file
+
+from models.lstm_network import LSTMNetwork
+from models.min_max_scaler import MinMaxScaler32
 from services.s3.base_service import S3BaseService
+from services.s3.model_bundle import ModelBundle
 
 
 class S3DownloadService(S3BaseService):
@@ -12,77 +20,179 @@ class S3DownloadService(S3BaseService):
 
     This service handles the retrieval of trained models, scalers, and metadata from S3
     using a model ID. It manages the downloading and instantiation of all model components.
+    Models stored as safetensors are rebuilt as a plain LSTMNetwork (so serving never imports
+    PyTorch Lightning) from the hyperparameters in the metadata and their weights are
+    memory-mapped; legacy pickled `model.pth` artifacts are still supported.
+    When a compiled model is requested and a TorchScript export exists, that graph is
+    returned instead of the eager model. Artifact keys follow a fixed layout and are read
+    from the manifest in the metadata, so the bucket is only listed for older models.
+    Both the separate-files layout and the single `model.bundle` layout are supported; the
+    configured layout is tried first.
 
     Attributes:
         id (str): The unique identifier of the model to download.
+        compiled (bool): Whether to prefer the TorchScript export when available.
 
     Raises:
         FileNotFoundError: If the model files are not found in S3.
     """
 
-    def __init__(self, id):
+    def __init__(self, id, compiled: bool = False):
         """
         Initialize the S3DownloadService.
 
         Args:
             id (str): The unique identifier of the model to download.
+            compiled (bool): Whether to prefer the TorchScript export when available (default: False).
         """
         super().__init__()
         self.id = id
-    
+        self.compiled = compiled
+
     def execute(self):
-        s3_path = self.__s3_path()
-        files = self.__find_path(s3_path)
+        for layout in self.__layouts():
+            try:
+                if layout == "bundle":
+                    file = self.__get_file(self.__key("model.bundle"))
+                else:
+                    file = self.__get_file(self.__key("metadata.json"))
+            except FileNotFoundError:
+                continue
+
+            if layout == "bundle":
+                return self.__load_bundle(file)
 
-        model_file_path = self.__find_file(files, "model.pth", required=True)
-        scaler_file_path = self.__find_file(files, "scaler.pkl")
-        metadata_file_path = self.__find_file(files, "metadata.json", required=True)
+            return self.__load_files(file)
 
-        model = self.__instantiate_model(model_file_path)
-        scaler = self.__instantiate_scaler(scaler_file_path)
-        metadata = self.__instantiate_metadata(metadata_file_path)
+        raise FileNotFoundError("Model Not Found")
 
-        return model, scaler, metadata
+    def __layouts(self):
+        if os.getenv('MODEL_ARTIFACT_LAYOUT', 'files') == "bundle":
+            return ["bundle", "files"]
+
+        return ["files", "bundle"]
 
     def __s3_path(self):
         return f"models/{self.id}"
 
+    def __key(self, file_name):
+        if file_name is None:
+            return None
+
+        return f"{self.__s3_path()}/{file_name}"
+
+    def __load_files(self, metadata_file):
+        metadata = json.load(metadata_file['Body'])
+        artifacts = metadata.get("artifacts") or self.__discover_artifacts()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            model_future = executor.submit(self.__instantiate_any_model, artifacts, metadata)
+            scaler_future = executor.submit(self.__instantiate_scaler, self.__key(artifacts.get("scaler")))
+
+            return model_future.result(), scaler_future.result() or self.__metadata_scaler(metadata), metadata
+
+    def __load_bundle(self, bundle_file):
+        data = bundle_file['Body'].read()
+        header = ModelBundle.read_header(data)
+
+        metadata = json.loads(bytes(ModelBundle.read_entry(data, header, "metadata.json")))
+        compiled = ModelBundle.read_entry(data, header, "model.torchscript.pt")
+        weights = ModelBundle.read_entry(data, header, "model.safetensors")
+        scaler = ModelBundle.read_entry(data, header, "scaler.pkl")
+
+        if self.compiled and compiled is not None:
+            model = torch.jit.load(io.BytesIO(compiled), map_location=torch.device('cpu'))
+        elif weights is not None:
+            model = self.__build_model(metadata, load(bytes(weights)))
+        else:
+            raise FileNotFoundError(f"model.safetensors Not Found in {self.id}")
+
+        return model, pickle.loads(scaler) if scaler is not None else self.__metadata_scaler(metadata), metadata
+
+    def __discover_artifacts(self):
+        # Models uploaded before the artifact manifest existed need a LIST to find their files
+        files = self.__find_path(self.__s3_path())
+
+        return {
+            "weights": self.__find_file(files, "model.safetensors"),
+            "compiled": self.__find_file(files, "model.torchscript.pt"),
+            "model": self.__find_file(files, "model.pth"),
+            "scaler": self.__find_file(files, "scaler.pkl")
+        }
+
     def __find_path(self, s3_path):
         response = self.s3_client.list_objects_v2(
             Bucket=self.bucket_name,
-            Prefix=s3_path
+            Prefix=f"{s3_path}/"
         )
 
         if 'Contents' in response:
             return response['Contents']
         else:
             raise FileNotFoundError("Model Not Found")
-        
-    def __find_file(self, files, file_name, required=False):
+
+    def __find_file(self, files, file_name):
         for file in files:
             if file['Key'].endswith(file_name):
-                return file['Key']
-            
-        if required:
-            raise FileNotFoundError(f"{file_name} Not Found in {self.id}")
+                return os.path.basename(file['Key'])
 
         return None
-        
+
+    def __instantiate_any_model(self, artifacts, metadata):
+        if self.compiled and artifacts.get("compiled"):
+            return self.__instantiate_compiled_model(self.__key(artifacts["compiled"]))
+
+        if artifacts.get("weights"):
+            return self.__instantiate_model_from_weights(self.__key(artifacts["weights"]), metadata)
+
+        if artifacts.get("model"):
+            return self.__instantiate_model(self.__key(artifacts["model"]))
+
+        raise FileNotFoundError(f"model.pth Not Found in {self.id}")
+
     def __instantiate_model(self, model_file_path):
         file = self.__get_file(model_file_path)
         buffer = io.BytesIO(file['Body'].read())
         return torch.load(buffer, map_location=torch.device('cpu'), weights_only=False)
 
+    def __instantiate_compiled_model(self, compiled_file_path):
+        file = self.__get_file(compiled_file_path)
+        buffer = io.BytesIO(file['Body'].read())
+        return torch.jit.load(buffer, map_location=torch.device('cpu'))
+
+    def __instantiate_model_from_weights(self, weights_file_path, metadata):
+        with tempfile.TemporaryDirectory() as directory:
+            local_path = os.path.join(directory, "model.safetensors")
+            file = self.__get_file(weights_file_path)
+            with open(local_path, "wb") as f:
+                for chunk in file['Body'].iter_chunks(chunk_size=1024 * 1024):
+                    f.write(chunk)
+
+            # Tensors are read from a memory-mapped file and adopted as parameters without another copy
+            return self.__build_model(metadata, load_file(local_path))
+
+    def __build_model(self, metadata, state_dict):
+        # Build on the meta device to skip random initialization; the real weights are assigned below
+        with torch.device("meta"):
+            model = LSTMNetwork.from_hparams(metadata["model"]["hparams"])
+
+        model.load_state_dict(state_dict, assign=True)
+        return model
+
     def __get_file(self, file_path):
-        return self.s3_client.get_object(Bucket=self.bucket_name, Key=file_path)
-        
+        try:
+            return self.s3_client.get_object(Bucket=self.bucket_name, Key=file_path)
+        except self.s3_client.exceptions.NoSuchKey:
+            raise FileNotFoundError("Model Not Found")
+
+    def __metadata_scaler(self, metadata):
+        # Models trained before the float32 scaler keep a pickled scikit-learn scaler instead
+        scaler = metadata.get("scaler")
+        return MinMaxScaler32.from_dict(scaler) if isinstance(scaler, dict) else None
+
     def __instantiate_scaler(self, scaler_file_path):
         if scaler_file_path is None:
             return None
 
         file = self.__get_file(scaler_file_path)
         return pickle.load(file['Body'])
-
-    def __instantiate_metadata(self, metadata_file_path):
-        file = self.__get_file(metadata_file_path)
-        return json.load(file['Body'])
\ No newline at end of file
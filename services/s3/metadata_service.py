@@ -0,0 +1,76 @@
+import json
+import os
+
+from services.s3.base_service import S3BaseService
+from services.s3.model_bundle import ModelBundle
+
+HEAD_BYTES = 64 * 1024
+
+
+class S3MetadataService(S3BaseService):
+    """
+    Service class for reading only the metadata of a trained model from AWS S3.
+
+    For the separate-files layout this is a single GET of `metadata.json`. For the bundle
+    layout the head of `model.bundle` is read with a ranged GET, which covers the manifest
+    and, almost always, the metadata entry, so the weight bytes are never downloaded.
+
+    Attributes:
+        id (str): The unique identifier of the model.
+
+    Raises:
+        FileNotFoundError: If the model is not found in S3.
+    """
+
+    def __init__(self, id):
+        """
+        Initialize the S3MetadataService.
+
+        Args:
+            id (str): The unique identifier of the model.
+        """
+        super().__init__()
+        self.id = id
+
+    def execute(self):
+        for layout in self.__layouts():
+            try:
+                if layout == "bundle":
+                    return self.__read_bundle_metadata()
+
+                return json.load(self.__get_range("metadata.json")['Body'])
+            except FileNotFoundError:
+                continue
+
+        raise FileNotFoundError("Model Not Found")
+
+    def __layouts(self):
+        if os.getenv('MODEL_ARTIFACT_LAYOUT', 'files') == "bundle":
+            return ["bundle", "files"]
+
+        return ["files", "bundle"]
+
+    def __read_bundle_metadata(self):
+        head = self.__get_range("model.bundle", 0, HEAD_BYTES - 1)['Body'].read()
+
+        header_length = ModelBundle.header_length(head)
+        if header_length > len(head):
+            head += self.__get_range("model.bundle", len(head), header_length - 1)['Body'].read()
+
+        entry = ModelBundle.read_header(head)["entries"]["metadata.json"]
+        start, end = entry["offset"], entry["offset"] + entry["length"]
+
+        if end <= len(head):
+            return json.loads(head[start:end])
+
+        return json.loads(self.__get_range("model.bundle", start, end - 1)['Body'].read())
+
+    def __get_range(self, file_name, start=None, end=None):
+        arguments = {"Bucket": self.bucket_name, "Key": f"models/{self.id}/{file_name}"}
+        if start is not None:
+            arguments["Range"] = f"bytes={start}-{end}"
+
+        try:
+            return self.s3_client.get_object(**arguments)
+        except self.s3_client.exceptions.NoSuchKey:
+            raise FileNotFoundError("Model Not Found")
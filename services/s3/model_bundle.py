@@ -0,0 +1,90 @@
+import json
+import os
+import struct
+
+MAGIC = b"LSTMBNDL"
+VERSION = 1
+ALIGNMENT = 64
+
+# magic (8 bytes), format version (uint16), header length (uint32), little-endian
+PREFIX = struct.Struct("<8sHI")
+
+# Small entries go first, so a single ranged read of the head usually covers header and metadata
+ENTRY_ORDER = ["metadata.json", "scaler.pkl", "model.torchscript.pt", "model.safetensors"]
+
+
+class ModelBundle:
+    """
+    Single-file container for all artifacts of a model.
+
+    The file starts with a fixed prefix and a JSON manifest giving the offset and length
+    of every entry, followed by the uncompressed entries themselves, each aligned to 64
+    bytes. The manifest and the metadata can therefore be read with a ranged request of
+    the head of the file, without touching the weight bytes.
+    """
+
+    @staticmethod
+    def pack(files: dict, output_path: str):
+        names = sorted(files, key=lambda name: ENTRY_ORDER.index(name) if name in ENTRY_ORDER else len(ENTRY_ORDER))
+        sizes = {name: os.path.getsize(files[name]) for name in names}
+
+        # Offsets depend on the header length, which depends on the offsets; iterate until stable
+        header_length = 0
+        while True:
+            entries = ModelBundle.__layout(names, sizes, PREFIX.size + header_length)
+            header = json.dumps({"version": VERSION, "entries": entries}).encode()
+            if len(header) == header_length:
+                break
+            header_length = len(header)
+
+        with open(output_path, "wb") as out:
+            out.write(PREFIX.pack(MAGIC, VERSION, len(header)))
+            out.write(header)
+
+            for name in names:
+                out.write(b"\0" * (entries[name]["offset"] - out.tell()))
+                with open(files[name], "rb") as f:
+                    while chunk := f.read(1024 * 1024):
+                        out.write(chunk)
+
+        return output_path
+
+    @staticmethod
+    def header_length(prefix: bytes):
+        magic, version, length = PREFIX.unpack_from(prefix)
+
+        if magic != MAGIC:
+            raise ValueError("Invalid model bundle.")
+
+        if version != VERSION:
+            raise ValueError(f"Unsupported model bundle version: {version}.")
+
+        return PREFIX.size + length
+
+    @staticmethod
+    def read_header(data: bytes):
+        end = ModelBundle.header_length(data)
+
+        if len(data) < end:
+            raise ValueError("Model bundle header is truncated.")
+
+        return json.loads(bytes(data[PREFIX.size:end]))
+
+    @staticmethod
+    def read_entry(data: bytes, header: dict, name: str):
+        entry = header["entries"].get(name)
+        if entry is None:
+            return None
+
+        return memoryview(data)[entry["offset"]:entry["offset"] + entry["length"]]
+
+    @staticmethod
+    def __layout(names, sizes, offset):
+        entries = {}
+
+        for name in names:
+            offset = -(-offset // ALIGNMENT) * ALIGNMENT
+            entries[name] = {"offset": offset, "length": sizes[name]}
+            offset += sizes[name]
+
+        return entries
@@ -0,0 +1,48 @@
+import json
+
+# Outside the models/ prefix, so it never shows up among the files of a model
+INDEX_KEY = "registry/index.json"
+VERSION = 1
+
+
+class RegistryIndex:
+    """
+    Compact index of the trained models, kept as a single JSON document in S3.
+
+    The document maps every model ID to a small entry with the fields used to find
+    models (ticker, target column, sequence length, creation time and test metrics), so
+    listing models takes one GET instead of reading the metadata of every model.
+    """
+
+    @staticmethod
+    def entry(id: str, metadata: dict):
+        request = metadata.get("request", {})
+        test_metrics = metadata.get("test_metrics") or {}
+
+        return {
+            "id": id,
+            "ticker": request.get("ticker"),
+            "target_column": request.get("target_column"),
+            "sequence_length": request.get("sequence_length"),
+            "horizon": request.get("horizon", 1),
+            "start_date": request.get("start_date"),
+            "end_date": request.get("end_date"),
+            "created_at": metadata.get("created_at"),
+            "test_rmse": test_metrics.get("rmse"),
+            "test_metrics": test_metrics,
+            "parent_id": metadata.get("parent_id"),
+            "version": metadata.get("version", 1)
+        }
+
+    @staticmethod
+    def read(s3_client, bucket_name: str):
+        try:
+            response = s3_client.get_object(Bucket=bucket_name, Key=INDEX_KEY)
+        except s3_client.exceptions.NoSuchKey:
+            return {"version": VERSION, "models": {}}, None
+
+        return json.load(response['Body']), response['ETag']
+
+    @staticmethod
+    def dump(index: dict):
+        return json.dumps(index, separators=(",", ":")).encode()
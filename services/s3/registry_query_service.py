@@ -0,0 +1,112 @@
+from datetime import datetime, timezone
+
+from services.s3.base_service import S3BaseService
+from services.s3.registry_index import RegistryIndex
+
+SORT_FIELDS = ("created_at", "test_rmse")
+
+
+class S3RegistryQueryService(S3BaseService):
+    """
+    Service class listing trained models from the registry index in AWS S3.
+
+    The whole index is read with a single GET and filtered in memory by ticker, target
+    column, sequence length and creation time, then sorted by creation time or test RMSE.
+    Models missing the sort field (e.g. without test metrics) always come last.
+
+    Attributes:
+        ticker (str): Only models trained on this ticker (case-insensitive), if given.
+        target_column (str): Only models predicting this column, if given.
+        sequence_length (int): Only models with this sequence length, if given.
+        created_after (str): Only models created at or after this ISO date or datetime, if given.
+        created_before (str): Only models created before this ISO date or datetime, if given.
+        sort_by (str): Field used to sort the models, `created_at` or `test_rmse`.
+        descending (bool): Whether to sort from the highest value.
+        limit (int): Maximum number of models returned.
+
+    Raises:
+        ValueError: If the sort field, limit or dates are invalid.
+    """
+
+    def __init__(self, ticker: str = None, target_column: str = None, sequence_length: int = None, created_after: str = None, created_before: str = None,
+                 sort_by: str = "created_at", descending: bool = True, limit: int = 100):
+        """
+        Initialize the S3RegistryQueryService.
+
+        Args:
+            ticker (str, optional): Only models trained on this ticker (case-insensitive).
+            target_column (str, optional): Only models predicting this column.
+            sequence_length (int, optional): Only models with this sequence length.
+            created_after (str, optional): Only models created at or after this ISO date or datetime.
+            created_before (str, optional): Only models created before this ISO date or datetime.
+            sort_by (str): Field used to sort the models, `created_at` or `test_rmse` (default: created_at).
+            descending (bool): Whether to sort from the highest value (default: True).
+            limit (int): Maximum number of models returned (default: 100).
+        """
+        super().__init__()
+        self.ticker = ticker
+        self.target_column = target_column
+        self.sequence_length = sequence_length
+        self.created_after = created_after
+        self.created_before = created_before
+        self.sort_by = sort_by
+        self.descending = descending
+        self.limit = limit
+
+    def execute(self):
+        self.__validate()
+
+        created_after = self.__parse_date(self.created_after)
+        created_before = self.__parse_date(self.created_before)
+
+        index, _ = RegistryIndex.read(self.s3_client, self.bucket_name)
+        models = [entry for entry in index["models"].values() if self.__matches(entry, created_after, created_before)]
+
+        present = [entry for entry in models if entry.get(self.sort_by) is not None]
+        missing = [entry for entry in models if entry.get(self.sort_by) is None]
+        present.sort(key=lambda entry: entry[self.sort_by], reverse=self.descending)
+
+        return {
+            "total": len(models),
+            "models": (present + missing)[:self.limit]
+        }
+
+    def __validate(self):
+        if self.sort_by not in SORT_FIELDS:
+            raise ValueError(f"Sort field must be one of: {', '.join(SORT_FIELDS)}.")
+
+        if self.limit <= 0:
+            raise ValueError("Limit must be greater than 0.")
+
+    def __parse_date(self, value):
+        if value is None:
+            return None
+
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            raise ValueError(f"Invalid date: {value}. Use the ISO format (YYYY-MM-DD).")
+
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+    def __matches(self, entry, created_after, created_before):
+        if self.ticker and (entry.get("ticker") or "").upper() != self.ticker.upper():
+            return False
+
+        if self.target_column and entry.get("target_column") != self.target_column:
+            return False
+
+        if self.sequence_length is not None and entry.get("sequence_length") != self.sequence_length:
+            return False
+
+        if created_after or created_before:
+            if not entry.get("created_at"):
+                return False
+
+            created_at = datetime.fromisoformat(entry["created_at"])
+            if created_after and created_at < created_after:
+                return False
+            if created_before and created_at >= created_before:
+                return False
+
+        return True
@@ -0,0 +1,76 @@
+import random
+import time
+
+from botocore.exceptions import ClientError
+
+from services.s3.base_service import S3BaseService
+from services.s3.registry_index import RegistryIndex, INDEX_KEY
+
+# Error codes of a conditional write that lost the race against another writer
+CONFLICT_CODES = ("PreconditionFailed", "ConditionalRequestConflict")
+
+
+class S3RegistryUpdateService(S3BaseService):
+    """
+    Service class adding a model to the registry index in AWS S3.
+
+    The index is updated with a read-modify-write guarded by a conditional PUT: the new
+    document is only written if the index still has the ETag that was read (or, for the
+    first model, if no index exists yet). When another upload changed the index in the
+    meantime, the write is rejected and retried on the fresh document after a short,
+    randomized backoff, so concurrent uploads never drop each other's entries.
+
+    Attributes:
+        id (str): The unique identifier of the model.
+        metadata (dict): The metadata of the model.
+        max_attempts (int): Number of conditional writes tried before giving up.
+
+    Raises:
+        RuntimeError: If the index keeps changing during every attempt.
+    """
+
+    def __init__(self, id: str, metadata: dict, max_attempts: int = 8):
+        """
+        Initialize the S3RegistryUpdateService.
+
+        Args:
+            id (str): The unique identifier of the model.
+            metadata (dict): The metadata of the model.
+            max_attempts (int): Number of conditional writes tried before giving up (default: 8).
+        """
+        super().__init__()
+        self.id = id
+        self.metadata = metadata
+        self.max_attempts = max_attempts
+
+    def execute(self):
+        entry = RegistryIndex.entry(self.id, self.metadata)
+
+        for attempt in range(self.max_attempts):
+            index, etag = RegistryIndex.read(self.s3_client, self.bucket_name)
+            index["models"][self.id] = entry
+
+            if self.__put(index, etag):
+                return entry
+
+            time.sleep(random.uniform(0, 0.05 * 2 ** attempt))
+
+        raise RuntimeError(f"Could not register model {self.id}: the registry index kept changing.")
+
+    def __put(self, index, etag):
+        condition = {"IfMatch": etag} if etag else {"IfNoneMatch": "*"}
+
+        try:
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=INDEX_KEY,
+                Body=RegistryIndex.dump(index),
+                ContentType="application/json",
+                **condition
+            )
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in CONFLICT_CODES:
+                return False
+            raise
+
+        return True
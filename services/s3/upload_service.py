@@ -1,10 +1,16 @@
 import uuid
-import torch
 import os
 import pickle
 import json
+import torch
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from safetensors.torch import save_file
 
 from services.s3.base_service import S3BaseService
+from services.s3.model_bundle import ModelBundle
+from services.s3.registry_update_service import S3RegistryUpdateService
 
 class S3UploadService(S3BaseService):
     """
@@ -12,14 +18,25 @@ class S3UploadService(S3BaseService):
 
     This service handles the upload of trained models, scalers, and metadata to S3.
     It creates a unique ID for each model and manages the storage structure in S3.
+    Model weights are stored as a safetensors file and the hyperparameters needed
+    to rebuild the model are recorded in the metadata, together with a manifest of the
+    artifact file names so downloads never need to list the bucket. Artifacts are
+    uploaded concurrently and the metadata last, so its presence means the set is complete.
+    With the `bundle` layout, all artifacts are packed into a single `model.bundle` object.
+    Once the artifacts are stored, the model is added to the registry index used to list
+    and look up models. The model is already loadable by its ID at that point, so a
+    failed registry update is reported in `warnings` instead of failing the upload.
 
     Attributes:
         model: The trained model to upload.
         scaler: The fitted scaler used for data preprocessing.
         metadata (dict): Additional metadata about the model and training process.
+        compiled_model: Optional TorchScript export of the model used for serving.
+        layout (str): Artifact layout, `files` or `bundle`.
+        warnings (list): Non-fatal problems of the last upload, such as a failed registry update.
     """
 
-    def __init__(self, model, scaler, metadata: dict):
+    def __init__(self, model, scaler, metadata: dict, compiled_model=None, layout: str = None):
         """
         Initialize the S3UploadService.
 
@@ -27,24 +44,49 @@ class S3UploadService(S3BaseService):
             model: The trained model to upload.
             scaler: The fitted scaler used for data preprocessing.
             metadata (dict): Additional metadata about the model and training process.
+            compiled_model (optional): TorchScript export of the model used for serving.
+            layout (str, optional): Artifact layout, `files` or `bundle`
+                (default: MODEL_ARTIFACT_LAYOUT environment variable, or `files`).
         """
         super().__init__()
         self.model = model
         self.scaler = scaler
         self.metadata = metadata
+        self.compiled_model = compiled_model
+        self.layout = layout or os.getenv('MODEL_ARTIFACT_LAYOUT', 'files')
+        self.warnings = []
        
 
     def execute(self):
         id = str(uuid.uuid4())
         train_path = self.__train_path(id)
 
-        model_path, scaler_path, metadata_path = self.__save_files(train_path)
-        model_s3_path, scaler_s3_path, metadata_s3_path = self.__upload_files(model_path, scaler_path, metadata_path, id)
+        self.metadata["model"] = self.__model_metadata()
+        self.metadata["created_at"] = datetime.now(timezone.utc).isoformat()
+
+        self.__validate_layout()
+
+        model_path, compiled_path, scaler_path, metadata_path = self.__save_files(train_path)
+
+        if self.layout == "bundle":
+            model_s3_path, scaler_s3_path, metadata_s3_path = self.__upload_bundle(model_path, compiled_path, scaler_path, metadata_path, id)
+        else:
+            model_s3_path, scaler_s3_path, metadata_s3_path = self.__upload_files(model_path, compiled_path, scaler_path, metadata_path, id)
 
         self.__exclude_files(train_path)
 
+        try:
+            S3RegistryUpdateService(id=id, metadata=self.metadata).execute()
+        except Exception as error:
+            # Listings miss the model until it is registered again, but it can be used by ID
+            self.warnings.append(f"Model {id} was not added to the registry index: {error}")
+
         return id, model_s3_path, scaler_s3_path, metadata_s3_path
 
+    def __validate_layout(self):
+        if self.layout not in ("files", "bundle"):
+            raise ValueError("Artifact layout must be 'files' or 'bundle'.")
+
     def __train_path(self, id):
         return f"/tmp/models/repository/{id}"
     
@@ -52,19 +94,55 @@ class S3UploadService(S3BaseService):
         os.makedirs(train_path, exist_ok=True)
 
         model_path = self.__save_model(train_path)
+        compiled_path = self.__save_compiled_model(train_path)
         scaler_path = self.__save_scaler(train_path)
+
+        self.metadata["artifacts"] = self.__artifacts_manifest(model_path, compiled_path, scaler_path)
         metadata_path = self.__save_metadata(train_path)      
         
-        return model_path, scaler_path, metadata_path
+        return model_path, compiled_path, scaler_path, metadata_path
+
+    def __artifacts_manifest(self, model_path, compiled_path, scaler_path):
+        return {
+            "layout": self.layout,
+            "weights": os.path.basename(model_path),
+            "compiled": os.path.basename(compiled_path) if compiled_path else None,
+            "scaler": os.path.basename(scaler_path) if scaler_path else None,
+            "metadata": "metadata.json"
+        }
     
+    def __model_metadata(self):
+        return {
+            "class": type(self.model).__name__,
+            "format": "safetensors",
+            "compiled": "torchscript" if self.compiled_model is not None else None,
+            "hparams": dict(self.model.hparams)
+        }
+
     def __save_model(self, train_path):
-        model_path = os.path.join(train_path, "model.pth")
-        torch.save(self.model, model_path)
+        model_path = os.path.join(train_path, "model.safetensors")
+        state_dict = {key: value.detach().contiguous() for key, value in self.model.state_dict().items()}
+        save_file(state_dict, model_path)
 
         return model_path
     
+    def __save_compiled_model(self, train_path):
+        if self.compiled_model is None:
+            return None
+
+        compiled_path = os.path.join(train_path, "model.torchscript.pt")
+        torch.jit.save(self.compiled_model, compiled_path)
+
+        return compiled_path
+
     def __save_scaler(self, train_path):
+        # Serializable scalers travel in the metadata as plain vectors instead of a pickle
+        if hasattr(self.scaler, "to_dict"):
+            self.metadata["scaler"] = self.scaler.to_dict()
+            return None
+
         if self.scaler is not None:
+            self.metadata["scaler"] = type(self.scaler).__name__
             scaler_path = os.path.join(train_path, "scaler.pkl")
             with open(scaler_path, "wb") as f:
                 pickle.dump(self.scaler, f)
@@ -79,16 +157,25 @@ class S3UploadService(S3BaseService):
 
         return metadata_path
     
-    def __upload_files(self, model_path, scaler_path, metadata_path, id):
-        model_s3_path = self.__upload_to_s3(model_path, id)
-        metadata_s3_path = self.__upload_to_s3(metadata_path, id)
+    def __upload_files(self, model_path, compiled_path, scaler_path, metadata_path, id):
+        paths = [model_path, compiled_path, scaler_path]
 
-        scaler_s3_path = None
-        if scaler_path is not None:
-            scaler_s3_path = self.__upload_to_s3(scaler_path, id)
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            futures = [executor.submit(self.__upload_to_s3, path, id) if path else None for path in paths]
+            model_s3_path, _, scaler_s3_path = [future.result() if future else None for future in futures]
+
+        metadata_s3_path = self.__upload_to_s3(metadata_path, id)
 
         return model_s3_path, scaler_s3_path, metadata_s3_path
 
+    def __upload_bundle(self, model_path, compiled_path, scaler_path, metadata_path, id):
+        files = {os.path.basename(path): path for path in (model_path, compiled_path, scaler_path, metadata_path) if path}
+        bundle_path = ModelBundle.pack(files, os.path.join(os.path.dirname(model_path), "model.bundle"))
+
+        bundle_s3_path = self.__upload_to_s3(bundle_path, id)
+
+        return bundle_s3_path, bundle_s3_path if scaler_path else None, bundle_s3_path
+
     def __upload_to_s3(self, file_path, id):
         s3_key = f"models/{id}/{os.path.basename(file_path)}"
         self.s3_client.upload_file(file_path, self.bucket_name, s3_key)
@@ -0,0 +1,121 @@
+import json
+
+import pandas as pd
+
+JSON = "application/json"
+COLUMNAR_JSON = "application/vnd.columnar+json"
+ARROW = "application/vnd.apache.arrow.stream"
+NDJSON = "application/x-ndjson"
+
+MEDIA_TYPES = [JSON, COLUMNAR_JSON, ARROW, NDJSON]
+
+
+class SerializeDataService:
+    """
+    A service class for serializing market data into the response formats of the API.
+
+    Besides the default JSON records, the data can be encoded as columnar JSON (one array
+    per column), Apache Arrow IPC stream or NDJSON produced in chunks of rows. Columns are
+    encoded in vectorized form and timestamps are sent as epoch milliseconds (UTC) instead
+    of one datetime object per row; Arrow keeps its native timestamp type.
+
+    Attributes:
+        data (pd.DataFrame): The data to serialize.
+        media_type (str): The media type to produce.
+        metadata (dict): Extra top-level fields (e.g. the ticker), stored as schema metadata in Arrow
+            and omitted from NDJSON, where every line is a row.
+        chunk_size (int): Number of rows per NDJSON chunk.
+
+    Raises:
+        ValueError: If the media type is not supported.
+    """
+
+    def __init__(self, data: pd.DataFrame, media_type: str = JSON, metadata: dict = None, chunk_size: int = 5000):
+        """
+        Initialize the SerializeDataService.
+
+        Args:
+            data (pd.DataFrame): The data to serialize.
+            media_type (str): The media type to produce (default: application/json).
+            metadata (dict, optional): Extra top-level fields (e.g. the ticker).
+            chunk_size (int): Number of rows per NDJSON chunk (default: 5000).
+        """
+        self.data = data
+        self.media_type = media_type
+        self.metadata = metadata or {}
+        self.chunk_size = chunk_size
+
+    def execute(self):
+        if self.media_type == JSON:
+            return {**self.metadata, "data": self.data.to_dict(orient="records")}
+
+        if self.media_type == COLUMNAR_JSON:
+            return self.__columnar_json()
+
+        if self.media_type == ARROW:
+            return self.__arrow()
+
+        if self.media_type == NDJSON:
+            return self.__ndjson()
+
+        raise ValueError(f"Unsupported media type: {self.media_type}")
+
+    @staticmethod
+    def negotiate(accept: str = None):
+        # Highest quality supported type wins; unknown types and wildcards fall back to JSON
+        candidates = []
+
+        for position, part in enumerate((accept or JSON).split(",")):
+            media_type, *params = [value.strip() for value in part.split(";")]
+            quality = 1.0
+            for param in params:
+                if param.startswith("q="):
+                    try:
+                        quality = float(param[2:])
+                    except ValueError:
+                        quality = 0.0
+
+            if media_type in MEDIA_TYPES and quality > 0:
+                candidates.append((-quality, position, media_type))
+
+        return min(candidates)[2] if candidates else JSON
+
+    def __columnar_json(self):
+        # Each column is encoded by the pandas C encoder and the pieces are joined, so no
+        # intermediate Python object is created per row
+        data = self.__epoch_timestamps(self.data)
+        columns = ",".join(
+            f"{json.dumps(column)}:{data[column].to_json(orient='values', double_precision=15)}"
+            for column in data.columns
+        )
+        metadata = "".join(f"{json.dumps(key)}:{json.dumps(value)}," for key, value in self.metadata.items())
+
+        return f'{{{metadata}"rows":{len(self.data)},"columns":{json.dumps(list(self.data.columns))},"data":{{{columns}}}}}'.encode()
+
+    def __arrow(self):
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(self.data, preserve_index=False)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            **{key.encode(): (value if isinstance(value, str) else json.dumps(value)).encode() for key, value in self.metadata.items()}
+        })
+
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=self.chunk_size)
+
+        return sink.getvalue().to_pybytes()
+
+    def __ndjson(self):
+        data = self.__epoch_timestamps(self.data)
+
+        for start in range(0, len(data), self.chunk_size):
+            yield data.iloc[start:start + self.chunk_size].to_json(orient="records", lines=True, double_precision=15)
+
+    def __epoch_timestamps(self, data):
+        columns = data.select_dtypes(include=["datetime", "datetimetz"]).columns
+        if len(columns) == 0:
+            return data
+
+        return data.assign(**{column: data[column].dt.as_unit("ms").astype("int64") for column in columns})
@@ -0,0 +1,48 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+class SlidingWindowService:
+    """
+    A service class for building overlapping sequence windows without copying data.
+
+    The windows are returned as a strided, read-only view over the input array, so the
+    only copy happens when the caller converts them (e.g. into a torch tensor).
+
+    Attributes:
+        data (np.ndarray): 2D array of shape (rows, features).
+        sequence_length (int): Length of each window.
+
+    Raises:
+        ValueError: If the sequence length is not positive or the data is not 2D.
+    """
+
+    def __init__(self, data: np.ndarray, sequence_length: int):
+        """
+        Initialize the SlidingWindowService.
+
+        Args:
+            data (np.ndarray): 2D array of shape (rows, features).
+            sequence_length (int): Length of each window.
+        """
+        self.data = np.asarray(data)
+        self.sequence_length = sequence_length
+
+    def execute(self):
+        self.__validate()
+
+        rows, features = self.data.shape
+        if rows < self.sequence_length:
+            return np.empty((0, self.sequence_length, features), dtype=self.data.dtype)
+
+        # sliding_window_view yields (windows, features, sequence_length); swap the last
+        # two axes to get the (windows, sequence_length, features) layout the LSTM expects
+        windows = sliding_window_view(self.data, self.sequence_length, axis=0)
+        return windows.transpose(0, 2, 1)
+
+    def __validate(self):
+        if self.sequence_length <= 0:
+            raise ValueError("Sequence length must be greater than 0.")
+
+        if self.data.ndim != 2:
+            raise ValueError("Data must be a 2D array of shape (rows, features).")
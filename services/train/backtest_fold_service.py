@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+import torch
+
+from models.min_max_scaler import MinMaxScaler32
+from schemas.train import TrainModelRequest
+from services.train.prepare_data_service import TrainPrepareDataService
+from services.train.train_service import TrainService
+from services.train.evaluate_service import TrainEvaluateService
+
+
+def create_test_windows(data: pd.DataFrame, scaler, target_column: str, sequence_length: int, horizon: int, test_start: int, test_end: int):
+    """Build the test samples of rows [test_start, test_end) with the training alignment."""
+    # The first sample targets the first test row; only samples whose whole horizon
+    # is known can be scored
+    start = test_start - sequence_length - 1
+    end = min(test_end + horizon - 1, len(data))
+
+    columns = [column for column in data.columns if column != 'Date']
+    features = scaler.transform(data[columns].iloc[start:end - 1])
+    target = data[target_column].to_numpy(dtype=np.float64)[start + 1:end].astype(np.float32)
+
+    X, y = TrainPrepareDataService.create_sequences(features, target, sequence_length, horizon)
+    if len(X) == 0:
+        raise ValueError("Test block must have at least one sample.")
+
+    return torch.from_numpy(np.ascontiguousarray(X, dtype=np.float32)), torch.from_numpy(np.ascontiguousarray(y, dtype=np.float32))
+
+
+class TrainBacktestFoldService:
+    """
+    Service class training and evaluating one fold of a walk-forward backtest.
+
+    The rows before the test block (from `train_start`) are prepared like a regular
+    training request, so the scaler is fitted and early stopping is monitored only on
+    data preceding the block. The test samples are built like the training ones, with
+    TrainPrepareDataService.create_sequences: every row of the test block is the target
+    of the window ending two rows before it, scaled with the fold's scaler, which lets
+    the windows of the first test rows reach back into the training window.
+
+    Attributes:
+        data (pd.DataFrame): Preprocessed bars ordered by date, shared by every fold.
+        request (TrainModelRequest): The model specification to train.
+        train_start (int): First row of the training window.
+        test_start (int): First row of the test block (end of the training window).
+        test_end (int): Row after the last row of the test block.
+
+    Raises:
+        ValueError: If the fold bounds or the training data are invalid.
+    """
+
+    def __init__(self, data: pd.DataFrame, request: TrainModelRequest, train_start: int, test_start: int, test_end: int):
+        """
+        Initialize the TrainBacktestFoldService.
+
+        Args:
+            data (pd.DataFrame): Preprocessed bars ordered by date, shared by every fold.
+            request (TrainModelRequest): The model specification to train.
+            train_start (int): First row of the training window.
+            test_start (int): First row of the test block (end of the training window).
+            test_end (int): Row after the last row of the test block.
+        """
+        self.data = data
+        self.request = request
+        self.train_start = train_start
+        self.test_start = test_start
+        self.test_end = test_end
+
+    def execute(self):
+        self.__validate_bounds()
+
+        X_train, y_train, X_val, y_val, scaler = TrainPrepareDataService(
+            data=self.data.iloc[self.train_start:self.test_start],
+            train_size=self.request.train_size,
+            sequence_length=self.request.sequence_length,
+            scaler=MinMaxScaler32,
+            target_column=self.request.target_column,
+            horizon=self.request.horizon
+        ).execute()
+        X_test, y_test = create_test_windows(
+            data=self.data,
+            scaler=scaler,
+            target_column=self.request.target_column,
+            sequence_length=self.request.sequence_length,
+            horizon=self.request.horizon,
+            test_start=self.test_start,
+            test_end=self.test_end
+        )
+
+        # Thread count and batch size search are left to the pool running the folds
+        train_service = TrainService(
+            X_train=X_train,
+            y_train=y_train,
+            X_test=X_val,
+            y_test=y_val,
+            epochs=self.request.epochs,
+            patience=self.request.patience,
+            batch_size=self.request.batch_size,
+            learning_rate=self.request.learning_rate,
+            hidden_size=self.request.hidden_size,
+            num_layers=self.request.num_layers,
+            precision=self.request.precision
+        )
+        model = train_service.execute()
+
+        train_metrics, test_metrics = TrainEvaluateService(
+            model=model,
+            X_train=X_train,
+            y_train=y_train,
+            X_test=X_test,
+            y_test=y_test
+        ).execute()
+
+        return {
+            "train": self.__period(self.train_start, self.test_start, len(X_train)),
+            "test": self.__period(self.test_start, self.test_end, len(X_test)),
+            "epochs": len(train_service.training["epochs"]),
+            "train_metrics": train_metrics,
+            "test_metrics": test_metrics
+        }
+
+    def __validate_bounds(self):
+        if not (0 <= self.train_start < self.test_start < self.test_end <= len(self.data)):
+            raise ValueError("Fold bounds must satisfy train_start < test_start < test_end within the data.")
+
+        if self.test_start <= self.request.sequence_length:
+            raise ValueError("Sequence length must be lower than the rows before the test block.")
+
+    def __period(self, start, end, samples):
+        dates = self.data['Date']
+
+        return {
+            "start": dates.iloc[start].isoformat(),
+            "end": dates.iloc[end - 1].isoformat(),
+            "rows": end - start,
+            "samples": samples
+        }
@@ -0,0 +1,220 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from schemas.train import BacktestModelRequest, TrainModelRequest
+from services.jobs.train_worker import init_backtest_worker, run_backtest_fold, job_cpu_count
+from services.yfinance_service import YFinanceService
+from services.preprocess_data_service import PreprocessDataService
+from services.s3.metadata_service import S3MetadataService
+from services.s3.backtest_upload_service import S3BacktestUploadService
+
+WINDOWS = ("expanding", "rolling")
+
+# TrainPrepareDataService needs more than 200 rows to train a fold
+MIN_TRAIN_ROWS = 201
+
+
+class TrainBacktestPipelineService:
+    """
+    Service class running a walk-forward backtest of a model's training specification.
+
+    The training request recorded in the model metadata is retrained from scratch once per
+    fold: the last `folds * test_size` rows are split into consecutive test blocks, and each
+    fold trains on the rows before its block, either all of them (`expanding`) or only the
+    last `train_window` (`rolling`), then predicts the block. The bars are fetched and
+    preprocessed once and handed to every worker process when it starts, so the folds,
+    which run in parallel in a process pool, never fetch data themselves. The per-fold and
+    aggregate test metrics are stored as a report next to the model in S3.
+
+    Attributes:
+        model_id (str): The unique identifier of the backtested model.
+        request (BacktestModelRequest): The backtest request.
+        max_workers (int): Number of fold processes.
+        progress: Optional mutable mapping updated as folds complete.
+
+    Raises:
+        ValueError: If the backtest request is invalid, the data is too short or every fold fails.
+        FileNotFoundError: If the model is not found in S3.
+    """
+
+    def __init__(self, model_id: str, request: BacktestModelRequest, max_workers: int = None, progress=None):
+        """
+        Initialize the TrainBacktestPipelineService.
+
+        Args:
+            model_id (str): The unique identifier of the backtested model.
+            request (BacktestModelRequest): The backtest request.
+            max_workers (int, optional): Number of fold processes
+                (default: TRAIN_BACKTEST_MAX_WORKERS or the CPU cores assigned to the job).
+            progress (optional): Mutable mapping updated as folds complete.
+        """
+        self.model_id = model_id
+        self.request = request
+        self.max_workers = max_workers or int(os.getenv('TRAIN_BACKTEST_MAX_WORKERS') or 0) or job_cpu_count()
+        self.progress = progress if progress is not None else {}
+
+    def execute(self):
+        self.__validate()
+
+        start = time.perf_counter()
+        spec = self.__spec(S3MetadataService(id=self.model_id).execute())
+
+        data = self.__fetch(spec)
+        folds = self.__create_folds(data, spec)
+        self.progress.update({"folds": len(folds), "completed": 0, "failed": 0})
+        fetched = time.perf_counter()
+
+        workers = max(1, min(self.max_workers, len(folds)))
+        self.__run(spec, data, folds, workers)
+        finished = time.perf_counter()
+
+        completed = [fold for fold in folds if "error" not in fold]
+        if not completed:
+            raise ValueError(f"Every fold failed: {folds[0]['error']}")
+
+        fold_seconds = sum(fold["seconds"] for fold in completed)
+        backtest_seconds = finished - fetched
+
+        report = {
+            "model_id": self.model_id,
+            "request": self.request.model_dump(),
+            "spec": spec.model_dump(),
+            "folds": folds,
+            "aggregate": self.__aggregate(completed),
+            "summary": {
+                "folds": len(folds),
+                "completed": len(completed),
+                "failed": len(folds) - len(completed),
+                "workers": workers,
+                "threads_per_worker": self.__threads_per_worker(workers),
+                "fetch_seconds": fetched - start,
+                "backtest_seconds": backtest_seconds,
+                "wall_seconds": finished - start,
+                "fold_seconds": fold_seconds,
+                "parallel_speedup": fold_seconds / backtest_seconds if backtest_seconds > 0 else None
+            }
+        }
+
+        _, report_s3_path = S3BacktestUploadService(model_id=self.model_id, report=report).execute()
+
+        return {**report, "paths": {"report_s3_path": report_s3_path}}
+
+    def __validate(self):
+        if self.request.folds <= 0:
+            raise ValueError("Number of folds must be greater than 0.")
+
+        if self.request.folds > 1000:
+            raise ValueError("Number of folds must not exceed 1000.")
+
+        if self.request.test_size <= 0:
+            raise ValueError("Test size must be greater than 0.")
+
+        if self.request.window not in WINDOWS:
+            raise ValueError(f"Window must be one of: {', '.join(WINDOWS)}.")
+
+        if self.request.train_window is not None and self.request.train_window < MIN_TRAIN_ROWS:
+            raise ValueError(f"Train window must have at least {MIN_TRAIN_ROWS} rows.")
+
+    def __spec(self, metadata):
+        # Older metadata may lack the newer training options, which then take their defaults
+        overrides = {
+            key: value for key, value in {
+                "start_date": self.request.start_date,
+                "end_date": self.request.end_date,
+                "epochs": self.request.epochs,
+                "patience": self.request.patience
+            }.items() if value is not None
+        }
+
+        return TrainModelRequest(**{**metadata["request"], **overrides})
+
+    def __fetch(self, spec):
+        data = YFinanceService(
+            ticker=spec.ticker,
+            start_date=spec.start_date,
+            end_date=spec.end_date
+        ).execute()
+        data = PreprocessDataService(data=data).execute()
+
+        # Folds are row ranges, so the rows must already be in date order
+        if not data['Date'].is_monotonic_increasing:
+            data = data.sort_values('Date', kind='stable')
+
+        return data.reset_index(drop=True)
+
+    def __create_folds(self, data, spec):
+        rows = len(data)
+        first = rows - self.request.folds * self.request.test_size
+
+        if first < MIN_TRAIN_ROWS:
+            raise ValueError(
+                f"Not enough data for {self.request.folds} folds of {self.request.test_size} rows: "
+                f"{rows} rows available, at least {MIN_TRAIN_ROWS} must precede the first fold."
+            )
+
+        train_window = self.request.train_window or first
+        if self.request.window == "rolling" and train_window > first:
+            raise ValueError(f"Train window cannot exceed the {first} rows preceding the first fold.")
+
+        if spec.sequence_length >= first:
+            raise ValueError("Sequence length must be lower than the rows preceding the first fold.")
+
+        folds = []
+        for fold in range(self.request.folds):
+            test_start = first + fold * self.request.test_size
+            folds.append({
+                "fold": fold,
+                "train_start": test_start - train_window if self.request.window == "rolling" else 0,
+                "test_start": test_start,
+                "test_end": test_start + self.request.test_size
+            })
+
+        return folds
+
+    def __threads_per_worker(self, workers):
+        return max(1, job_cpu_count() // workers)
+
+    def __run(self, spec, data, folds, workers):
+        context = multiprocessing.get_context("spawn")
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=init_backtest_worker,
+            initargs=(self.__threads_per_worker(workers), data)
+        ) as executor:
+            futures = {executor.submit(run_backtest_fold, spec.model_dump(), fold): fold for fold in folds}
+
+            for future in as_completed(futures):
+                fold = futures[future]
+
+                try:
+                    fold.update(future.result())
+                    self.__advance("completed")
+                except Exception as exc:
+                    fold["error"] = str(exc)
+                    self.__advance("failed")
+
+    def __advance(self, key):
+        self.progress[key] = self.progress.get(key, 0) + 1
+
+    def __aggregate(self, folds):
+        samples = np.array([fold["test"]["samples"] for fold in folds], dtype=np.float64)
+
+        aggregate = {}
+        for metric in folds[0]["test_metrics"]:
+            values = np.array([fold["test_metrics"][metric] for fold in folds], dtype=np.float64)
+            aggregate[metric] = {
+                "mean": float(values.mean()),
+                "std": float(values.std()),
+                "min": float(values.min()),
+                "max": float(values.max()),
+                # Folds near the end of the data can hold fewer scored samples
+                "weighted": float(np.average(values, weights=samples))
+            }
+
+        return aggregate
@@ -0,0 +1,147 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from services.jobs.train_worker import init_worker, run_prepared_train, job_cpu_count
+from services.train.dataset_service import TrainDatasetService
+
+
+class BatchTrainPipelineService:
+    """
+    Service class training many models from a single batch of training requests.
+
+    Every dataset is fetched and prepared up front, concurrently, in the calling process.
+    The trainings then run in parallel in a process pool sized to the CPU cores assigned to
+    the job (the cores divided among the TRAIN_MAX_WORKERS jobs), with the torch intra-op threads of each worker limited so the pool does not
+    oversubscribe the machine. Workers are reused across models, so each one keeps a
+    single S3 client, and every model is uploaded by its worker as soon as its training
+    finishes. Failures are reported per request instead of failing the whole batch.
+
+    Attributes:
+        requests (list): The training requests.
+        max_workers (int): Number of training processes.
+        progress: Optional mutable mapping updated as models complete.
+    """
+
+    def __init__(self, requests: list, max_workers: int = None, progress=None):
+        """
+        Initialize the BatchTrainPipelineService.
+
+        Args:
+            requests (list): The training requests (TrainModelRequest).
+            max_workers (int, optional): Number of training processes
+                (default: TRAIN_BATCH_MAX_WORKERS or the CPU cores assigned to the job).
+            progress (optional): Mutable mapping updated as models complete.
+        """
+        self.requests = requests
+        self.max_workers = max_workers or int(os.getenv('TRAIN_BATCH_MAX_WORKERS') or 0) or job_cpu_count()
+        self.progress = progress if progress is not None else {}
+
+    def execute(self):
+        self.__validate()
+
+        start = time.perf_counter()
+        self.progress.update({"total": len(self.requests), "completed": 0, "failed": 0})
+
+        datasets, errors = self.__prepare_datasets()
+        prepared = time.perf_counter()
+
+        workers = max(1, min(self.max_workers, len(datasets))) if datasets else 0
+        results = self.__train(datasets, errors, workers)
+        finished = time.perf_counter()
+
+        return self.__report(results, errors, workers, start, prepared, finished)
+
+    def __validate(self):
+        if not self.requests:
+            raise ValueError("At least one training request must be provided.")
+
+    def __prepare_datasets(self):
+        def prepare(request):
+            try:
+                return TrainDatasetService(request=request).execute(), None
+            except Exception as exc:
+                return None, exc
+
+        # Fetching is I/O bound, so threads are enough; the market data cache is shared
+        with ThreadPoolExecutor(max_workers=min(8, len(self.requests))) as executor:
+            prepared = list(executor.map(prepare, self.requests))
+
+        datasets, errors = {}, {}
+        for index, (dataset, error) in enumerate(prepared):
+            if error is not None:
+                errors[index] = str(error)
+                self.__advance("failed")
+            else:
+                datasets[index] = dataset
+
+        return datasets, errors
+
+    def __threads_per_worker(self, workers):
+        return max(1, job_cpu_count() // workers) if workers else 0
+
+    def __train(self, datasets, errors, workers):
+        results = {}
+        if not datasets:
+            return results
+
+        context = multiprocessing.get_context("spawn")
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=init_worker,
+            initargs=(self.__threads_per_worker(workers),)
+        ) as executor:
+            futures = {
+                executor.submit(run_prepared_train, self.requests[index].model_dump(), dataset): index
+                for index, dataset in datasets.items()
+            }
+
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                    self.__advance("completed")
+                except Exception as exc:
+                    errors[index] = str(exc)
+                    self.__advance("failed")
+
+        return results
+
+    def __advance(self, key):
+        self.progress[key] = self.progress.get(key, 0) + 1
+
+    def __report(self, results, errors, workers, start, prepared, finished):
+        models = []
+        for index, request in enumerate(self.requests):
+            entry = {"index": index, "ticker": request.ticker}
+
+            if index in results:
+                entry.update(results[index])
+            else:
+                entry["error"] = errors.get(index)
+
+            models.append(entry)
+
+        wall_seconds = finished - start
+        train_seconds = finished - prepared
+        model_seconds = sum(result["seconds"] for result in results.values())
+
+        return {
+            "models": models,
+            "summary": {
+                "total": len(self.requests),
+                "succeeded": len(results),
+                "failed": len(errors),
+                "workers": workers,
+                "threads_per_worker": self.__threads_per_worker(workers),
+                "prepare_seconds": prepared - start,
+                "train_seconds": train_seconds,
+                "wall_seconds": wall_seconds,
+                "models_per_minute": len(results) * 60 / wall_seconds if wall_seconds > 0 else None,
+                "model_seconds": model_seconds,
+                "parallel_speedup": model_seconds / train_seconds if results and train_seconds > 0 else None
+            }
+        }
@@ -0,0 +1,95 @@
+import copy
+import time
+
+import torch
+
+# Candidates are powers of two up to this size
+MAX_BATCH_SIZE = 1024
+# Larger batches are only considered while an epoch keeps at least this many optimizer steps
+MIN_STEPS_PER_EPOCH = 8
+
+
+class TrainBatchSizeService:
+    """
+    Service class finding the training batch size with the highest throughput.
+
+    Candidate batch sizes (powers of two) are timed on a copy of the model running full
+    training steps (forward, backward and optimizer step) with the same precision as the
+    trainer, so the model itself is left untouched. The search stops as soon as a larger
+    batch is slower than the best one found, and batches that would leave an epoch with
+    fewer than MIN_STEPS_PER_EPOCH optimizer steps are never tried.
+
+    Attributes:
+        model (LightningLSTM): The model to be trained.
+        X_train (torch.Tensor): Training features.
+        y_train (torch.Tensor): Training target values.
+        precision (str): Training precision, `32` or `bf16`.
+        steps (int): Number of timed training steps per candidate.
+    """
+
+    def __init__(self, model, X_train, y_train, precision: str = "32", steps: int = 5):
+        """
+        Initialize the TrainBatchSizeService.
+
+        Args:
+            model (LightningLSTM): The model to be trained.
+            X_train (torch.Tensor): Training features.
+            y_train (torch.Tensor): Training target values.
+            precision (str): Training precision, `32` or `bf16` (default: 32).
+            steps (int): Number of timed training steps per candidate (default: 5).
+        """
+        self.model = model
+        self.X_train = X_train
+        self.y_train = y_train
+        self.precision = precision
+        self.steps = steps
+
+    def execute(self):
+        model = copy.deepcopy(self.model).train()
+        optimizer = model.configure_optimizers()
+
+        results = []
+        for batch_size in self.__candidates():
+            samples_per_second = self.__measure(model, optimizer, batch_size)
+            results.append({"batch_size": batch_size, "samples_per_second": samples_per_second})
+
+            if samples_per_second < max(result["samples_per_second"] for result in results):
+                break
+
+        best = max(results, key=lambda result: result["samples_per_second"])
+        return best["batch_size"], results
+
+    def __candidates(self):
+        limit = min(MAX_BATCH_SIZE, max(len(self.X_train) // MIN_STEPS_PER_EPOCH, 1))
+
+        candidates = []
+        batch_size = 16
+        while batch_size <= limit:
+            candidates.append(batch_size)
+            batch_size *= 2
+
+        return candidates or [limit]
+
+    def __measure(self, model, optimizer, batch_size):
+        batches = [
+            (self.X_train[start:start + batch_size], self.y_train[start:start + batch_size])
+            for start in range(0, len(self.X_train) - batch_size + 1, batch_size)
+        ]
+
+        # The first step pays for allocations and is left out of the measure
+        self.__step(model, optimizer, *batches[0])
+
+        start = time.perf_counter()
+        for step in range(self.steps):
+            self.__step(model, optimizer, *batches[step % len(batches)])
+        seconds = time.perf_counter() - start
+
+        return self.steps * batch_size / seconds
+
+    def __step(self, model, optimizer, X, y):
+        with torch.autocast("cpu", dtype=torch.bfloat16, enabled=self.precision == "bf16"):
+            loss = model.criterion(model(X), y)
+
+        optimizer.zero_grad()
+        loss.backward()
+        optimizer.step()
@@ -0,0 +1,89 @@
+import time
+
+import pytorch_lightning as L
+
+
+class ProgressCallback(L.Callback):
+    """
+    Lightning callback that publishes training progress to a shared mapping.
+
+    The mapping is usually a multiprocessing manager dict, so the API process can
+    report the progress of a training running in a worker process.
+
+    Attributes:
+        progress: Mutable mapping updated at the end of every epoch.
+    """
+
+    def __init__(self, progress):
+        """
+        Initialize the ProgressCallback.
+
+        Args:
+            progress: Mutable mapping updated at the end of every epoch.
+        """
+        super().__init__()
+        self.progress = progress
+
+    def on_train_start(self, trainer, pl_module):
+        self.progress.update({"epoch": 0, "max_epochs": trainer.max_epochs})
+
+    def on_train_epoch_end(self, trainer, pl_module):
+        metrics = trainer.callback_metrics
+
+        self.progress.update({
+            "epoch": trainer.current_epoch + 1,
+            "max_epochs": trainer.max_epochs,
+            "train_loss": self.__value(metrics.get("train_loss")),
+            "val_loss": self.__value(metrics.get("val_loss"))
+        })
+
+    def __value(self, metric):
+        return float(metric) if metric is not None else None
+
+
+class ThroughputCallback(L.Callback):
+    """
+    Lightning callback that measures the training throughput of every epoch.
+
+    The time of an epoch runs from its start to the end of its last training batch, so
+    the validation loop does not count against the training throughput.
+
+    Attributes:
+        epochs (list): One {epoch, samples, seconds, samples_per_second} entry per epoch.
+    """
+
+    def __init__(self):
+        """
+        Initialize the ThroughputCallback.
+        """
+        super().__init__()
+        self.epochs = []
+        self.__start = None
+        self.__end = None
+        self.__samples = 0
+
+    def on_train_epoch_start(self, trainer, pl_module):
+        self.__start = self.__end = time.perf_counter()
+        self.__samples = 0
+
+    def on_train_batch_end(self, trainer, pl_module, outputs, batch, batch_idx):
+        self.__samples += len(batch[0])
+        self.__end = time.perf_counter()
+
+    def on_train_epoch_end(self, trainer, pl_module):
+        seconds = self.__end - self.__start
+
+        self.epochs.append({
+            "epoch": trainer.current_epoch + 1,
+            "samples": self.__samples,
+            "seconds": seconds,
+            "samples_per_second": self.__samples / seconds if seconds > 0 else None
+        })
+
+    def summary(self):
+        rates = [epoch["samples_per_second"] for epoch in self.epochs if epoch["samples_per_second"]]
+
+        return {
+            "epochs": self.epochs,
+            "samples_per_second": sum(rates) / len(rates) if rates else None
+        }
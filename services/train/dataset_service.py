@@ -0,0 +1,55 @@
+from models.min_max_scaler import MinMaxScaler32
+from schemas.train import TrainModelRequest
+from services.cache.dataset_cache import dataset_cache
+from services.yfinance_service import YFinanceService
+from services.preprocess_data_service import PreprocessDataService
+from services.train.prepare_data_service import TrainPrepareDataService
+
+
+class TrainDatasetService:
+    """
+    Service class for building the training dataset described by a training request.
+
+    This service fetches the historical data for the requested ticker and period,
+    preprocesses it and turns it into scaled train/test sequence tensors. Prepared
+    datasets are reused from the dataset cache when the same bars were already prepared
+    with the same parameters.
+
+    Attributes:
+        request (TrainModelRequest): The training request describing the dataset.
+        cache (DatasetCache): Cache of prepared datasets.
+    """
+
+    def __init__(self, request: TrainModelRequest, cache=None):
+        """
+        Initialize the TrainDatasetService.
+
+        Args:
+            request (TrainModelRequest): The training request describing the dataset.
+            cache (DatasetCache, optional): Cache of prepared datasets (default: the
+                process-wide dataset cache).
+        """
+        self.request = request
+        self.cache = cache or dataset_cache
+
+    def execute(self):
+        yfinance_data = YFinanceService(
+            ticker=self.request.ticker,
+            start_date=self.request.start_date,
+            end_date=self.request.end_date
+        ).execute()
+
+        preprocessed_data = PreprocessDataService(data=yfinance_data).execute()
+
+        params = {
+            "train_size": self.request.train_size,
+            "sequence_length": self.request.sequence_length,
+            "target_column": self.request.target_column,
+            "horizon": self.request.horizon
+        }
+
+        return self.cache.get_or_prepare(
+            preprocessed_data,
+            {**params, "scaler": MinMaxScaler32.__name__},
+            lambda: TrainPrepareDataService(data=preprocessed_data, scaler=MinMaxScaler32, **params).execute()
+        )
@@ -1,13 +1,17 @@
+import os
+
 import numpy as np
 import torch
-from sklearn.metrics import mean_absolute_error, root_mean_squared_error, r2_score, mean_absolute_percentage_error
 
 class TrainEvaluateService:
     """
     A service class for evaluating trained models using various metrics.
 
     This service calculates multiple evaluation metrics for both training and testing datasets,
-    including MAE, MAPE, RMSE, and R² scores.
+    including MAE, MAPE, RMSE, and R² scores. The model runs over fixed-size chunks of the
+    existing tensors under inference mode and the metrics are accumulated incrementally in
+    float64, so memory stays bounded on long histories. Results match scikit-learn's
+    metrics (uniform average over outputs for multi-step targets).
 
     Attributes:
         model: The trained model to evaluate.
@@ -15,9 +19,10 @@ class TrainEvaluateService:
         y_train (np.ndarray): Training target values.
         X_test (np.ndarray): Testing features.
         y_test (np.ndarray): Testing target values.
+        batch_size (int): Number of windows evaluated per forward pass.
     """
 
-    def __init__(self, model, X_train: np.ndarray, y_train: np.ndarray, X_test: np.ndarray, y_test: np.ndarray):
+    def __init__(self, model, X_train: np.ndarray, y_train: np.ndarray, X_test: np.ndarray, y_test: np.ndarray, batch_size: int = None):
         """
         Initialize the TrainEvaluateService.
 
@@ -27,13 +32,16 @@ class TrainEvaluateService:
             y_train (np.ndarray): Training target values.
             X_test (np.ndarray): Testing features.
             y_test (np.ndarray): Testing target values.
+            batch_size (int, optional): Number of windows evaluated per forward pass
+                (default: EVAL_BATCH_SIZE or 1024).
         """
         self.model = model
         self.X_train = X_train
         self.y_train = y_train
         self.X_test = X_test
         self.y_test = y_test
-    
+        self.batch_size = batch_size or int(os.getenv('EVAL_BATCH_SIZE', '1024'))
+
     def execute(self):        
         train_metrics = self.__evaluate(self.X_train, self.y_train)
         test_metrics = self.__evaluate(self.X_test, self.y_test)
@@ -42,20 +50,65 @@ class TrainEvaluateService:
 
     def __evaluate(self, X: np.ndarray, y: np.ndarray):
         self.model.eval()
-        
-        with torch.no_grad():
-            y_pred = self.model(torch.tensor(X, dtype=torch.float32))
-        
-        y_pred = y_pred.numpy()
-        
-        mae = mean_absolute_error(y, y_pred)
-        mape = mean_absolute_percentage_error(y, y_pred)
-        rmse = root_mean_squared_error(y, y_pred)
-        r2 = r2_score(y, y_pred)
+
+        # as_tensor reuses the float32 tensors built by the prepare step instead of copying them
+        X = torch.as_tensor(X, dtype=torch.float32)
+        y = torch.as_tensor(y, dtype=torch.float32)
+
+        totals = None
+        with torch.inference_mode():
+            for start in range(0, len(X), self.batch_size):
+                y_pred = self.model(X[start:start + self.batch_size])
+                totals = self.__accumulate(totals, y[start:start + self.batch_size], y_pred)
+
+        return self.__metrics(totals)
+
+    def __accumulate(self, totals, y_true, y_pred):
+        y_true = y_true.reshape(len(y_true), -1).double()
+        y_pred = y_pred.reshape(len(y_true), -1).double()
+        error = y_pred - y_true
+
+        count = len(y_true)
+        mean = y_true.mean(dim=0)
+        chunk = {
+            "count": count,
+            "absolute": error.abs().sum(dim=0),
+            # Same epsilon as scikit-learn's mean_absolute_percentage_error
+            "percentage": (error.abs() / y_true.abs().clamp(min=np.finfo(np.float64).eps)).sum(dim=0),
+            "squared": error.square().sum(dim=0),
+            "mean": mean,
+            "m2": (y_true - mean).square().sum(dim=0)
+        }
+
+        if totals is None:
+            return chunk
+
+        # Chan's parallel update keeps the variance of y exact without storing it
+        total = totals["count"] + count
+        delta = chunk["mean"] - totals["mean"]
+
+        return {
+            "count": total,
+            "absolute": totals["absolute"] + chunk["absolute"],
+            "percentage": totals["percentage"] + chunk["percentage"],
+            "squared": totals["squared"] + chunk["squared"],
+            "mean": totals["mean"] + delta * count / total,
+            "m2": totals["m2"] + chunk["m2"] + delta.square() * totals["count"] * count / total
+        }
+
+    def __metrics(self, totals):
+        if totals is None:
+            raise ValueError("Evaluation data must not be empty.")
+
+        count = totals["count"]
+        squared, m2 = totals["squared"], totals["m2"]
+
+        # scikit-learn's force_finite convention for constant targets
+        r2 = torch.where(m2 > 0, 1 - squared / m2.clamp(min=np.finfo(np.float64).tiny), (squared == 0).double())
 
         return {
-            "mae": mae,
-            "mape": mape,
-            "rmse": rmse,
-            "r2": r2
-        }
\ No newline at end of file
+            "mae": float((totals["absolute"] / count).mean()),
+            "mape": float((totals["percentage"] / count).mean()),
+            "rmse": float((squared / count).sqrt().mean()),
+            "r2": float(r2.mean())
+        }
@@ -0,0 +1,32 @@
+import torch
+
+from models.lstm_network import LSTMNetwork
+
+
+class TrainExportService:
+    """
+    Service class for exporting a trained model to a compiled TorchScript graph.
+
+    The LSTM and fully connected layers are copied into a plain LSTMNetwork, which
+    is then scripted, so the exported artifact carries no Lightning training logic
+    and can be served without the eager Python forward.
+
+    Attributes:
+        model: The trained LightningLSTM model to export.
+    """
+
+    def __init__(self, model):
+        """
+        Initialize the TrainExportService.
+
+        Args:
+            model: The trained LightningLSTM model to export.
+        """
+        self.model = model
+
+    def execute(self):
+        network = LSTMNetwork.from_hparams(self.model.hparams)
+        network.load_state_dict(self.model.state_dict())
+        network.eval()
+
+        return torch.jit.script(network)
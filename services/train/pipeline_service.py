@@ -0,0 +1,95 @@
+from schemas.train import TrainModelRequest
+from services.train.dataset_service import TrainDatasetService
+from services.train.train_service import TrainService
+from services.train.evaluate_service import TrainEvaluateService
+from services.train.export_service import TrainExportService
+from services.s3.upload_service import S3UploadService
+
+
+class TrainPipelineService:
+    """
+    Service class running the complete training pipeline for a training request.
+
+    This service builds the dataset, trains and evaluates the model, exports a compiled
+    TorchScript graph for serving and uploads the resulting artifacts to S3. A dataset
+    prepared beforehand can be given to skip the fetch.
+
+    Attributes:
+        request (TrainModelRequest): The training request.
+        callbacks (list): Extra Lightning callbacks attached to the trainer.
+        dataset (tuple): Prepared (X_train, y_train, X_test, y_test, scaler), if any.
+    """
+
+    def __init__(self, request: TrainModelRequest, callbacks: list = None, dataset: tuple = None):
+        """
+        Initialize the TrainPipelineService.
+
+        Args:
+            request (TrainModelRequest): The training request.
+            callbacks (list, optional): Extra Lightning callbacks attached to the trainer.
+            dataset (tuple, optional): Output of TrainDatasetService for the request (default: built here).
+        """
+        self.request = request
+        self.callbacks = callbacks or []
+        self.dataset = dataset
+
+    def execute(self):
+        X_train, y_train, X_test, y_test, scaler = self.dataset or TrainDatasetService(request=self.request).execute()
+
+        train_service = TrainService(
+            X_train=X_train,
+            y_train=y_train,
+            X_test=X_test,
+            y_test=y_test,
+            epochs=self.request.epochs,
+            patience=self.request.patience,
+            callbacks=self.callbacks,
+            batch_size=self.request.batch_size,
+            auto_batch_size=self.request.auto_batch_size,
+            learning_rate=self.request.learning_rate,
+            hidden_size=self.request.hidden_size,
+            num_layers=self.request.num_layers,
+            num_threads=self.request.num_threads,
+            precision=self.request.precision
+        )
+        model = train_service.execute()
+
+        train_metrics, test_metrics = TrainEvaluateService(
+            model=model,
+            X_train=X_train,
+            y_train=y_train,
+            X_test=X_test,
+            y_test=y_test
+        ).execute()
+
+        compiled_model = TrainExportService(model=model).execute()
+
+        metadata = {
+            "request": self.request.model_dump(),
+            "train_metrics": train_metrics,
+            "test_metrics": test_metrics,
+            "version": 1,
+            "training": train_service.training
+        }
+
+        upload_service = S3UploadService(
+            model=model,
+            scaler=scaler,
+            metadata=metadata,
+            compiled_model=compiled_model
+        )
+        id, model_s3_path, scaler_s3_path, metadata_s3_path = upload_service.execute()
+
+        return {
+            "id": id,
+            "metrics": {
+                "train": train_metrics,
+                "test": test_metrics
+            },
+            "paths": {
+                "model_s3_path": model_s3_path,
+                "scaler_s3_path": scaler_s3_path,
+                "metadata_s3_path": metadata_s3_path
+            },
+            "warnings": upload_service.warnings
+        }
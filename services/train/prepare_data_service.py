@@ -2,6 +2,8 @@ import pandas as pd
 import numpy as np
 import torch
 
+from services.sliding_window_service import SlidingWindowService
+
 pd.options.mode.copy_on_write = True
 
 class TrainPrepareDataService:
@@ -9,20 +11,25 @@ class TrainPrepareDataService:
     Service class for preparing data for model training.
 
     This class handles the preparation of time series data for training, including
-    data validation, scaling, sequence creation, and train-test splitting.
+    data validation, scaling, sequence creation, and train-test splitting. The feature
+    columns are gathered in date order, without null rows, and written already scaled
+    into one contiguous float32 block; the scaler is fitted on the training rows from
+    per-column ranges and the target is taken unscaled from the same pass, so no
+    intermediate DataFrame or full float64 copy is made before the windows are built.
 
     Attributes:
         data (pd.DataFrame): Input DataFrame containing the time series data.
         train_size (float): Proportion of data to use for training (0-1).
         sequence_length (int): Length of sequences for LSTM input.
-        scaler: Scaler instance for feature normalization.
+        scaler: Scaler instance for feature normalization, fitted with `fit_range` (e.g. MinMaxScaler32).
         target_column (str): Name of the target column to predict.
+        horizon (int): Number of future target values per sample (direct multi-step head).
 
     Raises:
         ValueError: If input data validation fails or parameters are invalid.
     """
 
-    def __init__(self, data: pd.DataFrame, train_size: float = 0.8, sequence_length: int = 1, scaler=None, target_column: str = 'Close'):
+    def __init__(self, data: pd.DataFrame, train_size: float = 0.8, sequence_length: int = 1, scaler=None, target_column: str = 'Close', horizon: int = 1):
         """
         Initialize the TrainPrepareDataService.
 
@@ -32,26 +39,25 @@ class TrainPrepareDataService:
             sequence_length (int): Length of sequences for LSTM input (default: 1).
             scaler: Scaler instance for feature normalization (default: None).
             target_column (str): Name of the target column to predict (default: 'Close').
+            horizon (int): Number of future target values per sample (default: 1).
         """
         self.data = data
         self.train_size = train_size
         self.sequence_length = sequence_length
         self.scaler = scaler() if scaler is not None else None
         self.target_column = target_column
+        self.horizon = horizon
 
     def execute(self):
         self.__validate_data()
         self.__validate_train_size()
         self.__validate_sequence_length()
+        self.__validate_horizon()
 
-        self.__sort_and_remove_date()
-        self.__create_target_column()
-
-        train_data, test_data = self.__split_data()
-        train_data, test_data = self.__scale_features(train_data, test_data)
+        features, target, split = self.__create_block()
 
-        X_train, y_train = self.__create_sequences(train_data)
-        X_test, y_test = self.__create_sequences(test_data)
+        X_train, y_train = self.create_sequences(features[:split], target[:split], self.sequence_length, self.horizon)
+        X_test, y_test = self.create_sequences(features[split:], target[split:], self.sequence_length, self.horizon)
 
         X_train_tensor, y_train_tensor = self.__prepare_tensors(X_train, y_train)
         X_test_tensor, y_test_tensor = self.__prepare_tensors(X_test, y_test)
@@ -76,41 +82,76 @@ class TrainPrepareDataService:
         if self.sequence_length > len(self.data):
             raise ValueError("Sequence length cannot be greater than the number of rows in the DataFrame.")
     
-    def __sort_and_remove_date(self):
-        self.data = self.data.sort_values('Date').reset_index(drop=True)
-        self.data = self.data.drop('Date', axis=1)
+    def __validate_horizon(self):
+        if self.horizon <= 0:
+            raise ValueError("Horizon must be greater than 0.")
 
-    def __create_target_column(self):
-        self.data['target'] = self.data[self.target_column].shift(-1)
-        self.data = self.data.dropna(subset=['target'])
-    
-    def __split_data(self):
-        train_size = int(len(self.data) * self.train_size)
-        train_data = self.data[:train_size]
-        test_data = self.data[train_size:]
+    def __create_block(self):
+        columns = self.__feature_columns()
+        if self.target_column not in columns:
+            raise ValueError(f"Target column {self.target_column} not found in the DataFrame.")
 
-        return train_data, test_data
+        # Row order by date, skipping rows with nulls in the used columns
+        dates = self.data['Date']
+        index = np.arange(len(dates)) if dates.is_monotonic_increasing else dates.argsort(kind='stable').to_numpy()
+        valid = self.data[columns].notna().to_numpy().all(axis=1)
+        index = index[valid[index]]
+
+        # The last row has no following target, so it only closes windows, never starts one
+        rows = len(index) - 1
+        split = int(rows * self.train_size)
 
-    def __scale_features(self, train_data, test_data):
         if self.scaler:
-            feature_cols = train_data.columns.drop('target')
+            self.__fit_scaler(columns, index[:split])
+
+        # Columns are gathered, scaled in float64 and rounded into the float32 block one
+        # at a time, so the whole frame is never copied as float64
+        block = np.empty((rows, len(columns)), dtype=np.float32)
+        for position, column in enumerate(columns):
+            values = self.data[column].to_numpy(dtype=np.float64)[index]
+
+            if column == self.target_column:
+                target = values[1:].astype(np.float32)
+
+            values = values[:-1]
+            if self.scaler:
+                values *= self.scaler.scale_[position]
+                values += self.scaler.min_[position]
+
+            block[:, position] = values
+
+        return block, target, split
+
+    def __feature_columns(self):
+        return [column for column in self.data.columns if column != 'Date']
 
-            train_data[feature_cols] = self.scaler.fit_transform(train_data[feature_cols])
-            test_data[feature_cols] = self.scaler.transform(test_data[feature_cols])
+    def __fit_scaler(self, columns, train_index):
+        data_min, data_max = [], []
+        for column in columns:
+            values = self.data[column].to_numpy(dtype=np.float64)[train_index]
+            data_min.append(values.min())
+            data_max.append(values.max())
 
-        return train_data, test_data
+        self.scaler.fit_range(data_min, data_max, feature_names=columns)
 
-    def __create_sequences(self, data):
-        X = []
-        y = []
+    @staticmethod
+    def create_sequences(features, target, sequence_length: int, horizon: int = 1):
+        # `target[i]` is the value of the row after row i, and the window starting at row s
+        # targets `target[s + sequence_length]`: the row two past its last row. Fine-tuning
+        # and backtests build their samples here too, so every model sees the same task
+        windows = SlidingWindowService(data=features, sequence_length=sequence_length).execute()
+        samples = max(len(features) - sequence_length - horizon + 1, 0)
+        X = windows[:samples]
 
-        for i in range(len(data) - self.sequence_length):
-            X.append(data.iloc[i:i+self.sequence_length].drop('target', axis=1).values)
-            y.append(data.iloc[i+self.sequence_length]['target'])
+        if horizon == 1:
+            return X, target[sequence_length:]
 
-        return np.array(X), np.array(y)
+        # Direct multi-step head: each sample targets the next `horizon` values
+        y = SlidingWindowService(data=target[:, None], sequence_length=horizon).execute()
+        return X, y[sequence_length:sequence_length + samples, :, 0]
 
     def __prepare_tensors(self, X, y):
-        X_tensor = torch.tensor(X, dtype=torch.float32)
-        y_tensor = torch.tensor(y, dtype=torch.float32)
-        return X_tensor, y_tensor
\ No newline at end of file
+        # Single copy: the strided window view is materialized straight into contiguous float32
+        X_tensor = torch.from_numpy(np.ascontiguousarray(X, dtype=np.float32))
+        y_tensor = torch.from_numpy(np.ascontiguousarray(y, dtype=np.float32))
+        return X_tensor, y_tensor
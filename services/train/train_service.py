@@ -1,16 +1,27 @@
+import os
+
 import numpy as np
+import torch
 import pytorch_lightning as L
 from torch.utils.data import TensorDataset, DataLoader
 from pytorch_lightning.callbacks import EarlyStopping
 
 from models.lightning_lstm_model import LightningLSTM
+from services.train.batch_size_service import TrainBatchSizeService
+from services.train.callbacks import ThroughputCallback
+
+# Request precision -> Lightning precision; bf16 runs the steps under CPU autocast
+PRECISIONS = {"32": "32-true", "bf16": "bf16-mixed"}
 
 class TrainService:
     """
     A service class for training LSTM models using PyTorch Lightning.
 
     This service handles the training process of LSTM models, including data validation,
-    dataloader creation, and model training with early stopping.
+    dataloader creation, and model training with early stopping. Batch size, model size,
+    learning rate, torch thread count and precision are configurable; the batch size can
+    also be picked by TrainBatchSizeService. The training throughput of every epoch is
+    measured and exposed in `training` once the model is trained.
 
     Attributes:
         X_train (np.ndarray): Training features.
@@ -20,12 +31,25 @@ class TrainService:
         epochs (int): Number of training epochs.
         patience (int): Number of epochs to wait before early stopping.
         features (int): Number of input features.
+        outputs (int): Number of values predicted per sample (forecast horizon of a direct head).
+        callbacks (list): Extra Lightning callbacks attached to the trainer.
+        model (LightningLSTM): Existing model to keep training, or None to start from scratch.
+        batch_size (int): Number of samples per training step.
+        auto_batch_size (bool): Whether to pick the batch size with the highest throughput.
+        learning_rate (float): Learning rate of a new model.
+        hidden_size (int): Hidden state size of a new model.
+        num_layers (int): Number of stacked LSTM layers of a new model.
+        num_threads (int): Torch intra-op threads used while training, or None to keep the current setting.
+        precision (str): Training precision, `32` or `bf16`.
+        num_workers (int): DataLoader worker processes.
+        training (dict): Batch size, precision, threads and throughput of the last training.
 
     Raises:
-        ValueError: If training data is invalid or epochs parameter is incorrect.
+        ValueError: If training data, epochs or training options are invalid.
     """
 
-    def __init__(self, X_train: np.ndarray, y_train: np.ndarray, X_test: np.ndarray, y_test: np.ndarray, epochs: int = 10, patience: int = 10):
+    def __init__(self, X_train: np.ndarray, y_train: np.ndarray, X_test: np.ndarray, y_test: np.ndarray, epochs: int = 10, patience: int = 10, callbacks: list = None, model: LightningLSTM = None,
+                 batch_size: int = 32, auto_batch_size: bool = False, learning_rate: float = 0.001, hidden_size: int = 64, num_layers: int = 2, num_threads: int = None, precision: str = "32", num_workers: int = None):
         """
         Initialize the TrainService.
 
@@ -36,6 +60,16 @@ class TrainService:
             y_test (np.ndarray): Testing target values.
             epochs (int): Number of training epochs (default: 10).
             patience (int): Number of epochs to wait before early stopping (default: 10).
+            callbacks (list, optional): Extra Lightning callbacks attached to the trainer.
+            model (LightningLSTM, optional): Existing model to fine-tune (default: a new model).
+            batch_size (int): Number of samples per training step (default: 32).
+            auto_batch_size (bool): Whether to pick the batch size with the highest throughput (default: False).
+            learning_rate (float): Learning rate of a new model (default: 0.001).
+            hidden_size (int): Hidden state size of a new model (default: 64).
+            num_layers (int): Number of stacked LSTM layers of a new model (default: 2).
+            num_threads (int, optional): Torch intra-op threads used while training (default: unchanged).
+            precision (str): Training precision, `32` or `bf16` (default: 32).
+            num_workers (int, optional): DataLoader worker processes (default: TRAIN_DATALOADER_WORKERS or 0).
         """
         self.X_train = X_train
         self.y_train = y_train
@@ -44,15 +78,59 @@ class TrainService:
         self.epochs = epochs
         self.patience = patience
         self.features = X_train.shape[2] if len(X_train.shape) > 1 else 1
+        self.outputs = y_train.shape[1] if len(y_train.shape) > 1 else 1
+        self.callbacks = callbacks or []
+        self.model = model
+        self.batch_size = batch_size
+        self.auto_batch_size = auto_batch_size
+        self.learning_rate = learning_rate
+        self.hidden_size = hidden_size
+        self.num_layers = num_layers
+        self.num_threads = num_threads
+        self.precision = precision
+        self.num_workers = num_workers if num_workers is not None else int(os.getenv('TRAIN_DATALOADER_WORKERS', '0'))
+        self.training = None
 
     def execute(self):
         self.__validate_data()
         self.__validate_epochs()
-
-        train_loader, test_loader = self.__create_dataloaders()
-
-        model = LightningLSTM(input_size=self.features, hidden_size=64, output_size=1)
-        self.__train_model(model, train_loader, test_loader)
+        self.__validate_options()
+
+        previous_threads = torch.get_num_threads()
+        if self.num_threads:
+            torch.set_num_threads(self.num_threads)
+
+        try:
+            model = self.model if self.model is not None else LightningLSTM(
+                input_size=self.features,
+                hidden_size=self.hidden_size,
+                output_size=self.outputs,
+                num_layers=self.num_layers,
+                learning_rate=self.learning_rate
+            )
+
+            search = None
+            if self.auto_batch_size:
+                self.batch_size, search = TrainBatchSizeService(
+                    model=model,
+                    X_train=self.X_train,
+                    y_train=self.y_train,
+                    precision=self.precision
+                ).execute()
+
+            train_loader, test_loader = self.__create_dataloaders()
+            throughput = ThroughputCallback()
+            self.__train_model(model, train_loader, test_loader, throughput)
+
+            self.training = {
+                "batch_size": self.batch_size,
+                "batch_size_search": search,
+                "precision": self.precision,
+                "num_threads": torch.get_num_threads(),
+                **throughput.summary()
+            }
+        finally:
+            torch.set_num_threads(previous_threads)
 
         return model
 
@@ -83,15 +161,44 @@ class TrainService:
         
         if not isinstance(self.epochs, int):
             raise ValueError("Number of epochs must be an integer.")
-        
+
+    def __validate_options(self):
+        if self.batch_size <= 0:
+            raise ValueError("Batch size must be greater than 0.")
+
+        if self.learning_rate <= 0:
+            raise ValueError("Learning rate must be greater than 0.")
+
+        if self.hidden_size <= 0:
+            raise ValueError("Hidden size must be greater than 0.")
+
+        if self.num_layers <= 0:
+            raise ValueError("Number of layers must be greater than 0.")
+
+        if self.num_threads is not None and self.num_threads <= 0:
+            raise ValueError("Number of threads must be greater than 0.")
+
+        if self.precision not in PRECISIONS:
+            raise ValueError(f"Precision must be one of: {', '.join(PRECISIONS)}.")
+
+        if self.num_workers < 0:
+            raise ValueError("Number of DataLoader workers must not be negative.")
+
     def __create_dataloaders(self):
         train_dataset = TensorDataset(self.X_train, self.y_train)
         test_dataset = TensorDataset(self.X_test, self.y_test)
-        train_loader = DataLoader(train_dataset, batch_size=32, shuffle=True)
-        test_loader = DataLoader(test_dataset, batch_size=32, shuffle=False)
+        # The datasets are in-memory tensors: workers only pay off for large batches, and
+        # pinned memory only for copies to a GPU
+        options = {
+            "num_workers": self.num_workers,
+            "persistent_workers": self.num_workers > 0,
+            "pin_memory": torch.cuda.is_available()
+        }
+        train_loader = DataLoader(train_dataset, batch_size=self.batch_size, shuffle=True, **options)
+        test_loader = DataLoader(test_dataset, batch_size=self.batch_size, shuffle=False, **options)
         return train_loader, test_loader
 
-    def __train_model(self, model, train_loader, test_loader):
+    def __train_model(self, model, train_loader, test_loader, throughput):
         early_stop_callback = EarlyStopping(
             monitor='val_loss',
             min_delta=0.0,
@@ -102,9 +209,10 @@ class TrainService:
         trainer = L.Trainer(
             max_epochs=self.epochs,
             log_every_n_steps=10,
-            enable_progress_bar=True,
+            enable_progress_bar=False,
             enable_checkpointing=False,
             logger=False,
-            callbacks=[early_stop_callback]
+            precision=PRECISIONS[self.precision],
+            callbacks=[early_stop_callback, throughput, *self.callbacks]
         )
         trainer.fit(model, train_loader, test_loader)
@@ -0,0 +1,331 @@
+import itertools
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from models.lightning_lstm_model import LightningLSTM
+from models.min_max_scaler import MinMaxScaler32
+from schemas.train import TuneModelRequest, TrainModelRequest
+from services.jobs.train_worker import init_tune_worker, run_tune_trial, job_cpu_count
+from services.cache.dataset_cache import dataset_cache
+from services.yfinance_service import YFinanceService
+from services.preprocess_data_service import PreprocessDataService
+from services.train.prepare_data_service import TrainPrepareDataService
+from services.train.evaluate_service import TrainEvaluateService
+from services.train.export_service import TrainExportService
+from services.s3.upload_service import S3UploadService
+
+# Searched parameters, in the order they appear in the trial table
+SEARCH_SPACE = ["sequence_length", "hidden_size", "num_layers", "learning_rate", "patience"]
+
+
+class TrainTunePipelineService:
+    """
+    Service class searching the hyperparameters of a model with successive halving.
+
+    The data is fetched and preprocessed once, and the windows are prepared once per
+    distinct sequence length (or reused from the dataset cache); every worker process
+    receives those datasets when it starts, so trials never fetch or window data themselves. Trials are sampled at random
+    from the search space and run in parallel in a process pool. The last `validation_size`
+    of the training windows is held out as a validation split, after a gap of
+    `sequence_length + horizon` windows so no fitted target falls inside a validation window;
+    trials fit on the rest and are early-stopped, ranked and pruned on it, and the test
+    split is only used to report the metrics of the best model. All trials train for
+    `min_epochs` first; after each rung only the best `1 / reduction_factor` (by
+    validation RMSE) keep training, resuming from their weights, with the epoch budget
+    multiplied by `reduction_factor` up to `max_epochs`. Only the best model is uploaded,
+    with the full trial table in its metadata.
+
+    Attributes:
+        request (TuneModelRequest): The search request.
+        max_workers (int): Number of trial processes.
+        progress: Optional mutable mapping updated as trials complete.
+
+    Raises:
+        ValueError: If the search request is invalid, the training split is too short to hold
+            out a validation split or every trial fails.
+    """
+
+    def __init__(self, request: TuneModelRequest, max_workers: int = None, progress=None):
+        """
+        Initialize the TrainTunePipelineService.
+
+        Args:
+            request (TuneModelRequest): The search request.
+            max_workers (int, optional): Number of trial processes
+                (default: TRAIN_TUNE_MAX_WORKERS or the CPU cores assigned to the job).
+            progress (optional): Mutable mapping updated as trials complete.
+        """
+        self.request = request
+        self.max_workers = max_workers or int(os.getenv('TRAIN_TUNE_MAX_WORKERS') or 0) or job_cpu_count()
+        self.progress = progress if progress is not None else {}
+
+    def execute(self):
+        self.__validate()
+
+        start = time.perf_counter()
+        trials = self.__sample_trials()
+        self.progress.update({"trials": len(trials), "completed": 0, "pruned": 0, "failed": 0, "rung": 0})
+
+        datasets = self.__prepare_datasets(trials)
+        prepared = time.perf_counter()
+
+        workers = max(1, min(self.max_workers, len(trials)))
+        best, state, rungs = self.__search(trials, datasets, workers)
+        searched = time.perf_counter()
+
+        result = self.__upload(trials, best, state, datasets[best["params"]["sequence_length"]])
+        finished = time.perf_counter()
+
+        trial_seconds = sum(trial["seconds"] for trial in trials)
+        search_seconds = searched - prepared
+
+        return {
+            **result,
+            "best": {key: best[key] for key in ("trial", "params", "epochs", "score")},
+            "trials": trials,
+            "summary": {
+                "trials": len(trials),
+                "completed": sum(trial["status"] == "completed" for trial in trials),
+                "pruned": sum(trial["status"] == "pruned" for trial in trials),
+                "failed": sum(trial["status"] == "failed" for trial in trials),
+                "rungs": rungs,
+                "workers": workers,
+                "threads_per_worker": self.__threads_per_worker(workers),
+                "prepare_seconds": prepared - start,
+                "search_seconds": search_seconds,
+                "wall_seconds": finished - start,
+                "trial_seconds": trial_seconds,
+                "parallel_speedup": trial_seconds / search_seconds if search_seconds > 0 else None
+            }
+        }
+
+    def __validate(self):
+        if self.request.trials <= 0:
+            raise ValueError("Number of trials must be greater than 0.")
+
+        if self.request.min_epochs <= 0:
+            raise ValueError("Minimum epochs must be greater than 0.")
+
+        if self.request.max_epochs < self.request.min_epochs:
+            raise ValueError("Maximum epochs must not be lower than minimum epochs.")
+
+        if self.request.max_epochs > 1000:
+            raise ValueError("Maximum epochs must not exceed 1000.")
+
+        if not (0 < self.request.validation_size < 1):
+            raise ValueError("Validation size must be between 0 and 1.")
+
+        if self.request.reduction_factor < 2:
+            raise ValueError("Reduction factor must be at least 2.")
+
+        for name in SEARCH_SPACE:
+            if not getattr(self.request, name):
+                raise ValueError(f"Search space for {name} must not be empty.")
+
+    def __sample_trials(self):
+        space = [sorted(set(getattr(self.request, name))) for name in SEARCH_SPACE]
+        grid = list(itertools.product(*space))
+        picks = random.Random(self.request.seed).sample(grid, min(self.request.trials, len(grid)))
+
+        return [
+            {
+                "trial": index,
+                "params": {**dict(zip(SEARCH_SPACE, values)), "batch_size": self.request.batch_size},
+                "status": "running",
+                "rung": 0,
+                "budget": 0,
+                "epochs": 0,
+                "score": None,
+                "val_metrics": None,
+                "seconds": 0.0,
+                "error": None
+            }
+            for index, values in enumerate(picks)
+        ]
+
+    def __prepare_datasets(self, trials):
+        data = YFinanceService(
+            ticker=self.request.ticker,
+            start_date=self.request.start_date,
+            end_date=self.request.end_date
+        ).execute()
+        data = PreprocessDataService(data=data).execute()
+
+        datasets = {}
+        for sequence_length in sorted({trial["params"]["sequence_length"] for trial in trials}):
+            params = {
+                "train_size": self.request.train_size,
+                "sequence_length": sequence_length,
+                "target_column": self.request.target_column,
+                "horizon": self.request.horizon
+            }
+
+            datasets[sequence_length] = dataset_cache.get_or_prepare(
+                data,
+                {**params, "scaler": MinMaxScaler32.__name__},
+                lambda: TrainPrepareDataService(data=data, scaler=MinMaxScaler32, **params).execute()
+            )
+
+        return datasets
+
+    def __threads_per_worker(self, workers):
+        return max(1, job_cpu_count() // workers)
+
+    def __search(self, trials, datasets, workers):
+        survivors = list(range(len(trials)))
+        states = {}
+        budget = self.request.min_epochs
+        rung = 0
+
+        context = multiprocessing.get_context("spawn")
+
+        search_datasets = {sequence_length: self.__search_split(sequence_length, dataset) for sequence_length, dataset in datasets.items()}
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=init_tune_worker,
+            initargs=(self.__threads_per_worker(workers), search_datasets)
+        ) as executor:
+            while True:
+                self.progress["rung"] = rung
+                self.__run_rung(executor, trials, survivors, states, budget, rung)
+
+                ranked = sorted((index for index in survivors if trials[index]["status"] != "failed"), key=lambda index: trials[index]["score"])
+                if not ranked:
+                    raise ValueError(f"Every trial failed: {trials[survivors[0]]['error']}")
+
+                if budget >= self.request.max_epochs or len(ranked) == 1:
+                    break
+
+                keep = max(1, len(ranked) // self.request.reduction_factor)
+                for index in ranked[keep:]:
+                    trials[index]["status"] = "pruned"
+                    states.pop(index)
+                    self.__advance("pruned")
+
+                survivors = ranked[:keep]
+                budget = min(budget * self.request.reduction_factor, self.request.max_epochs)
+                rung += 1
+
+        for index in ranked:
+            trials[index]["status"] = "completed"
+            self.__advance("completed")
+
+        return trials[ranked[0]], states[ranked[0]], rung + 1
+
+    def __search_split(self, sequence_length, dataset):
+        X_train, y_train, _, _, _ = dataset
+        # A window's targets reach `sequence_length + horizon` rows past its start, so the
+        # fitted windows stop that many windows before the first validation window
+        gap = sequence_length + self.request.horizon
+        fit = int((len(X_train) - gap) * (1 - self.request.validation_size))
+
+        if fit <= 0 or fit + gap >= len(X_train):
+            raise ValueError(f"Not enough training windows to hold out a validation split for sequence length {sequence_length}.")
+
+        return X_train[:fit], y_train[:fit], X_train[fit + gap:], y_train[fit + gap:]
+
+    def __run_rung(self, executor, trials, survivors, states, budget, rung):
+        futures = {
+            executor.submit(run_tune_trial, trials[index]["params"], states.get(index), budget - trials[index]["budget"]): index
+            for index in survivors
+        }
+
+        for future in as_completed(futures):
+            index = futures[future]
+            trial = trials[index]
+            trial["rung"] = rung
+
+            try:
+                result = future.result()
+            except Exception as exc:
+                trial.update({"status": "failed", "error": str(exc)})
+                states.pop(index, None)
+                self.__advance("failed")
+                continue
+
+            # Early stopping can end a rung before its budget, so trained epochs are kept apart
+            trial["budget"] = budget
+            trial["epochs"] += result["epochs"]
+            trial["seconds"] += result["seconds"]
+            trial["val_metrics"] = result["val_metrics"]
+            trial["score"] = result["val_metrics"]["rmse"]
+            states[index] = result["state"]
+
+    def __advance(self, key):
+        self.progress[key] = self.progress.get(key, 0) + 1
+
+    def __upload(self, trials, best, state, dataset):
+        X_train, y_train, X_test, y_test, scaler = dataset
+        params = best["params"]
+
+        model = LightningLSTM(
+            input_size=X_train.shape[2],
+            hidden_size=params["hidden_size"],
+            output_size=y_train.shape[1] if y_train.dim() > 1 else 1,
+            num_layers=params["num_layers"],
+            learning_rate=params["learning_rate"]
+        )
+        model.load_state_dict(state)
+        model.eval()
+
+        train_metrics, test_metrics = TrainEvaluateService(
+            model=model,
+            X_train=X_train,
+            y_train=y_train,
+            X_test=X_test,
+            y_test=y_test
+        ).execute()
+
+        compiled_model = TrainExportService(model=model).execute()
+
+        # The best trial is recorded as a regular training request, so the model can be
+        # served, updated and retrained like any other
+        request = TrainModelRequest(
+            ticker=self.request.ticker,
+            start_date=self.request.start_date,
+            end_date=self.request.end_date,
+            train_size=self.request.train_size,
+            target_column=self.request.target_column,
+            horizon=self.request.horizon,
+            epochs=best["epochs"],
+            **params
+        )
+
+        metadata = {
+            "request": request.model_dump(),
+            "train_metrics": train_metrics,
+            "test_metrics": test_metrics,
+            "version": 1,
+            "tuning": {
+                "search": self.request.model_dump(),
+                "best_trial": best["trial"],
+                "trials": trials
+            }
+        }
+
+        upload_service = S3UploadService(
+            model=model,
+            scaler=scaler,
+            metadata=metadata,
+            compiled_model=compiled_model
+        )
+        id, model_s3_path, scaler_s3_path, metadata_s3_path = upload_service.execute()
+
+        return {
+            "id": id,
+            "metrics": {
+                "train": train_metrics,
+                "test": test_metrics
+            },
+            "paths": {
+                "model_s3_path": model_s3_path,
+                "scaler_s3_path": scaler_s3_path,
+                "metadata_s3_path": metadata_s3_path
+            },
+            "warnings": upload_service.warnings
+        }
@@ -0,0 +1,103 @@
+import math
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import torch
+
+from services.yfinance_service import YFinanceService
+from services.preprocess_data_service import PreprocessDataService
+from services.train.prepare_data_service import TrainPrepareDataService
+
+
+class TrainUpdateDatasetService:
+    """
+    Service class for building the fine-tuning dataset of an existing model.
+
+    Only the bars after the end date recorded in the model metadata are used as new
+    samples, plus just enough earlier bars to fill the first windows. Features are scaled
+    with the model's original, already fitted scaler, and samples are built exactly as in
+    TrainPrepareDataService. Because the new period is usually short, the samples (not the
+    rows) are split chronologically into train and validation sets.
+
+    Attributes:
+        request (dict): The training request recorded in the model metadata.
+        scaler: The fitted scaler of the model.
+        end_date (str): End date (exclusive) of the new data in 'YYYY-MM-DD' format.
+        train_size (float): Proportion of the new samples used for training (0-1).
+
+    Raises:
+        ValueError: If there is not enough new data since the model's end date.
+    """
+
+    def __init__(self, request: dict, scaler, end_date: str, train_size: float = 0.8):
+        """
+        Initialize the TrainUpdateDatasetService.
+
+        Args:
+            request (dict): The training request recorded in the model metadata.
+            scaler: The fitted scaler of the model.
+            end_date (str): End date (exclusive) of the new data in 'YYYY-MM-DD' format.
+            train_size (float): Proportion of the new samples used for training (default: 0.8).
+        """
+        self.request = request
+        self.scaler = scaler
+        self.end_date = end_date
+        self.train_size = train_size
+        self.sequence_length = request['sequence_length']
+
+    def execute(self):
+        self.__validate()
+
+        data = self.__fetch()
+        X, y = self.__create_samples(data)
+
+        split = min(max(int(len(X) * self.train_size), 1), len(X) - 1)
+
+        return X[:split], y[:split], X[split:], y[split:], self.scaler
+
+    def __validate(self):
+        if not (0 < self.train_size < 1):
+            raise ValueError("Train size must be between 0 and 1.")
+
+        if pd.to_datetime(self.end_date) <= pd.to_datetime(self.request['end_date']):
+            raise ValueError("End date must be later than the model's end date.")
+
+    def __fetch(self):
+        # Trading days are roughly 5/7 of calendar days; the margin absorbs holidays
+        cutoff = pd.to_datetime(self.request['end_date'])
+        context_days = math.ceil((self.sequence_length + 1) * 7 / 5) + 14
+
+        data = YFinanceService(
+            ticker=self.request['ticker'],
+            start_date=(cutoff - timedelta(days=context_days)).strftime('%Y-%m-%d'),
+            end_date=self.end_date
+        ).execute()
+
+        data = PreprocessDataService(data=data).execute()
+        data = data.sort_values('Date').reset_index(drop=True)
+
+        dates = data['Date'].dt.tz_localize(None) if data['Date'].dt.tz is not None else data['Date']
+        new_rows = int((dates >= cutoff).sum())
+        if new_rows < 2:
+            raise ValueError(f"Not enough new data since {self.request['end_date']}.")
+
+        # Keep only the earlier bars needed to close the first windows over the new data
+        return data.tail(new_rows + self.sequence_length + 1)
+
+    def __create_samples(self, data):
+        data = data.drop('Date', axis=1)
+        data['target'] = data[self.request['target_column']].shift(-1)
+        data = data.dropna(subset=['target'])
+
+        features = self.scaler.transform(data.drop('target', axis=1))
+        target = data['target'].to_numpy()
+
+        X, y = TrainPrepareDataService.create_sequences(features, target, self.sequence_length, self.request.get('horizon', 1))
+
+        if len(X) < 2:
+            raise ValueError(f"Not enough new data since {self.request['end_date']}.")
+
+        X_tensor = torch.from_numpy(np.ascontiguousarray(X, dtype=np.float32))
+        y_tensor = torch.from_numpy(np.ascontiguousarray(y, dtype=np.float32))
+        return X_tensor, y_tensor
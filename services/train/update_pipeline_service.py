@@ -0,0 +1,135 @@
+from datetime import date
+
+from models.lightning_lstm_model import LightningLSTM
+from schemas.train import UpdateModelRequest
+from services.s3.download_service import S3DownloadService
+from services.train.update_dataset_service import TrainUpdateDatasetService
+from services.train.train_service import TrainService
+from services.train.evaluate_service import TrainEvaluateService
+from services.train.export_service import TrainExportService
+from services.s3.upload_service import S3UploadService
+
+
+class TrainUpdatePipelineService:
+    """
+    Service class fine-tuning an existing model on the data published since its training.
+
+    The parent weights and scaler are loaded through the download path, only the bars after
+    the parent's end date are fetched, and the model is trained for a few more epochs
+    starting from the parent weights. The original scaler is kept so feature scaling stays
+    consistent. The result is uploaded as a new model whose metadata links to its parent
+    and carries an incremented version.
+
+    Attributes:
+        model_id (str): The unique identifier of the model to update.
+        request (UpdateModelRequest): The update request.
+        callbacks (list): Extra Lightning callbacks attached to the trainer.
+    """
+
+    def __init__(self, model_id: str, request: UpdateModelRequest, callbacks: list = None):
+        """
+        Initialize the TrainUpdatePipelineService.
+
+        Args:
+            model_id (str): The unique identifier of the model to update.
+            request (UpdateModelRequest): The update request.
+            callbacks (list, optional): Extra Lightning callbacks attached to the trainer.
+        """
+        self.model_id = model_id
+        self.request = request
+        self.callbacks = callbacks or []
+
+    def execute(self):
+        parent, scaler, parent_metadata = S3DownloadService(id=self.model_id).execute()
+        end_date = self.request.end_date or date.today().isoformat()
+
+        X_train, y_train, X_test, y_test, scaler = TrainUpdateDatasetService(
+            request=parent_metadata['request'],
+            scaler=scaler,
+            end_date=end_date,
+            train_size=self.request.train_size
+        ).execute()
+
+        # Training options of the parent carry over; the model size comes with its weights
+        parent_request = parent_metadata['request']
+        train_service = TrainService(
+            X_train=X_train,
+            y_train=y_train,
+            X_test=X_test,
+            y_test=y_test,
+            epochs=self.request.epochs,
+            patience=self.request.patience,
+            callbacks=self.callbacks,
+            model=self.__trainable(parent, parent_metadata),
+            batch_size=parent_request.get('batch_size', 32),
+            num_threads=parent_request.get('num_threads'),
+            precision=parent_request.get('precision', "32")
+        )
+        model = train_service.execute()
+
+        train_metrics, test_metrics = TrainEvaluateService(
+            model=model,
+            X_train=X_train,
+            y_train=y_train,
+            X_test=X_test,
+            y_test=y_test
+        ).execute()
+
+        compiled_model = TrainExportService(model=model).execute()
+
+        metadata = {
+            # The next update continues from the end of this one
+            "request": {**parent_metadata['request'], "end_date": end_date},
+            "train_metrics": train_metrics,
+            "test_metrics": test_metrics,
+            "parent_id": self.model_id,
+            "version": parent_metadata.get("version", 1) + 1,
+            "training": train_service.training,
+            "update": {
+                "start_date": parent_metadata['request']['end_date'],
+                "end_date": end_date,
+                "epochs": self.request.epochs,
+                "samples": len(X_train) + len(X_test)
+            }
+        }
+
+        upload_service = S3UploadService(
+            model=model,
+            scaler=scaler,
+            metadata=metadata,
+            compiled_model=compiled_model
+        )
+        id, model_s3_path, scaler_s3_path, metadata_s3_path = upload_service.execute()
+
+        return {
+            "id": id,
+            "parent_id": self.model_id,
+            "version": metadata["version"],
+            "metrics": {
+                "train": train_metrics,
+                "test": test_metrics
+            },
+            "paths": {
+                "model_s3_path": model_s3_path,
+                "scaler_s3_path": scaler_s3_path,
+                "metadata_s3_path": metadata_s3_path
+            },
+            "warnings": upload_service.warnings
+        }
+
+    def __trainable(self, parent, metadata):
+        # Serving loads a plain LSTMNetwork and legacy artifacts a pickled LightningLSTM whose
+        # hparams may predate the learning rate, so training always starts from a fresh module
+        # built from the shapes of the parent weights
+        state = parent.state_dict()
+        hparams = metadata.get("model", {}).get("hparams", {})
+
+        model = LightningLSTM(
+            input_size=state["lstm.weight_ih_l0"].shape[1],
+            hidden_size=state["lstm.weight_hh_l0"].shape[1],
+            output_size=state["fc.weight"].shape[0],
+            num_layers=sum(1 for key in state if key.startswith("lstm.weight_ih_l")),
+            learning_rate=self.request.learning_rate or hparams.get("learning_rate") or metadata["request"].get("learning_rate", 0.001)
+        )
+        model.load_state_dict(state)
+        return model
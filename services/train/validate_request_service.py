@@ -0,0 +1,94 @@
+from datetime import timedelta
+
+import pandas as pd
+
+from schemas.train import TrainModelRequest
+from services.yfinance_service import YFinanceService
+
+FEATURE_COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+
+# Calendar days fetched at the end of the range to check that the ticker has data
+PROBE_DAYS = 14
+
+
+class TrainValidateRequestService:
+    """
+    Service class checking a training request before it is queued.
+
+    Only cheap checks run here, so the request returns quickly even with a cold market
+    data cache: the training parameters, the date range, an upper bound of its rows from
+    the business days it spans, and a short probe fetch at the end of the range to
+    reject unknown tickers. The full range is fetched by the job itself, where
+    TrainPrepareDataService checks the actual number of rows.
+
+    Attributes:
+        request (TrainModelRequest): The training request.
+
+    Raises:
+        ValueError: If the request is invalid, its range is too short or the ticker has no data.
+    """
+
+    def __init__(self, request: TrainModelRequest):
+        """
+        Initialize the TrainValidateRequestService.
+
+        Args:
+            request (TrainModelRequest): The training request.
+        """
+        self.request = request
+
+    def execute(self):
+        self.__validate_params()
+        start, end = self.__validate_dates()
+        self.__probe(start, end)
+
+    def __validate_params(self):
+        if not (0 < self.request.train_size < 1):
+            raise ValueError("Train size must be between 0 and 1.")
+
+        if self.request.sequence_length <= 0:
+            raise ValueError("Sequence length must be greater than 0.")
+
+        if self.request.horizon <= 0:
+            raise ValueError("Horizon must be greater than 0.")
+
+        if self.request.epochs <= 0:
+            raise ValueError("Number of epochs must be greater than 0.")
+
+        if self.request.epochs > 1000:
+            raise ValueError("Number of epochs must not exceed 1000.")
+
+        if self.request.target_column not in FEATURE_COLUMNS:
+            raise ValueError(f"Target column {self.request.target_column} not found in the DataFrame.")
+
+    def __validate_dates(self):
+        try:
+            start = pd.to_datetime(self.request.start_date)
+            end = pd.to_datetime(self.request.end_date)
+        except ValueError:
+            raise ValueError("Invalid dates. Use the ISO format (YYYY-MM-DD).")
+
+        if start >= end:
+            raise ValueError("Start date must be earlier than end date.")
+
+        # Daily bars only exist on business days, so this bounds the rows from above
+        rows = len(pd.bdate_range(start, end - timedelta(days=1)))
+        if rows <= 200:
+            raise ValueError("DataFrame must have more than 200 rows.")
+
+        if self.request.sequence_length > rows:
+            raise ValueError("Sequence length cannot be greater than the number of rows in the DataFrame.")
+
+        return start, end
+
+    def __probe(self, start, end):
+        probe_start = max(start, end - timedelta(days=PROBE_DAYS))
+
+        data = YFinanceService(
+            ticker=self.request.ticker,
+            start_date=probe_start.strftime('%Y-%m-%d'),
+            end_date=end.strftime('%Y-%m-%d')
+        ).execute()
+
+        if data.empty:
+            raise ValueError(f"No data found for {self.request.ticker} before {self.request.end_date}.")
@@ -1,6 +1,19 @@
-import yfinance as yf
+import math
+
 import pandas as pd
 
+from services.providers.factory import get_market_data_provider
+
+
+def calendar_days(rows: int):
+    """
+    Return a number of calendar days spanning at least `rows` daily bars.
+
+    Trading days are roughly 5/7 of calendar days; the margin absorbs holidays.
+    """
+    return math.ceil(rows * 7 / 5) + 14
+
+
 class YFinanceService:
     """
     A service class for fetching and processing historical stock data using yfinance.
@@ -12,13 +25,14 @@ class YFinanceService:
         ticker (str): The stock ticker symbol.
         start_date (str): The start date for data retrieval (optional).
         end_date (str): The end date for data retrieval (optional).
-        days (int): Number of days of historical data to retrieve (optional).
+        days (int): Number of calendar days of historical data to retrieve (optional).
+        provider: Market data provider used to fetch the bars.
 
     Raises:
         ValueError: If neither date range nor days are provided, or if dates are invalid.
     """
 
-    def __init__(self, ticker: str, start_date: str = None, end_date: str = None, days: int = None):
+    def __init__(self, ticker: str, start_date: str = None, end_date: str = None, days: int = None, provider=None):
         """
         Initialize the YFinanceService.
 
@@ -26,12 +40,15 @@ class YFinanceService:
             ticker (str): The stock ticker symbol.
             start_date (str, optional): Start date in 'YYYY-MM-DD' format.
             end_date (str, optional): End date in 'YYYY-MM-DD' format.
-            days (int, optional): Number of days of historical data to retrieve.
+            days (int, optional): Number of calendar days of historical data to retrieve.
+            provider (optional): Market data provider (default: the cached provider configured
+                through environment variables).
         """
         self.ticker = ticker
         self.start_date = start_date
         self.end_date = end_date
         self.days = days
+        self.provider = provider or get_market_data_provider()
 
     def execute(self):
         self.__validate_dates()
@@ -54,13 +71,11 @@ class YFinanceService:
                 raise ValueError("Start date must be earlier than end date.")
     
     def __get_stock_data(self):
-        yf_ticker = yf.Ticker(self.ticker)
-
         if self.days:
             period = f"{self.days}d"
-            return yf_ticker.history(period=period)
+            return self.provider.history(self.ticker, period=period)
 
-        return yf_ticker.history(start=self.start_date, end=self.end_date)
+        return self.provider.history(self.ticker, start=self.start_date, end=self.end_date)
 
     def __process_stock_data(self, dataframe: pd.DataFrame):
         dataframe.reset_index(inplace=True)
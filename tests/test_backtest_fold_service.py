@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.min_max_scaler import MinMaxScaler32
+from services.train.backtest_fold_service import create_test_windows
+from services.train.prepare_data_service import TrainPrepareDataService
+
+FEATURES = ["Open", "High", "Low", "Close", "Volume"]
+CLOSE = FEATURES.index("Close")
+
+
+@pytest.fixture
+def data():
+    # Every price equals its row number, so samples reveal which rows they were built from
+    rows = np.arange(300, dtype=np.float64)
+    return pd.DataFrame({"Date": pd.bdate_range("2020-01-01", periods=300), **{column: rows for column in FEATURES}})
+
+
+def identity_scaler():
+    scaler = MinMaxScaler32()
+    scaler.fit_range([0.0] * 5, [1.0] * 5, feature_names=FEATURES)
+    return scaler
+
+
+def build_test_windows(data, horizon, test_start, test_end):
+    return create_test_windows(data=data, scaler=identity_scaler(), target_column="Close", sequence_length=10, horizon=horizon,
+                               test_start=test_start, test_end=test_end)
+
+
+@pytest.mark.parametrize("horizon", [1, 3])
+def test_test_windows_match_training_alignment(data, horizon):
+    X_train, y_train, _, _, _ = TrainPrepareDataService(data=data, sequence_length=10, horizon=horizon).execute()
+    X_test, y_test = build_test_windows(data, horizon, test_start=250, test_end=271)
+
+    # Training samples target the row two past the end of their window
+    train_lead = y_train.reshape(len(y_train), -1)[:, 0] - X_train[:, -1, CLOSE]
+    test_lead = y_test.reshape(len(y_test), -1)[:, 0] - X_test[:, -1, CLOSE]
+    assert set(train_lead.tolist()) == set(test_lead.tolist()) == {2.0}
+
+    # One sample per test row, the first one targeting the first row of the block
+    assert len(X_test) == 21
+    assert y_test.reshape(21, -1)[:, 0].tolist() == list(range(250, 271))
+    if horizon > 1:
+        assert y_test[0].tolist() == [250.0, 251.0, 252.0]
+
+
+def test_test_windows_stop_where_the_horizon_is_unknown(data):
+    X_test, y_test = build_test_windows(data, 3, test_start=280, test_end=300)
+
+    assert len(X_test) == 18
+    assert y_test[-1].tolist() == [297.0, 298.0, 299.0]
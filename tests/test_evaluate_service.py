@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+import torch
+from sklearn.metrics import mean_absolute_error, mean_absolute_percentage_error, r2_score, root_mean_squared_error
+
+from services.train.evaluate_service import TrainEvaluateService
+
+
+class LastStepModel(torch.nn.Module):
+    def __init__(self, features, outputs):
+        super().__init__()
+        self.fc = torch.nn.Linear(features, outputs)
+
+    def forward(self, x):
+        return self.fc(x[:, -1]).squeeze(-1)
+
+
+def sklearn_metrics(y_true, y_pred):
+    return {
+        "mae": mean_absolute_error(y_true, y_pred),
+        "mape": mean_absolute_percentage_error(y_true, y_pred),
+        "rmse": root_mean_squared_error(y_true, y_pred),
+        "r2": r2_score(y_true, y_pred)
+    }
+
+
+@pytest.mark.parametrize("outputs", [1, 3])
+@pytest.mark.parametrize("batch_size", [1, 7, 1024])
+def test_streaming_metrics_match_sklearn(outputs, batch_size):
+    torch.manual_seed(0)
+    model = LastStepModel(features=5, outputs=outputs)
+    X_train, X_test = torch.rand(50, 10, 5), torch.rand(23, 10, 5)
+    y_train, y_test = torch.rand(50, outputs).squeeze(-1), torch.rand(23, outputs).squeeze(-1)
+
+    train_metrics, test_metrics = TrainEvaluateService(
+        model=model,
+        X_train=X_train,
+        y_train=y_train,
+        X_test=X_test,
+        y_test=y_test,
+        batch_size=batch_size
+    ).execute()
+
+    with torch.inference_mode():
+        for metrics, X, y in [(train_metrics, X_train, y_train), (test_metrics, X_test, y_test)]:
+            expected = sklearn_metrics(y.double().numpy(), model(X).double().numpy())
+
+            assert metrics.keys() == expected.keys()
+            for name, value in expected.items():
+                np.testing.assert_allclose(metrics[name], value, rtol=1e-6, err_msg=name)
@@ -0,0 +1,36 @@
+import io
+
+import pytest
+import torch
+
+from models.lightning_lstm_model import LightningLSTM
+from models.lstm_network import LSTMNetwork
+from services.train.export_service import TrainExportService
+
+
+@pytest.mark.parametrize("num_layers, output_size", [(1, 1), (3, 1), (2, 5)])
+def test_torchscript_matches_eager(num_layers, output_size):
+    torch.manual_seed(0)
+    model = LightningLSTM(input_size=5, hidden_size=16, output_size=output_size, num_layers=num_layers)
+    model.eval()
+
+    compiled = TrainExportService(model=model).execute()
+
+    network = LSTMNetwork.from_hparams(model.hparams)
+    network.load_state_dict(model.state_dict())
+    network.eval()
+
+    # Round trip through the serialized artifact, as the model is served
+    buffer = io.BytesIO()
+    torch.jit.save(compiled, buffer)
+    buffer.seek(0)
+    loaded = torch.jit.load(buffer)
+
+    x = torch.randn(8, 20, 5)
+    with torch.inference_mode():
+        expected = model(x)
+        outputs = [compiled(x), loaded(x), network(x)]
+
+    assert expected.shape == ((8,) if output_size == 1 else (8, output_size))
+    for output in outputs:
+        torch.testing.assert_close(output, expected, rtol=1e-5, atol=1e-6)
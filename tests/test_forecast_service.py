@@ -0,0 +1,56 @@
+import numpy as np
+import torch
+
+from models.min_max_scaler import MinMaxScaler32
+from services.predict.forecast_service import ForecastService
+
+
+class LastCloseModel(torch.nn.Module):
+    # Predicts the close two bars past the window as its last close plus one
+    def forward(self, x):
+        return x[:, -1, 3] + 1
+
+
+def identity_scaler(feature_names=None):
+    scaler = MinMaxScaler32()
+    scaler.fit_range([0.0] * 5, [1.0] * 5, feature_names=feature_names)
+    return scaler
+
+
+def windows(closes):
+    x = np.zeros((1, len(closes), 5), dtype=np.float32)
+    x[0, :, :4] = np.asarray(closes, dtype=np.float32)[:, None]
+    x[0, :, 4] = 7
+    return x
+
+
+def test_recursive_rollout_follows_training_lead():
+    # History bar plus a sequence of three bars: t-3, t-2, t-1, t
+    x = windows([10, 20, 30, 40])
+
+    forecast, method = ForecastService(LastCloseModel(), x, identity_scaler(), horizon=4, method="recursive").execute()
+
+    # Bar t+1 comes from the window ending at t-1 (31), then each bar is two bars back plus one
+    assert method == "recursive"
+    assert forecast == [[41.0, 32.0, 42.0, 33.0]]
+
+
+def test_first_recursive_step_matches_direct_and_single_step():
+    x = windows([10, 20, 30, 40])
+    model = LastCloseModel()
+
+    recursive, _ = ForecastService(model, x, identity_scaler(), horizon=3, method="recursive").execute()
+    direct, _ = ForecastService(model, x, identity_scaler(), horizon=1, method="direct").execute()
+
+    with torch.inference_mode():
+        single = model(torch.from_numpy(x[:, 1:])).tolist()
+
+    assert recursive[0][0] == direct[0][0] == single[0]
+
+
+def test_scaler_feature_names_decide_price_columns():
+    x = windows([10, 20, 30, 40])
+    unnamed = ForecastService(LastCloseModel(), x, identity_scaler(), horizon=3, method="recursive").execute()
+    named = ForecastService(LastCloseModel(), x, identity_scaler(["Open", "High", "Low", "Close", "Volume"]), horizon=3, method="recursive").execute()
+
+    assert unnamed == named
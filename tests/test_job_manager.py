@@ -0,0 +1,39 @@
+import os
+import time
+
+from services.jobs.job_manager import JobManager
+
+
+def crash_job(payload, progress):
+    os._exit(1)
+
+
+def echo_job(payload, progress):
+    progress["state"] = "running"
+    return payload
+
+
+def wait_for(manager, job_id, timeout=120):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = manager.get(job_id)
+        if job["state"] not in ("queued", "running"):
+            return job
+        time.sleep(0.1)
+
+    raise TimeoutError(f"Job {job_id} did not finish")
+
+
+def test_pool_is_replaced_after_a_worker_dies():
+    manager = JobManager(max_workers=1, max_queue=2)
+
+    try:
+        crashed = wait_for(manager, manager.submit(crash_job, {}, kind="crash")["id"])
+        assert crashed["state"] == "failed"
+
+        job = wait_for(manager, manager.submit(echo_job, {"value": 1}, kind="echo")["id"])
+        assert job["state"] == "succeeded"
+        assert job["result"] == {"value": 1}
+        assert manager.get(crashed["id"])["state"] == "failed"
+    finally:
+        manager.shutdown()
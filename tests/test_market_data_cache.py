@@ -0,0 +1,82 @@
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from services.cache.market_data_cache import MarketDataCache
+from services.providers.fixture_provider import FixtureProvider
+
+
+class CountingProvider:
+    def __init__(self, provider):
+        self.provider = provider
+        self.calls = []
+
+    def history(self, ticker, start=None, end=None, period=None):
+        self.calls.append((start, end))
+        return self.provider.history(ticker, start=start, end=end, period=period)
+
+
+@pytest.fixture
+def fixtures(tmp_path):
+    dates = pd.bdate_range(end=pd.Timestamp(date.today()), periods=400)
+    pd.DataFrame({
+        "Date": dates.strftime("%Y-%m-%d"),
+        "Open": range(400),
+        "High": range(400),
+        "Low": range(400),
+        "Close": range(400),
+        "Volume": range(400)
+    }).to_csv(tmp_path / "AAA.csv", index=False)
+
+    return FixtureProvider(directory=str(tmp_path))
+
+
+@pytest.fixture
+def provider(fixtures):
+    return CountingProvider(fixtures)
+
+
+@pytest.fixture
+def cache(tmp_path, provider):
+    return MarketDataCache(directory=str(tmp_path / "cache"), provider=provider)
+
+
+def days_ago(days):
+    return (date.today() - timedelta(days=days)).isoformat()
+
+
+def test_range_miss_then_hit(cache, provider):
+    first = cache.history("AAA", start=days_ago(200), end=days_ago(100))
+    second = cache.history("AAA", start=days_ago(180), end=days_ago(120))
+
+    assert provider.calls == [(days_ago(200), days_ago(100))]
+    pd.testing.assert_frame_equal(second, first.loc[second.index])
+
+
+def test_range_extension_downloads_only_missing_parts(cache, provider, fixtures):
+    cache.history("AAA", start=days_ago(200), end=days_ago(100))
+    data = cache.history("AAA", start=days_ago(300), end=days_ago(50))
+
+    assert provider.calls[1:] == [(days_ago(300), days_ago(200)), (days_ago(100), days_ago(50))]
+    pd.testing.assert_frame_equal(data, fixtures.history("AAA", start=days_ago(300), end=days_ago(50)), check_freq=False)
+
+
+def test_period_is_calendar_days_with_and_without_cache(cache, fixtures):
+    cached = cache.history("AAA", period="30d")
+    direct = fixtures.history("AAA", period="30d")
+
+    pd.testing.assert_frame_equal(cached, direct, check_freq=False)
+    assert cached.index[0].date() >= date.today() - timedelta(days=30)
+    assert len(cached) < 30
+
+
+def test_period_reuses_todays_bar_within_refresh_interval(tmp_path, provider):
+    cache = MarketDataCache(directory=str(tmp_path / "cache"), provider=provider)
+    cache.history("AAA", period="30d")
+    cache.history("AAA", period="20d")
+    assert len(provider.calls) == 1
+
+    expired = MarketDataCache(directory=str(tmp_path / "cache"), provider=provider, refresh_interval=1e-9)
+    expired.history("AAA", period="20d")
+    assert provider.calls[1] == (date.today().isoformat(), (date.today() + timedelta(days=1)).isoformat())
@@ -0,0 +1,142 @@
+import threading
+import time
+
+import numpy as np
+
+from services.cache import prediction_cache
+from services.cache.prediction_cache import MemoryPredictionBackend, PredictionCache, RedisPredictionBackend
+
+
+class FakeRedis:
+    # Implements the subset of redis-py used by the backend, with millisecond expirations
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        value, expires_at = self.values.get(key, (None, None))
+        if value is None or expires_at <= time.monotonic():
+            return None
+        return value.encode()
+
+    def set(self, key, value, px):
+        self.values[key] = (value, time.monotonic() + px / 1000)
+
+
+class Feed:
+    def __init__(self):
+        self.bar = "2024-01-02"
+        self.close = 10.0
+        self.fetches = 0
+        self.computes = 0
+
+    def prepare(self):
+        self.fetches += 1
+        # Strided like the windows of the prepare step
+        window = np.full((3, 2), self.close, dtype=np.float32).T
+        return PredictionCache.inputs_version(self.bar, window), {"bar": self.bar}
+
+    def compute(self, inputs):
+        self.computes += 1
+        return {"prediction": [self.computes], "as_of": inputs["bar"]}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+
+def test_memory_hit_refresh_and_miss_on_new_bar(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(prediction_cache, "time", clock)
+    cache = PredictionCache(MemoryPredictionBackend(), refresh_interval=60)
+    feed = Feed()
+
+    first, status = cache.get_or_compute("m", {"windows": 1}, feed.prepare, feed.compute)
+    assert status == "miss"
+
+    second, status = cache.get_or_compute("m", {"windows": 1}, feed.prepare, feed.compute)
+    assert (second, status, feed.fetches) == (first, "hit", 1)
+
+    # Once the interval ends the data is fetched again, but without a new bar the model does not run
+    clock.now += 60
+    third, status = cache.get_or_compute("m", {"windows": 1}, feed.prepare, feed.compute)
+    assert (third, status, feed.fetches, feed.computes) == (first, "refresh", 2, 1)
+
+    clock.now += 60
+    feed.bar = "2024-01-03"
+    fourth, status = cache.get_or_compute("m", {"windows": 1}, feed.prepare, feed.compute)
+    assert status == "miss"
+    assert fourth == {"prediction": [2], "as_of": "2024-01-03"}
+
+    # Other parameters are cached separately
+    _, status = cache.get_or_compute("m", {"windows": 2}, feed.prepare, feed.compute)
+    assert status == "miss"
+    assert cache.stats()["hits"] == 1 and cache.stats()["refreshes"] == 1 and cache.stats()["misses"] == 3
+
+
+def test_miss_when_the_last_bar_changes_without_a_new_date(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(prediction_cache, "time", clock)
+    cache = PredictionCache(MemoryPredictionBackend(), refresh_interval=60)
+    feed = Feed()
+
+    first, _ = cache.get_or_compute("m", {}, feed.prepare, feed.compute)
+
+    # Today's bar keeps its date while its prices move during the session
+    clock.now += 60
+    feed.close = 10.5
+    second, status = cache.get_or_compute("m", {}, feed.prepare, feed.compute)
+    assert status == "miss"
+    assert (first["prediction"], second["prediction"]) == ([1], [2])
+
+    clock.now += 60
+    _, status = cache.get_or_compute("m", {}, feed.prepare, feed.compute)
+    assert (status, feed.computes) == ("refresh", 2)
+
+
+def test_redis_backend_shares_results_between_caches():
+    client = FakeRedis()
+    feed = Feed()
+
+    first, status = PredictionCache(RedisPredictionBackend(client=client)).get_or_compute("m", {}, feed.prepare, feed.compute)
+    assert status == "miss"
+
+    # Another process with its own PredictionCache reuses the stored result
+    second, status = PredictionCache(RedisPredictionBackend(client=client)).get_or_compute("m", {}, feed.prepare, feed.compute)
+    assert (second, status, feed.computes) == (first, "hit", 1)
+
+    backend = RedisPredictionBackend(client=client)
+    backend.set("short", [1], ttl=0.001)
+    time.sleep(0.01)
+    assert backend.get("short") is None
+
+
+def test_concurrent_identical_requests_compute_once():
+    cache = PredictionCache(MemoryPredictionBackend())
+    feed = Feed()
+    started = threading.Barrier(8)
+    results = []
+
+    def slow_compute(inputs):
+        time.sleep(0.1)
+        return feed.compute(inputs)
+
+    def request():
+        started.wait()
+        results.append(cache.get_or_compute("m", {}, feed.prepare, slow_compute))
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert feed.computes == 1 and feed.fetches == 1
+    assert sorted(status for _, status in results) == ["hit"] * 7 + ["miss"]
+    assert all(result == results[0][0] for result, _ in results)
@@ -0,0 +1,115 @@
+import json
+
+import boto3
+import numpy as np
+import pytest
+import torch
+from moto import mock_aws
+
+from models.lightning_lstm_model import LightningLSTM
+from models.min_max_scaler import MinMaxScaler32
+from services.s3 import base_service
+from services.s3.base_service import get_s3_client
+from services.s3.download_service import S3DownloadService
+from services.s3.registry_update_service import S3RegistryUpdateService
+from services.s3.upload_service import S3UploadService
+
+BUCKET = "models-test"
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+    monkeypatch.setenv("S3_BUCKET_NAME", BUCKET)
+    monkeypatch.delenv("S3_ENDPOINT_URL", raising=False)
+    monkeypatch.delenv("MODEL_ARTIFACT_LAYOUT", raising=False)
+
+    with mock_aws():
+        # The shared client must be created inside the mock
+        monkeypatch.setattr(base_service, "_s3_client", None)
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=BUCKET)
+
+        client = get_s3_client()
+        list_calls = []
+        client.meta.events.register("before-call.s3.ListObjectsV2", lambda **kwargs: list_calls.append(kwargs))
+
+        yield client, list_calls
+
+
+def upload_model():
+    torch.manual_seed(0)
+    model = LightningLSTM(input_size=5, hidden_size=8, num_layers=2)
+    model.eval()
+
+    scaler = MinMaxScaler32()
+    scaler.fit_range([0.0] * 5, [10.0] * 5, feature_names=["Open", "High", "Low", "Close", "Volume"])
+
+    id, _, _, _ = S3UploadService(model=model, scaler=scaler, metadata={"request": {"ticker": "AAA"}}, layout="files").execute()
+    return id, model, scaler
+
+
+def test_upload_download_round_trip(s3):
+    client, _ = s3
+    id, model, scaler = upload_model()
+
+    service = S3DownloadService(id=id)
+    loaded, loaded_scaler, metadata = service.execute()
+
+    assert service.s3_client is client
+    assert metadata["request"] == {"ticker": "AAA"}
+    assert loaded_scaler.to_dict() == scaler.to_dict()
+
+    # Callers (e.g. the model cache) switch the network to inference mode after loading
+    loaded.eval()
+    x = torch.randn(4, 10, 5)
+    with torch.inference_mode():
+        torch.testing.assert_close(loaded(x), model(x))
+
+
+def test_download_with_manifest_does_not_list(s3):
+    _, list_calls = s3
+    id, _, _ = upload_model()
+
+    S3DownloadService(id=id).execute()
+
+    assert list_calls == []
+
+
+def test_download_without_manifest_lists_once(s3):
+    client, list_calls = s3
+    id, model, _ = upload_model()
+
+    # Models uploaded before the manifest existed only have their files in the bucket
+    key = f"models/{id}/metadata.json"
+    metadata = json.load(client.get_object(Bucket=BUCKET, Key=key)["Body"])
+    del metadata["artifacts"]
+    client.put_object(Bucket=BUCKET, Key=key, Body=json.dumps(metadata).encode())
+
+    loaded, _, _ = S3DownloadService(id=id).execute()
+
+    assert len(list_calls) == 1
+    for name, value in model.state_dict().items():
+        np.testing.assert_array_equal(loaded.state_dict()[name].numpy(), value.numpy())
+
+
+def test_missing_model_raises_not_found(s3):
+    with pytest.raises(FileNotFoundError):
+        S3DownloadService(id="missing").execute()
+
+
+def test_registry_failure_keeps_the_upload(s3, monkeypatch):
+    def fail(self):
+        raise RuntimeError("Registry index kept changing.")
+
+    monkeypatch.setattr(S3RegistryUpdateService, "execute", fail)
+
+    model = LightningLSTM(input_size=5, hidden_size=8, num_layers=2)
+    scaler = MinMaxScaler32()
+    scaler.fit_range([0.0] * 5, [10.0] * 5)
+    service = S3UploadService(model=model, scaler=scaler, metadata={"request": {"ticker": "AAA"}}, layout="files")
+    id, _, _, _ = service.execute()
+
+    assert service.warnings == [f"Model {id} was not added to the registry index: Registry index kept changing."]
+    assert S3DownloadService(id=id).execute()[2]["request"] == {"ticker": "AAA"}
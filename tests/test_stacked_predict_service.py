@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+import torch
+
+from models.lightning_lstm_model import LightningLSTM
+from services.predict.stacked_predict_service import StackedPredictService
+
+
+@pytest.mark.parametrize("num_layers", [1, 2])
+@pytest.mark.parametrize("windows", [1, 3, 16])
+def test_stacked_forward_matches_eager_models(num_layers, windows):
+    torch.manual_seed(num_layers * 100 + windows)
+    models = [LightningLSTM(input_size=5, hidden_size=12, num_layers=num_layers).eval() for _ in range(3)]
+    inputs = [np.random.default_rng(index).normal(size=(windows, 20, 5)).astype(np.float32) for index in range(3)]
+
+    predictions = StackedPredictService(models=models, X_predict=inputs).execute()
+
+    with torch.inference_mode():
+        expected = [model(torch.from_numpy(X)).reshape(-1).tolist() for model, X in zip(models, inputs)]
+
+    for prediction, reference in zip(predictions, expected):
+        np.testing.assert_allclose(np.reshape(prediction, -1), reference, rtol=1e-5, atol=1e-5)
+
+
+def test_models_with_different_architectures_are_rejected():
+    models = [LightningLSTM(input_size=5, hidden_size=12), LightningLSTM(input_size=5, hidden_size=8)]
+    inputs = [np.zeros((1, 10, 5), dtype=np.float32)] * 2
+
+    with pytest.raises(ValueError):
+        StackedPredictService(models=models, X_predict=inputs).execute()
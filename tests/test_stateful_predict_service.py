@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+import torch
+
+from models.lstm_network import LSTMNetwork
+from models.min_max_scaler import MinMaxScaler32
+from services.cache.lstm_state_store import LSTMStateStore
+from services.predict.stateful_predict_service import StatefulPredictService
+from services.providers import factory
+
+FEATURES = ["Open", "High", "Low", "Close", "Volume"]
+SEQUENCE_LENGTH = 5
+
+
+class FeedProvider:
+    # Publishes the bars of a fixed series up to a cursor moved by the test
+    def __init__(self, bars):
+        self.bars = bars
+        self.published = 0
+
+    def history(self, ticker, start=None, end=None, period=None):
+        return self.bars.iloc[:self.published].set_index('Date')
+
+
+@pytest.fixture
+def feed(monkeypatch):
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, 40))
+    bars = pd.DataFrame({
+        "Date": pd.bdate_range("2024-01-01", periods=40, tz="America/New_York"),
+        "Open": close + 0.5,
+        "High": close + 1,
+        "Low": close - 1,
+        "Close": close,
+        "Volume": rng.integers(100_000, 1_000_000, 40).astype(float)
+    })
+
+    provider = FeedProvider(bars)
+    monkeypatch.setattr(factory, "_provider", provider)
+    return provider
+
+
+@pytest.fixture
+def model():
+    torch.manual_seed(0)
+    return LSTMNetwork(input_size=len(FEATURES), hidden_size=16, num_layers=2).eval()
+
+
+@pytest.fixture
+def scaler(feed):
+    scaler = MinMaxScaler32()
+    scaler.fit(feed.bars[FEATURES])
+    return scaler
+
+
+def predict(model, scaler, bars):
+    x = torch.from_numpy(scaler.transform(bars[FEATURES]).astype(np.float32)).unsqueeze(0)
+    with torch.inference_mode():
+        return model(x).reshape(-1).tolist()
+
+
+def test_stream_matches_full_recomputation_and_resets_after_max_steps(feed, model, scaler, monkeypatch):
+    monkeypatch.setenv("STATEFUL_MAX_STEPS", "3")
+    metadata = {"request": {"ticker": "AAA", "sequence_length": SEQUENCE_LENGTH}}
+    store = LSTMStateStore()
+
+    start = None
+    for published in range(20, 32):
+        feed.published = published
+        result = StatefulPredictService(model_id="m", model=model, scaler=scaler, metadata=metadata, store=store).execute()
+
+        # The state absorbs at most 3 bars after each warm-up on the latest window
+        warm_up = start is None or published - start - SEQUENCE_LENGTH > 3
+        if warm_up:
+            start = published - SEQUENCE_LENGTH
+
+        assert result["warmed_up"] == warm_up
+        assert result["steps_since_warm_up"] == published - start - SEQUENCE_LENGTH
+        assert result["as_of"] == feed.bars["Date"].iloc[published - 1].isoformat()
+        np.testing.assert_allclose(result["prediction"], predict(model, scaler, feed.bars.iloc[start:published]), rtol=1e-5, atol=1e-5)
+
+        window = predict(model, scaler, feed.bars.iloc[published - SEQUENCE_LENGTH:published])
+        if warm_up:
+            np.testing.assert_allclose(result["prediction"], window, rtol=1e-5, atol=1e-5)
+
+
+def test_empty_max_steps_falls_back_to_sequence_length(feed, model, scaler, monkeypatch):
+    monkeypatch.setenv("STATEFUL_MAX_STEPS", "")
+    metadata = {"request": {"ticker": "AAA", "sequence_length": SEQUENCE_LENGTH}}
+
+    service = StatefulPredictService(model_id="m", model=model, scaler=scaler, metadata=metadata, store=LSTMStateStore())
+
+    assert service.max_steps == SEQUENCE_LENGTH
@@ -0,0 +1,64 @@
+import torch
+
+from models.lightning_lstm_model import LightningLSTM
+from models.min_max_scaler import MinMaxScaler32
+from schemas.train import UpdateModelRequest
+from services.train import update_pipeline_service
+from services.train.update_pipeline_service import TrainUpdatePipelineService
+
+
+def legacy_model():
+    torch.manual_seed(0)
+    model = LightningLSTM(input_size=5, hidden_size=8, num_layers=2)
+    # Models pickled before the learning rate became a hyperparameter
+    del model.hparams["learning_rate"]
+    return model
+
+
+def test_update_legacy_pickled_model(monkeypatch, tmp_path):
+    path = tmp_path / "model.pth"
+    torch.save(legacy_model(), path)
+    parent = torch.load(path, weights_only=False)
+
+    scaler = MinMaxScaler32()
+    scaler.fit_range([0.0] * 5, [1.0] * 5)
+    metadata = {"request": {"ticker": "AAA", "end_date": "2024-01-01", "learning_rate": 0.01}}
+    uploads = []
+
+    class FakeDownload:
+        def __init__(self, id):
+            pass
+
+        def execute(self):
+            return parent, scaler, metadata
+
+    class FakeDataset:
+        def __init__(self, request, scaler, end_date, train_size):
+            self.scaler = scaler
+
+        def execute(self):
+            torch.manual_seed(1)
+            X, y = torch.rand(24, 10, 5), torch.rand(24)
+            return X[:16], y[:16], X[16:], y[16:], self.scaler
+
+    class FakeUpload:
+        def __init__(self, model, scaler, metadata, compiled_model):
+            self.warnings = []
+            uploads.append(model)
+
+        def execute(self):
+            return "child", "model", "scaler", "metadata"
+
+    monkeypatch.setattr(update_pipeline_service, "S3DownloadService", FakeDownload)
+    monkeypatch.setattr(update_pipeline_service, "TrainUpdateDatasetService", FakeDataset)
+    monkeypatch.setattr(update_pipeline_service, "S3UploadService", FakeUpload)
+
+    result = TrainUpdatePipelineService(
+        model_id="parent",
+        request=UpdateModelRequest(end_date="2024-02-01", epochs=1, patience=1)
+    ).execute()
+
+    model = uploads[0]
+    assert result["id"] == "child" and result["version"] == 2
+    assert dict(model.hparams) == {"input_size": 5, "hidden_size": 8, "output_size": 1, "num_layers": 2, "learning_rate": 0.01}
+    assert not torch.equal(model.state_dict()["fc.weight"], parent.state_dict()["fc.weight"])